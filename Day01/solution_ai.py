@@ -5,22 +5,40 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from timer_utils import timer, time_both_parts
-from aoc_utils import get_input
+from aoc_utils import get_input, StreamedInput, streaming_enabled
+
+TITLE = "Day 1 - Secret Entrance [AI Version]"
+ANSWER_LABELS = {
+    "Part One": "Part One - Actual Password to open the door:",
+    "Part Two": "Part Two - Using password method 0x434C49434B, Password to open the door:",
+}
+
+
+# Rotations like "L68", one per line; an iterable of lines (e.g. a StreamedInput) is used as is
+def parse(input_data):
+    return input_data.split('\n') if isinstance(input_data, str) else input_data
+
+
+def load_input(day):
+    return StreamedInput(day=day) if streaming_enabled() else get_input(day=day)
 
 
 # Part One: Count exact landings on position 0 using walrus operator
-@timer(name="Part One")
-def Part_One(rotation: list[str]) -> None:
+def part_one(rotation: list[str]) -> int:
     ptr = 50
     # One-liner: update ptr and count zeros in single expression using walrus operator
     ctr = sum(1 for r in rotation if (ptr := (ptr - int(r[1:]) if r[0] == 'L' else ptr + int(r[1:])) % 100) == 0)
 
-    print("Part One - Actual Password to open the door:", ctr)
+    return ctr
+
+
+@timer(name="Part One")
+def Part_One(rotation: list[str]) -> None:
+    print(ANSWER_LABELS["Part One"], part_one(rotation))
 
 
 # Part Two: Count all zero crossings using boolean arithmetic
-@timer(name="Part Two")
-def Part_Two(rotation: list[str]) -> None:
+def part_two(rotation: list[str]) -> int:
     ptr = 50
     ctr = 0
 
@@ -36,16 +54,20 @@ def Part_Two(rotation: list[str]) -> None:
             ctr += (ptr + distance) // 100
             ptr = (ptr + distance) % 100
 
-    print("Part Two - Using password method 0x434C49434B, Password to open the door:", ctr)
+    return ctr
+
+
+@timer(name="Part Two")
+def Part_Two(rotation: list[str]) -> None:
+    print(ANSWER_LABELS["Part Two"], part_two(rotation))
 
 
 if __name__ == "__main__":
-    # Fetch input from AOC website (cached after first run, or use `save_to_file=False` to never save)
-    input_data = get_input(day=1, force_fetch=False)
-    rotation = input_data.split('\n')
+    # Fetch input from AOC website (cached after first run)
+    rotation = parse(load_input(day=1))
 
     print("-"*50)
-    print("*** Day 1 - Secret Entrance [AI Version] ***")
+    print(f"*** {TITLE} ***")
     print("-"*50, "\n")
 
     # Option 1: Time individually
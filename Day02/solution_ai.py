@@ -7,10 +7,20 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from timer_utils import timer, time_both_parts
 from aoc_utils import get_input
 
+TITLE = "Day 2 - Gift Shop [AI Version]"
+ANSWER_LABELS = {
+    "Part One": "Sum of all the invalid IDs:",
+    "Part Two": "Sum of all the invalid IDs (including the additional rule):",
+}
+
+
+# Comma-separated ID ranges like "11-22"
+def parse(input_data):
+    return input_data.split(',')
+
 
 # Part One: Optimized - Direct calculation without string conversion
-@timer(name="Part One")
-def Part_One(ids: list[str]) -> None:
+def part_one(ids: list[str]) -> int:
     invalid_ids_sum = 0
 
     for id in ids:
@@ -46,12 +56,16 @@ def Part_One(ids: list[str]) -> None:
                 sum_bases = count * (min_base + max_base) // 2
                 invalid_ids_sum += sum_bases * multiplier
 
-    print("Sum of all the invalid IDs:", invalid_ids_sum)
+    return invalid_ids_sum
+
+
+@timer(name="Part One")
+def Part_One(ids: list[str]) -> None:
+    print(ANSWER_LABELS["Part One"], part_one(ids))
 
 
 # Part Two: Optimized - Calculate base range mathematically
-@timer(name="Part Two")
-def Part_Two(ids: list[str]) -> None:
+def part_two(ids: list[str]) -> int:
     invalid_ids_sum = 0
 
     for id in ids:
@@ -98,16 +112,20 @@ def Part_Two(ids: list[str]) -> None:
                     elif repeated_num > range_hi:
                         break
 
-    print("Sum of all the invalid IDs (including the additional rule):", invalid_ids_sum)
+    return invalid_ids_sum
+
+
+@timer(name="Part Two")
+def Part_Two(ids: list[str]) -> None:
+    print(ANSWER_LABELS["Part Two"], part_two(ids))
 
 
 if __name__ == "__main__":
     # Fetch input from AOC website (cached after first run, or use `save_to_file=False` to never save)
-    input_data = get_input(day=2, force_fetch=False)
-    ids = input_data.split(',')
+    ids = parse(get_input(day=2, force_fetch=False))
 
     print("-"*50)
-    print("*** Day 2 - Gift Shop [AI Version] ***")
+    print(f"*** {TITLE} ***")
     print("-"*50, "\n")
 
     # Option 1: Time individually
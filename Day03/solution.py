@@ -5,12 +5,26 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from timer_utils import timer, time_both_parts
-from aoc_utils import get_input
+from aoc_utils import get_input, StreamedInput, streaming_enabled
+
+TITLE = "Day 3 - Lobby"
+ANSWER_LABELS = {
+    "Part One": "Part One - Total Output Joltage:",
+    "Part Two": "Part Two - Total Output Joltage (including the additional rule):",
+}
+
+
+# One bank of battery digits per line; an iterable of lines (e.g. a StreamedInput) is used as is
+def parse(input_data):
+    return input_data.splitlines() if isinstance(input_data, str) else input_data
+
+
+def load_input(day):
+    return StreamedInput(day=day) if streaming_enabled() else get_input(day=day)
 
 
 # Part One
-@timer(name="Part One")
-def Part_One(banks: list[str]) -> None:
+def part_one(banks: list[str]) -> int:
     total_output_joltage = 0
 
     for bank in banks:
@@ -34,12 +48,16 @@ def Part_One(banks: list[str]) -> None:
         output_joltage = int(bat1 + bat2)
         total_output_joltage += output_joltage
 
-    print(f"Part One - Total Output Joltage: {total_output_joltage}")
+    return total_output_joltage
+
+
+@timer(name="Part One")
+def Part_One(banks: list[str]) -> None:
+    print(ANSWER_LABELS["Part One"], part_one(banks))
 
 
 # Part Two
-@timer(name="Part Two")
-def Part_Two(banks: list[str]) -> None:
+def part_two(banks: list[str]) -> int:
     total_output_joltage = 0
     no_of_batteries = 12
 
@@ -65,16 +83,20 @@ def Part_Two(banks: list[str]) -> None:
         output_joltage = int(full_string[:no_of_batteries])
         total_output_joltage += output_joltage
 
-    print(f"Part Two - Total Output Joltage (including the additional rule): {total_output_joltage}")
+    return total_output_joltage
+
+
+@timer(name="Part Two")
+def Part_Two(banks: list[str]) -> None:
+    print(ANSWER_LABELS["Part Two"], part_two(banks))
 
 
 if __name__ == "__main__":
-    # Fetch input from AOC website (cached after first run, or use `save_to_file=False` to never save)
-    input_data = get_input(day=3, force_fetch=False)
-    banks = input_data.splitlines()
+    # Fetch input from AOC website (cached after first run)
+    banks = parse(load_input(day=3))
 
     print("-"*50)
-    print("*** Day 3 - Lobby ***")
+    print(f"*** {TITLE} ***")
     print("-"*50, "\n")
 
     # Option 1: Time individually
@@ -5,7 +5,13 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from timer_utils import timer, time_both_parts
-from aoc_utils import get_input
+from aoc_utils import get_input_lines, StreamedInput, streaming_enabled
+
+TITLE = "Day 3 - Lobby [AI Version]"
+ANSWER_LABELS = {
+    "Part One": "Part One - Total Output Joltage:",
+    "Part Two": "Part Two - Total Output Joltage (including the additional rule):",
+}
 
 
 def best_two_digit_subsequence(bank: str) -> int:
@@ -70,31 +76,47 @@ def largest_subsequence(bank: str, K: int) -> int:
     return int("".join(stack[:K]))
 
 
+def parse(input_data):
+    """One bank of battery digits per line; a sequence of lines (e.g. from get_input_lines) is used as is."""
+    return input_data.splitlines() if isinstance(input_data, str) else input_data
+
+
+def load_input(day):
+    return StreamedInput(day=day) if streaming_enabled() else get_input_lines(day=day)
+
+
 # Part One: Find the lexicographically largest 2-digit subsequence preserving order
-@timer(name="Part One")
-def Part_One(banks: list[str]) -> None:
+def part_one(banks: list[str]) -> int:
     total_output_joltage_part1 = 0
     for bank in banks:
         total_output_joltage_part1 += best_two_digit_subsequence(bank)
 
-    print(f"Part One - Total Output Joltage: {total_output_joltage_part1}")
+    return total_output_joltage_part1
+
+
+@timer(name="Part One")
+def Part_One(banks: list[str]) -> None:
+    print(ANSWER_LABELS["Part One"], part_one(banks))
 
 
 # Part Two: Find the lexicographically largest 12-digit subsequence preserving order
-@timer(name="Part Two")
-def Part_Two(banks: list[str]) -> None:
+def part_two(banks: list[str]) -> int:
     no_of_batteries = 12
     total_output_joltage_part2 = sum(largest_subsequence(bank, no_of_batteries) for bank in banks)
-    print(f"Part Two - Total Output Joltage (including the additional rule): {total_output_joltage_part2}")
+    return total_output_joltage_part2
+
+
+@timer(name="Part Two")
+def Part_Two(banks: list[str]) -> None:
+    print(ANSWER_LABELS["Part Two"], part_two(banks))
 
 
 if __name__ == "__main__":
-    # Fetch input from AOC website (cached after first run, or use `save_to_file=False` to never save)
-    input_data = get_input(day=3, force_fetch=False)
-    banks = input_data.splitlines()
+    # Fetch input from AOC website (cached after first run)
+    banks = parse(load_input(day=3))
 
     print("-"*50)
-    print("*** Day 3 - Lobby [AI Version] ***")
+    print(f"*** {TITLE} ***")
     print("-"*50, "\n")
 
     # Option 1: Time individually
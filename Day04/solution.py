@@ -7,6 +7,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from timer_utils import timer, time_both_parts
 from aoc_utils import get_input
 
+TITLE = "Day 4 - Printing Department"
+ANSWER_LABELS = {
+    "Part One": "Part One - Number of rolls of paper that can be accessed by a forklift :",
+    "Part Two": "Part Two - Number of rolls of paper in total that can be removed by the Elves and their forklifts :",
+}
+
 
 # Common function to count accessible rolls
 def count_accessible_rolls(paper_rolls_grid: list[str], remove_rolls: int = 0) -> int:
@@ -101,17 +107,25 @@ def count_accessible_rolls(paper_rolls_grid: list[str], remove_rolls: int = 0) -
     return accessible_rolls
 
 
+# Grid rows of paper rolls ('@') and empty floor ('.')
+def parse(input_data):
+    return input_data.splitlines()
+
+
 # Part One
-@timer(name="Part One")
-def Part_One(paper_rolls_grid) -> None:
+def part_one(paper_rolls_grid) -> int:
     accessible_rolls = count_accessible_rolls(paper_rolls_grid)
 
-    print(f"Part One - Number of rolls of paper that can be accessed by a forklift : {accessible_rolls}")
+    return accessible_rolls
+
+
+@timer(name="Part One")
+def Part_One(paper_rolls_grid) -> None:
+    print(ANSWER_LABELS["Part One"], part_one(paper_rolls_grid))
 
 
 # Part Two
-@timer(name="Part Two")
-def Part_Two(paper_rolls_grid) -> None:
+def part_two(paper_rolls_grid) -> int:
     additional_accessible_rolls, updated_paper_rolls_grid = count_accessible_rolls(paper_rolls_grid, remove_rolls=1)
     accessible_rolls = additional_accessible_rolls
     
@@ -119,16 +133,20 @@ def Part_Two(paper_rolls_grid) -> None:
         additional_accessible_rolls, updated_paper_rolls_grid = count_accessible_rolls(updated_paper_rolls_grid, remove_rolls=1)
         accessible_rolls += additional_accessible_rolls
 
-    print(f"Part Two - Number of rolls of paper in total that can be removed by the Elves and their forklifts : {accessible_rolls}")
+    return accessible_rolls
+
+
+@timer(name="Part Two")
+def Part_Two(paper_rolls_grid) -> None:
+    print(ANSWER_LABELS["Part Two"], part_two(paper_rolls_grid))
 
 
 if __name__ == "__main__":
     # Fetch input from AOC website (cached after first run, or use `save_to_file=False` to never save)
-    input_data = get_input(day=4, force_fetch=False)
-    paper_rolls_grid = input_data.splitlines()      # Process input as needed
+    paper_rolls_grid = parse(get_input(day=4, force_fetch=False))
 
     print("-"*50)
-    print("*** Day 4 - Printing Department ***")
+    print(f"*** {TITLE} ***")
     print("-"*50, "\n")
 
     # Option 1: Time individually
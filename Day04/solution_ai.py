@@ -7,6 +7,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from timer_utils import timer, time_both_parts
 from aoc_utils import get_input
 
+TITLE = "Day 4 - Printing Department"
+ANSWER_LABELS = {
+    "Part One": "Part One - Number of rolls of paper that can be accessed by a forklift :",
+    "Part Two": "Part Two - Number of rolls of paper in total that can be removed by the Elves and their forklifts :",
+}
+
 
 def count_adjacent_rolls(grid: list[list[str]], row: int, col: int) -> int:
     """Count adjacent '@' characters in all 8 directions."""
@@ -43,18 +49,26 @@ def grid_from_strings(strings: list[str]) -> list[list[str]]:
     return [list(s) for s in strings]
 
 
+def parse(input_data):
+    """Grid rows of paper rolls ('@') and empty floor ('.')."""
+    return input_data.splitlines()
+
+
 # Part One
-@timer(name="Part One")
-def Part_One(paper_rolls_grid: list[str]) -> None:
+def part_one(paper_rolls_grid: list[str]) -> int:
     grid = grid_from_strings(paper_rolls_grid)
     accessible_count = len(find_accessible_rolls(grid))
     
-    print(f"Part One - Number of rolls of paper that can be accessed by a forklift : {accessible_count}")
+    return accessible_count
+
+
+@timer(name="Part One")
+def Part_One(paper_rolls_grid: list[str]) -> None:
+    print(ANSWER_LABELS["Part One"], part_one(paper_rolls_grid))
 
 
 # Part Two
-@timer(name="Part Two")
-def Part_Two(paper_rolls_grid: list[str]) -> None:
+def part_two(paper_rolls_grid: list[str]) -> int:
     grid = grid_from_strings(paper_rolls_grid)
     total_removed = 0
     
@@ -70,16 +84,20 @@ def Part_Two(paper_rolls_grid: list[str]) -> None:
         
         total_removed += len(accessible)
     
-    print(f"Part Two - Number of rolls of paper in total that can be removed by the Elves and their forklifts : {total_removed}")
+    return total_removed
+
+
+@timer(name="Part Two")
+def Part_Two(paper_rolls_grid: list[str]) -> None:
+    print(ANSWER_LABELS["Part Two"], part_two(paper_rolls_grid))
 
 
 if __name__ == "__main__":
     # Fetch input from AOC website (cached after first run, or use `save_to_file=False` to never save)
-    input_data = get_input(day=4, force_fetch=False)
-    paper_rolls_grid = input_data.splitlines()      # Process input as needed
+    paper_rolls_grid = parse(get_input(day=4, force_fetch=False))
 
     print("-"*50)
-    print("*** Day 4 - Printing Department ***")
+    print(f"*** {TITLE} ***")
     print("-"*50, "\n")
 
     # Option 1: Time individually
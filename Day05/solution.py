@@ -4,11 +4,18 @@ from pathlib import Path
 # Add parent directory to path to import utility modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from timer_utils import timer, time_both_parts
+from timer_utils import timer, time_both_parts, phase
 from aoc_utils import get_input
 
+TITLE = "Day 5 - Cafeteria"
+ANSWER_LABELS = {
+    "Part One": "Part One - Number of available ingredient IDs that are fresh :",
+    "Part Two": "Part Two - Number of ingredient IDs that are considered to be fresh according to the fresh ingredient ID ranges :",
+}
+
 
 # Preprocess fresh ID ranges into a list of tuples and merge overlapping ranges for efficiency
+@phase()
 def preprocess_ranges(fresh_ids_range):
     ranges = []
     
@@ -28,11 +35,20 @@ def preprocess_ranges(fresh_ids_range):
     return merged_ranges
 
 
+# Both parts work on the merged ranges, so they are merged once and shared
+def prepare(fresh_ids_range, available_ids):
+    return preprocess_ranges(fresh_ids_range), available_ids
+
+
+# Merged fresh ID ranges and the available IDs
+def parse(input_data):
+    fresh_ids_range, available_ids = input_data.split("\n\n")
+    return prepare(fresh_ids_range.splitlines(), list(map(int, available_ids.splitlines())))
+
+
 # Part One
-@timer(name="Part One")
-def Part_One(fresh_ids_range, available_ids) -> None:
+def part_one(merged_ranges, available_ids) -> int:
     fresh_ids_available = 0
-    merged_ranges = preprocess_ranges(fresh_ids_range)
 
     for id in available_ids:
         for start, end in merged_ranges:
@@ -40,37 +56,40 @@ def Part_One(fresh_ids_range, available_ids) -> None:
                 fresh_ids_available += 1
                 break
 
-    print(f"Part One - Number of available ingredient IDs that are fresh : {fresh_ids_available}")
+    return fresh_ids_available
+
+
+@timer(name="Part One")
+def Part_One(merged_ranges, available_ids) -> None:
+    print(ANSWER_LABELS["Part One"], part_one(merged_ranges, available_ids))
 
 
 # Part Two
-@timer(name="Part Two")
-def Part_Two(fresh_ids_range, available_ids=None) -> None:
+def part_two(merged_ranges, available_ids=None) -> int:
     fresh_ids_available = 0
-    merged_ranges = preprocess_ranges(fresh_ids_range)
     
     for start, end in merged_ranges:
         fresh_ids_available += (end - start + 1)
     
-    print(f"Part Two - Number of ingredient IDs that are considered to be fresh according to the fresh ingredient ID ranges : {fresh_ids_available}")
+    return fresh_ids_available
+
+
+@timer(name="Part Two")
+def Part_Two(merged_ranges, available_ids=None) -> None:
+    print(ANSWER_LABELS["Part Two"], part_two(merged_ranges, available_ids))
 
 
 if __name__ == "__main__":
     # Fetch input from AOC website (cached after first run, or use `save_to_file=False` to never save)
     input_data = get_input(day=5, force_fetch=False)
 
-    # Process input as needed
-    fresh_ids_range, available_ids = input_data.split("\n\n")
-    fresh_ids_range = fresh_ids_range.splitlines()
-    available_ids = list(map(int, available_ids.splitlines()))
-
     print("-"*50)
-    print("*** Day 5 - Cafeteria ***")
+    print(f"*** {TITLE} ***")
     print("-"*50, "\n")
 
     # Option 1: Time individually
-    # Part_One(fresh_ids_range, available_ids)
-    # Part_Two(fresh_ids_range)
+    # Part_One(*parse(input_data))
+    # Part_Two(*parse(input_data))
 
-    # Option 2: Time both parts together for cleaner output
-    time_both_parts(Part_One, Part_Two, fresh_ids_range, available_ids)
\ No newline at end of file
+    # Option 2: Time both parts together for cleaner output (parsing and preparing once for both)
+    time_both_parts(Part_One, Part_Two, input_data, prepare=parse)
\ No newline at end of file
@@ -7,10 +7,20 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from timer_utils import timer, time_both_parts
 from aoc_utils import get_input
 
+TITLE = "Day 6 - Trash Compactor"
+ANSWER_LABELS = {
+    "Part One": "Part One - Grand total found by adding together all of the answers to the individual problems :",
+    "Part Two": "Part Two - Grand total found by adding together all of the answers to the individual problems (Numbers are read vertically (top to bottom)):",
+}
+
+
+# Worksheet rows: operand rows followed by the operator row
+def parse(input_data):
+    return input_data.splitlines()
+
 
 # Part One
-@timer(name="Part One")
-def Part_One(worksheet) -> None:
+def part_one(worksheet) -> int:
     grand_total = 0
     problems = [line.split() for line in worksheet]
     problem_size = len(problems) - 1  # Number of rows containing operands
@@ -24,12 +34,16 @@ def Part_One(worksheet) -> None:
         problem_answer = problem_solution(problem_operands, problem_operation)
         grand_total += problem_answer
 
-    print(f"Part One - Grand total found by adding together all of the answers to the individual problems : {grand_total}")
+    return grand_total
+
+
+@timer(name="Part One")
+def Part_One(worksheet) -> None:
+    print(ANSWER_LABELS["Part One"], part_one(worksheet))
 
 
 # Part Two
-@timer(name="Part Two")
-def Part_Two(problems) -> None:
+def part_two(problems) -> int:
     grand_total = 0
     problem_size = len(problems) - 1  # Number of rows containing operands
     problem_operations = problems[-1]  # The operator row
@@ -87,7 +101,12 @@ def Part_Two(problems) -> None:
         
         grand_total += problem_answer
 
-    print(f"Part Two - Grand total found by adding together all of the answers to the individual problems (Numbers are read vertically (top to bottom)): {grand_total}")
+    return grand_total
+
+
+@timer(name="Part Two")
+def Part_Two(problems) -> None:
+    print(ANSWER_LABELS["Part Two"], part_two(problems))
 
 
 def problem_solution(operands, operation):
@@ -102,13 +121,10 @@ def problem_solution(operands, operation):
 
 if __name__ == "__main__":
     # Fetch input from AOC website (cached after first run, or use `save_to_file=False` to never save)
-    input_data = get_input(day=6, force_fetch=False)
+    worksheet = parse(get_input(day=6, force_fetch=False))
 
-    # Process input as needed
-    worksheet = input_data.splitlines()
-    
     print("-"*50)
-    print("*** Day 6 - Trash Compactor ***")
+    print(f"*** {TITLE} ***")
     print("-"*50, "\n")
 
     # Option 1: Time individually
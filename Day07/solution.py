@@ -7,10 +7,20 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from timer_utils import timer, time_both_parts
 from aoc_utils import get_input
 
+TITLE = "Day 7 - Laboratories"
+ANSWER_LABELS = {
+    "Part One": "Part One - No of times will the beam be split :",
+    "Part Two": "Part Two - Total number of different timelines would a single tachyon particle end up on :",
+}
+
+
+# Rows of the tachyon manifold
+def parse(input_data):
+    return input_data.splitlines()
+
 
 # Part One
-@timer(name="Part One")
-def Part_One(tachyon_manifold) -> None:
+def part_one(tachyon_manifold) -> int:
     split_times = 0
     pos_beam = [tachyon_manifold[0].index("S")]  # current beam columns
     manifold_with_beams = [tachyon_manifold[0]]  # rows with drawn beams
@@ -58,12 +68,16 @@ def Part_One(tachyon_manifold) -> None:
     #     for line in manifold_with_beams:
     #         f.write(line + "\n")
 
-    print(f"Part One - No of times will the beam be split : {split_times}")
+    return split_times
+
+
+@timer(name="Part One")
+def Part_One(tachyon_manifold) -> None:
+    print(ANSWER_LABELS["Part One"], part_one(tachyon_manifold))
 
 
 # Part Two
-@timer(name="Part Two")
-def Part_Two(tachyon_manifold) -> None:
+def part_two(tachyon_manifold) -> int:
     width = len(tachyon_manifold[0])
     current = {tachyon_manifold[0].index("S"): 1}  # col -> timeline count at this row
     completed_timelines = 0
@@ -89,18 +103,20 @@ def Part_Two(tachyon_manifold) -> None:
     # Any remaining beams exit the bottom
     completed_timelines += sum(current.values())
 
-    print(f"Part Two - Total number of different timelines would a single tachyon particle end up on : {completed_timelines}")
+    return completed_timelines
+
+
+@timer(name="Part Two")
+def Part_Two(tachyon_manifold) -> None:
+    print(ANSWER_LABELS["Part Two"], part_two(tachyon_manifold))
 
 
 if __name__ == "__main__":
     # Fetch input from AOC website (cached after first run, or use `save_to_file=False` to never save)
-    input_data = get_input(day=7, force_fetch=False)
-
-    # Process input as needed
-    tachyon_manifold = input_data.splitlines()
+    tachyon_manifold = parse(get_input(day=7, force_fetch=False))
 
     print("-"*50)
-    print("*** Day 7 - Laboratories ***")
+    print(f"*** {TITLE} ***")
     print("-"*50, "\n")
 
     # Option 1: Time individually
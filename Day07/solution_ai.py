@@ -5,17 +5,32 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from timer_utils import timer, time_both_parts
-from aoc_utils import get_input
+from aoc_utils import get_input, StreamedInput, streaming_enabled
+
+TITLE = "Day 7 - Laboratories"
+ANSWER_LABELS = {
+    "Part One": "Part One - No of times will the beam be split :",
+    "Part Two": "Part Two - Total number of different timelines would a single tachyon particle end up on :",
+}
+
+
+# Rows of the tachyon manifold; an iterable of rows (e.g. a StreamedInput) is used as is
+def parse(input_data):
+    return input_data.splitlines() if isinstance(input_data, str) else input_data
+
+
+def load_input(day):
+    return StreamedInput(day=day) if streaming_enabled() else get_input(day=day)
 
 
 # Part One
-@timer(name="Part One")
-def Part_One(tachyon_manifold) -> None:
+def part_one(tachyon_manifold) -> int:
     """Count beam splits by tracking beam positions row by row."""
     split_times = 0
-    pos_beam = {tachyon_manifold[0].index("S")}  # Use set for O(1) lookup
+    rows = iter(tachyon_manifold)  # Only one pass over the rows, so a streamed input works too
+    pos_beam = {next(rows).index("S")}  # Use set for O(1) lookup
     
-    for row in tachyon_manifold[1:]:
+    for row in rows:
         new_beam = set()
         
         for col in pos_beam:
@@ -31,18 +46,24 @@ def Part_One(tachyon_manifold) -> None:
         # Filter out off-grid positions
         pos_beam = {col for col in new_beam if 0 <= col < len(row)}
     
-    print(f"Part One - No of times will the beam be split : {split_times}")
+    return split_times
+
+
+@timer(name="Part One")
+def Part_One(tachyon_manifold) -> None:
+    print(ANSWER_LABELS["Part One"], part_one(tachyon_manifold))
 
 
 # Part Two
-@timer(name="Part Two")
-def Part_Two(tachyon_manifold) -> None:
+def part_two(tachyon_manifold) -> int:
     """Count distinct timelines using many-worlds interpretation."""
-    width = len(tachyon_manifold[0])
+    rows = iter(tachyon_manifold)  # Only one pass over the rows, so a streamed input works too
+    first_row = next(rows)
+    width = len(first_row)
     # Map: column -> count of timelines at that column
-    current = {tachyon_manifold[0].index("S"): 1}
+    current = {first_row.index("S"): 1}
     
-    for row in tachyon_manifold[1:]:
+    for row in rows:
         next_beams = {}
         
         for col, count in current.items():
@@ -62,18 +83,20 @@ def Part_Two(tachyon_manifold) -> None:
     
     # Sum all remaining timelines
     completed_timelines = sum(current.values())
-    print(f"Part Two - Total number of different timelines would a single tachyon particle end up on : {completed_timelines}")
+    return completed_timelines
 
 
-if __name__ == "__main__":
-    # Fetch input from AOC website (cached after first run, or use `save_to_file=False` to never save)
-    input_data = get_input(day=7, force_fetch=False)
+@timer(name="Part Two")
+def Part_Two(tachyon_manifold) -> None:
+    print(ANSWER_LABELS["Part Two"], part_two(tachyon_manifold))
 
-    # Process input as needed
-    tachyon_manifold = input_data.splitlines()
+
+if __name__ == "__main__":
+    # Fetch input from AOC website (cached after first run)
+    tachyon_manifold = parse(load_input(day=7))
 
     print("-"*50)
-    print("*** Day 7 - Laboratories ***")
+    print(f"*** {TITLE} ***")
     print("-"*50, "\n")
 
     # Option 1: Time individually
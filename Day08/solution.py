@@ -6,14 +6,27 @@ from collections import Counter
 # Add parent directory to path to import utility modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from timer_utils import timer, time_both_parts
-from aoc_utils import get_input
+from timer_utils import timer, time_both_parts, phase
+from aoc_utils import get_input, cached_parser
+
+TITLE = "Day 8 - Playground"
+ANSWER_LABELS = {
+    "Part One": "Part One - Multiply together the sizes of the three largest circuits:",
+    "Part Two": "Part Two - Multiply together the X coordinates of the last two junction boxes you need to connect:",
+}
 
 
 def euclidean_distance_squared(point1, point2) -> float:
     return ((point1[0] - point2[0]) ** 2 + (point1[1] - point2[1]) ** 2 + (point1[2] - point2[2]) ** 2) ** 0.5
 
 
+@cached_parser
+def parse_points(input_data):
+    """Parse "X,Y,Z" lines into coordinate tuples."""
+    return [tuple(map(int, line.split(","))) for line in input_data.splitlines()]
+
+
+@phase()
 def calculate_all_pairwise_distances(points) -> list[(float, int, int)]:
     n = len(points)
     distances = []
@@ -49,11 +62,19 @@ def get_circuit_sizes(parent, n) -> list[int]:
     return list(Counter(roots).values())
 
 
+# Both parts connect the closest pairs first, so the sorted distances are computed once and shared
+def prepare(points):
+    return points, calculate_all_pairwise_distances(points)
+
+
+# Junction boxes and their sorted pairwise distances
+def parse(input_data):
+    return prepare(parse_points(input_data))
+
+
 # Part One
-@timer(name="Part One")
-def Part_One(points) -> None:
+def part_one(points, distances) -> int:
     n = len(points)
-    distances = calculate_all_pairwise_distances(points)
     
     # Initialize Union-Find
     parent = list(range(n))
@@ -75,14 +96,17 @@ def Part_One(points) -> None:
     # print(f"Number of circuits: {len(sizes)}")
     # print(f"Top circuit sizes: {sizes[:3]}")
 
-    print(f"Part One - Multiply together the sizes of the three largest circuits: {result}")
+    return result
+
+
+@timer(name="Part One")
+def Part_One(points, distances) -> None:
+    print(ANSWER_LABELS["Part One"], part_one(points, distances))
 
 
 # Part Two
-@timer(name="Part Two")
-def Part_Two(points) -> None:
+def part_two(points, distances) -> int:
     n = len(points)
-    distances = calculate_all_pairwise_distances(points)
     
     # Initialize Union-Find
     parent = list(range(n))
@@ -105,24 +129,25 @@ def Part_Two(points) -> None:
     x2 = points[last_j][0]
     result = x1 * x2
 
-    print(f"Part Two - Multiply together the X coordinates of the last two junction boxes you need to connect: {result}")
+    return result
+
+
+@timer(name="Part Two")
+def Part_Two(points, distances) -> None:
+    print(ANSWER_LABELS["Part Two"], part_two(points, distances))
 
 
 if __name__ == "__main__":
     # Fetch input from AOC website (cached after first run, or use `save_to_file=False` to never save)
     input_data = get_input(day=8, force_fetch=False)
 
-    # Process input as needed
-    junc_box_pos = input_data.splitlines()
-    points = [tuple(map(int, line.split(","))) for line in junc_box_pos]
-
     print("-"*50)
-    print("*** Day 8 - Playground ***")
+    print(f"*** {TITLE} ***")
     print("-"*50, "\n")
 
     # Option 1: Time individually
-    # Part_One(points)
-    # Part_Two(points)
+    # Part_One(*parse(input_data))
+    # Part_Two(*parse(input_data))
 
-    # Option 2: Time both parts together for cleaner output
-    time_both_parts(Part_One, Part_Two, points)
\ No newline at end of file
+    # Option 2: Time both parts together for cleaner output (parsing and preparing once for both)
+    time_both_parts(Part_One, Part_Two, input_data, prepare=parse)
\ No newline at end of file
@@ -5,8 +5,14 @@ from itertools import combinations
 # Add parent directory to path to import utility modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from timer_utils import timer, time_both_parts
-from aoc_utils import get_input
+from timer_utils import timer, time_both_parts, phase
+from aoc_utils import get_input, cached_parser
+
+TITLE = "Day 8 - Playground"
+ANSWER_LABELS = {
+    "Part One": "Part One - Multiply together the sizes of the three largest circuits:",
+    "Part Two": "Part Two - Multiply together the X coordinates of the last two junction boxes you need to connect:",
+}
 
 
 def euclidean_distance_sq(a, b) -> int:
@@ -14,6 +20,13 @@ def euclidean_distance_sq(a, b) -> int:
     return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
 
 
+@cached_parser
+def parse_points(input_data):
+    """Parse "X,Y,Z" lines into coordinate tuples."""
+    return [tuple(map(int, line.split(","))) for line in input_data.splitlines()]
+
+
+@phase()
 def calculate_all_pairwise_distances(points):
     """Compute sorted list of (dist_sq, i, j) for all unique point pairs."""
     n = len(points)
@@ -61,12 +74,20 @@ class UnionFind:
         return Counter(roots).values()
 
 
+def prepare(points):
+    """Compute the sorted pair distances once; both parts walk them shortest-first."""
+    return points, calculate_all_pairwise_distances(points)
+
+
+def parse(input_data):
+    """Junction boxes and their sorted pairwise distances."""
+    return prepare(parse_points(input_data))
+
+
 # Part One
-@timer(name="Part One")
-def Part_One(points) -> None:
+def part_one(points, dists) -> int:
     """Connect the 1000 closest pairs and return product of 3 largest circuits."""
     n = len(points)
-    dists = calculate_all_pairwise_distances(points)
 
     uf = UnionFind(n)
     limit = min(1000, len(dists))
@@ -77,15 +98,18 @@ def Part_One(points) -> None:
     sizes = sorted(uf.circuit_sizes(), reverse=True)
     result = sizes[0] * sizes[1] * sizes[2]
     
-    print(f"Part One - Multiply together the sizes of the three largest circuits: {result}")
+    return result
+
+
+@timer(name="Part One")
+def Part_One(points, dists) -> None:
+    print(ANSWER_LABELS["Part One"], part_one(points, dists))
 
 
 # Part Two
-@timer(name="Part Two")
-def Part_Two(points) -> None:
+def part_two(points, dists) -> int:
     """Connect pairs shortest-first until all in one circuit; multiply last X coords."""
     n = len(points)
-    dists = calculate_all_pairwise_distances(points)
 
     uf = UnionFind(n)
     circuits = n
@@ -102,24 +126,25 @@ def Part_Two(points) -> None:
     x2 = points[last_j][0]
     result = x1 * x2
 
-    print(f"Part Two - Multiply together the X coordinates of the last two junction boxes you need to connect: {result}")
+    return result
+
+
+@timer(name="Part Two")
+def Part_Two(points, dists) -> None:
+    print(ANSWER_LABELS["Part Two"], part_two(points, dists))
 
 
 if __name__ == "__main__":
     # Fetch input from AOC website (cached after first run, or use `save_to_file=False` to never save)
     input_data = get_input(day=8, force_fetch=False)
 
-    # Process input as needed
-    junc_box_pos = input_data.splitlines()
-    points = [tuple(map(int, line.split(","))) for line in junc_box_pos]
-
     print("-"*50)
-    print("*** Day 8 - Playground ***")
+    print(f"*** {TITLE} ***")
     print("-"*50, "\n")
 
     # Option 1: Time individually
-    # Part_One(points)
-    # Part_Two(points)
+    # Part_One(*parse(input_data))
+    # Part_Two(*parse(input_data))
 
-    # Option 2: Time both parts together for cleaner output
-    time_both_parts(Part_One, Part_Two, points)
\ No newline at end of file
+    # Option 2: Time both parts together for cleaner output (parsing and preparing once for both)
+    time_both_parts(Part_One, Part_Two, input_data, prepare=parse)
\ No newline at end of file
@@ -8,10 +8,20 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from timer_utils import timer, time_both_parts
 from aoc_utils import get_input
 
+TITLE = "Day 9 - Movie Theater"
+ANSWER_LABELS = {
+    "Part One": "Part One - Largest area of any rectangle you can make :",
+    "Part Two": "Part Two - Largest area of any rectangle you can make using only red and green tiles :",
+}
+
+
+# Red tile locations as (x, y)
+def parse(input_data):
+    return [(int(loc.split(",")[0]), int(loc.split(",")[1])) for loc in input_data.splitlines()]
+
 
 # Part One
-@timer(name="Part One")
-def Part_One(red_tiles) -> None:
+def part_one(red_tiles) -> int:
     largest_area = 0
 
     # For each pair of red tiles, calculate the area of the rectangle they form.
@@ -24,12 +34,16 @@ def Part_One(red_tiles) -> None:
         if area > largest_area:
             largest_area = area
 
-    print(f"Part One - Largest area of any rectangle you can make : {largest_area}")
+    return largest_area
+
+
+@timer(name="Part One")
+def Part_One(red_tiles) -> None:
+    print(ANSWER_LABELS["Part One"], part_one(red_tiles))
 
 
 # Part Two
-@timer(name="Part Two")
-def Part_Two(red_tiles) -> None:
+def part_two(red_tiles) -> int:
     n = len(red_tiles)
     
     # Build edge segments
@@ -142,19 +156,20 @@ def Part_Two(red_tiles) -> None:
         
         largest_area = area
     
-    print(f"Part Two - Largest area of any rectangle you can make using only red and green tiles : {largest_area}")
+    return largest_area
+
+
+@timer(name="Part Two")
+def Part_Two(red_tiles) -> None:
+    print(ANSWER_LABELS["Part Two"], part_two(red_tiles))
 
 
 if __name__ == "__main__":
     # Fetch input from AOC website (cached after first run, or use `save_to_file=False` to never save)
-    input_data = get_input(day=9, force_fetch=False)
-
-    # Process input as needed
-    red_tiles_location = input_data.splitlines()
-    red_tiles = [(int(loc.split(",")[0]), int(loc.split(",")[1])) for loc in red_tiles_location]
+    red_tiles = parse(get_input(day=9, force_fetch=False))
 
     print("-"*50)
-    print("*** Day 9 - Movie Theater ***")
+    print(f"*** {TITLE} ***")
     print("-"*50, "\n")
 
     # Option 1: Time individually
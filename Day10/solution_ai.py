@@ -6,10 +6,18 @@ from fractions import Fraction
 # Add parent directory to path to import utility modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from timer_utils import timer, time_both_parts
-from aoc_utils import get_input
+from timer_utils import timer, time_both_parts, phase
+from aoc_utils import get_input, cached_parser
 
+TITLE = "Day 10 - Factory"
+ANSWER_LABELS = {
+    "Part One": "Part One - Fewest button presses required to correctly configure the indicator lights on all of the machines :",
+    "Part Two": "Part Two - Fewest button presses required to correctly configure the joltage level counters on all of the machines:",
+}
 
+
+@phase()
+@cached_parser
 def parse_machine(lines):
     # Parse a machine line into target state, button configs, and joltage requirements
     for line in lines:
@@ -21,12 +29,16 @@ def parse_machine(lines):
         yield target_state, button_configs, joltages
 
 
+# Machines as (target lights, buttons, joltages)
+def parse(input_data):
+    return parse_machine(input_data.splitlines())
+
+
 # Part One
-@timer(name="Part One")
-def Part_One(machines) -> None:
+def part_one(machines) -> int:
     total_presses = 0
     
-    for target, buttons, _ in parse_machine(machines):
+    for target, buttons, _ in machines:
         n_lights = len(target)
         n_buttons = len(buttons)
         
@@ -105,15 +117,19 @@ def Part_One(machines) -> None:
         
         total_presses += min_presses
 
-    print(f"Part One - Fewest button presses required to correctly configure the indicator lights on all of the machines : {total_presses}")
+    return total_presses
+
+
+@timer(name="Part One")
+def Part_One(machines) -> None:
+    print(ANSWER_LABELS["Part One"], part_one(machines))
 
 
 # Part Two
-@timer(name="Part Two")
-def Part_Two(machines) -> None:
+def part_two(machines) -> int:
     total_presses = 0
     
-    for _, buttons, joltages in parse_machine(machines):
+    for _, buttons, joltages in machines:
         n_counters = len(joltages)
         n_buttons = len(buttons)
         
@@ -291,23 +307,25 @@ def Part_Two(machines) -> None:
         
         total_presses += min_presses
 
-    print(f"Part Two - Fewest button presses required to correctly configure the joltage level counters on all of the machines: {total_presses}")
+    return total_presses
+
+
+@timer(name="Part Two")
+def Part_Two(machines) -> None:
+    print(ANSWER_LABELS["Part Two"], part_two(machines))
 
 
 if __name__ == "__main__":
     # Fetch input from AOC website (cached after first run, or use `save_to_file=False` to never save)
     input_data = get_input(day=10, force_fetch=False)
 
-    # Process input as needed
-    machines = input_data.splitlines()
-
     print("-"*50)
-    print("*** Day 10 - Factory ***")
+    print(f"*** {TITLE} ***")
     print("-"*50, "\n")
 
     # Option 1: Time individually
-    # Part_One(machines)
-    # Part_Two(machines)
+    # Part_One(parse(input_data))
+    # Part_Two(parse(input_data))
 
-    # Option 2: Time both parts together for cleaner output
-    time_both_parts(Part_One, Part_Two, machines)
\ No newline at end of file
+    # Option 2: Time both parts together for cleaner output (parsing once for both)
+    time_both_parts(Part_One, Part_Two, input_data, prepare=parse)
\ No newline at end of file
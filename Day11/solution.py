@@ -7,10 +7,20 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from timer_utils import timer, time_both_parts
 from aoc_utils import get_input
 
+TITLE = "Day 11 - Reactor"
+ANSWER_LABELS = {
+    "Part One": "Part One - Number of different paths leading from 'you' to 'out' :",
+    "Part Two": "Part Two - Number of different paths that lead from 'svr' to 'out', that visit both 'dac' and 'fft' :",
+}
+
+
+# Device -> list of devices its outputs lead to
+def parse(input_data):
+    return {line.split(":")[0]: line.split(":")[1].strip().split(" ") for line in input_data.splitlines()}
+
 
 # Part One
-@timer(name="Part One")
-def Part_One(device_paths) -> None:
+def part_one(device_paths) -> int:
     source = 'you'
     target = 'out'
     all_paths = []        # Collect all valid paths for counting
@@ -30,12 +40,16 @@ def Part_One(device_paths) -> None:
     visited.add(source)
     DFS(source, [source])
 
-    print(f"Part One - Number of different paths leading from 'you' to 'out' : {len(all_paths)}")
+    return len(all_paths)
+
+
+@timer(name="Part One")
+def Part_One(device_paths) -> None:
+    print(ANSWER_LABELS["Part One"], part_one(device_paths))
 
 
 # Part Two
-@timer(name="Part Two")
-def Part_Two(device_paths) -> None:
+def part_two(device_paths) -> int:
     source = 'svr'
     target = 'out'
     required_devices = {'dac', 'fft'}
@@ -60,19 +74,20 @@ def Part_Two(device_paths) -> None:
 
     count_paths_with_required_devices = dfs(source, frozenset())
 
-    print(f"Part Two - Number of different paths that lead from 'svr' to 'out', that visit both 'dac' and 'fft' : {count_paths_with_required_devices}")
+    return count_paths_with_required_devices
+
+
+@timer(name="Part Two")
+def Part_Two(device_paths) -> None:
+    print(ANSWER_LABELS["Part Two"], part_two(device_paths))
 
 
 if __name__ == "__main__":
     # Fetch input from AOC website (cached after first run, or use `save_to_file=False` to never save)
-    input_data = get_input(day=11, force_fetch=False)
-
-    # Process input as needed
-    device_to_outputs = input_data.splitlines()
-    device_paths = {line.split(":")[0]: line.split(":")[1].strip().split(" ") for line in device_to_outputs}
+    device_paths = parse(get_input(day=11, force_fetch=False))
 
     print("-"*50)
-    print("*** Day 11 - Reactor ***")
+    print(f"*** {TITLE} ***")
     print("-"*50, "\n")
 
     # Option 1: Time individually
@@ -4,10 +4,19 @@ from pathlib import Path
 # Add parent directory to path to import utility modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from timer_utils import timer, time_both_parts
-from aoc_utils import get_input
+from timer_utils import timer, time_both_parts, phase
+from aoc_utils import get_input, cached_parser
+from event_utils import progress
 
+TITLE = "Day 12 - Christmas Tree Farm"
+ANSWER_LABELS = {
+    "Part One": "Part One - Regions that can fit all presents:",
+    "Part Two": "Part Two : There is no part two for this day!",
+}
 
+
+@phase()
+@cached_parser
 def parse_input(input_data):
     """Parse shapes and regions from input data."""
     sections = input_data.strip().split('\n\n')
@@ -277,46 +286,57 @@ def can_fit_region(width, height, quantities, shapes, shape_orientations):
     return True
 
 
-@timer(name="Part One")
-def Part_One(input_data) -> None:
-    shapes, regions = parse_input(input_data)
-    
-    # Precompute all orientations for each shape
+def prepare(shapes, regions):
+    """Precompute all orientations of each shape once, before any region is packed."""
     shape_orientations = {}
     for idx in shapes:
         shape_orientations[idx] = get_all_orientations(shapes[idx])
-    
+    return shapes, regions, shape_orientations
+
+
+def parse(input_data):
+    """Shapes, regions and every orientation of each shape."""
+    return prepare(*parse_input(input_data))
+
+
+def part_one(shapes, regions, shape_orientations) -> int:
     count = 0
     for i, (width, height, quantities) in enumerate(regions):
         if can_fit_region(width, height, quantities, shapes, shape_orientations):
             count += 1
         
         if (i + 1) % 25 == 0:
-            print(f"  Processed {i + 1}/{len(regions)} regions...")
+            progress(i + 1, len(regions), "regions")
     
-    print(f"Part One - Regions that can fit all presents: {count}")
+    return count
+
+
+@timer(name="Part One")
+def Part_One(shapes, regions, shape_orientations) -> None:
+    print(ANSWER_LABELS["Part One"], part_one(shapes, regions, shape_orientations))
 
 
 # Part Two
+def part_two(shapes, regions, shape_orientations) -> None:
+    return None  # There is no part two for the last day
+
+
 @timer(name="Part Two")
-def Part_Two(input_data) -> None:
-    print("Part Two : There is no part two for this day!")
+def Part_Two(shapes, regions, shape_orientations) -> None:
+    print(ANSWER_LABELS["Part Two"])
 
 
 if __name__ == "__main__":
     # Fetch input from AOC website (cached after first run, or use `save_to_file=False` to never save)
     input_data = get_input(day=12, force_fetch=False)
 
-    # Process input as needed
-    situation = input_data.splitlines()
-
     print("-"*50)
-    print("*** Day 12 - Christmas Tree Farm ***")
+    print(f"*** {TITLE} ***")
     print("-"*50, "\n")
 
     # Option 1: Time individually
-    # Part_One(input_data)
-    # Part_Two(situation)
+    # Part_One(*parse(input_data))
+    # Part_Two(*parse(input_data))
 
-    # Option 2: Time both parts together for cleaner output
-    time_both_parts(Part_One, Part_Two, input_data)
\ No newline at end of file
+    # Option 2: Time both parts together for cleaner output (parsing and preparing once for both)
+    time_both_parts(Part_One, Part_Two, input_data, prepare=parse)
\ No newline at end of file
@@ -1,14 +1,65 @@
-import requests
+import _thread
+import marshal
+import time
+import types
+from array import array
+from contextlib import contextmanager
+from functools import wraps
 from pathlib import Path
 import os
-from dotenv import load_dotenv
-from datetime import datetime
 
-# Load environment variables from .env file
-load_dotenv()
+try:
+    import fcntl  # Unix only; elsewhere the input store index is only guarded within a process
+except ImportError:
+    fcntl = None
+
+# requests, python-dotenv and zstandard are imported on first use: together they take over 100ms to
+# import, which would otherwise be paid by every solution run even when its input is already cached.
+# The same goes for the stdlib modules only the fetch, store and cache paths need (hashlib, json, pickle, ...).
+# Locks come from _thread, the builtin core of threading.
+
+# Where inputs are fetched from (override with AOC_BASE_URL, e.g. a local server serving DayN inputs for testing)
+DEFAULT_BASE_URL = "https://adventofcode.com"
+
+# Maximum requests per second to the AOC server, shared by all fetches in this process (override with AOC_RATE_LIMIT)
+DEFAULT_RATE_LIMIT = 2.0
+
+# Status codes worth retrying (rate limited or server trouble); anything else non-200 fails immediately
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Content-addressed input store: compressed blobs named by the SHA-256 of the input, plus an index
+# mapping year/day/account to a hash
+INPUT_STORE_DIR = Path(__file__).parent / ".aoc_cache" / "inputs"
+INPUT_STORE_INDEX = INPUT_STORE_DIR / "index.json"
+INPUT_STORE_LOCK = INPUT_STORE_DIR / "index.lock"
+
+# Parsed inputs cached by @cached_parser; least recently used entries are evicted beyond the size limit
+PARSE_CACHE_DIR = Path(__file__).parent / ".aoc_cache" / "parsed"
+PARSE_CACHE_MAX_BYTES = int(os.getenv("AOC_PARSE_CACHE_MAX_MB", "256")) * 1024 * 1024
+
+# Line offsets of input files built by get_line_index()
+LINE_INDEX_DIR = Path(__file__).parent / ".aoc_cache" / "line_index"
+
+# parse_ints() turns every byte that can't be part of an unsigned integer into a space, then splits
+_NON_DIGITS_TO_SPACE = bytes(byte if 48 <= byte <= 57 else 32 for byte in range(256))
+# With negative=True a '-' is a sign unless it follows a digit ("3-5" is a range, not 3 and -5)
+_SIGNED_INT = rb"(?<!\d)-?\d+"
+
+_env_loaded = False
+
+
+def load_env():
+    """Load environment variables from the .env file (once; only the fetch path needs them)."""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+
 
 def get_session_token():
     """Get AOC session token from environment variable."""
+    load_env()
     token = os.getenv("AOC_SESSION")
     if not token:
         raise ValueError("AOC_SESSION not found in environment variables. Create a .env file with AOC_SESSION=your_token")
@@ -16,18 +67,277 @@ def get_session_token():
     return token
 
 
-def fetch_input(year, day):
-    """Fetch input from Advent of Code website."""
-    url = f"https://adventofcode.com/{year}/day/{day}/input"
-    session_token = get_session_token()
-    
-    headers = {"Cookie": f"session={session_token}"}
-    response = requests.get(url, headers=headers)
-    
-    if response.status_code != 200:
-        raise Exception(f"Failed to fetch input: {response.status_code}")
-    
-    return response.text
+class RateLimiter:
+    """Thread-safe limiter spacing calls to wait() at least 1 / rate seconds apart (no limit if rate <= 0)."""
+
+    def __init__(self, rate):
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self.next_time = 0.0
+        self.lock = _thread.allocate_lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            delay = max(0.0, self.next_time - now)
+            self.next_time = max(now, self.next_time) + self.interval
+        if delay:
+            time.sleep(delay)
+
+
+_session = None
+_session_lock = _thread.allocate_lock()
+_rate_limiter = None
+
+
+def get_session(pool_size=16):
+    """Shared requests.Session (created on first use) so all fetches reuse pooled connections."""
+    global _session, _rate_limiter
+    import requests
+
+    with _session_lock:
+        if _session is None:
+            load_env()
+            _rate_limiter = RateLimiter(float(os.getenv("AOC_RATE_LIMIT", DEFAULT_RATE_LIMIT)))
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["Cookie"] = f"session={get_session_token()}"
+            _session = session
+        return _session
+
+
+def fetch_input(year, day, retries=3, backoff=1.0, timeout=30):
+    """
+    Fetch input from Advent of Code website (or AOC_BASE_URL).
+
+    Connection errors, timeouts and 429/5xx responses are retried up to `retries` times with exponential
+    backoff (honouring Retry-After); every attempt goes through the process-wide rate limiter.
+    """
+    import random
+    import requests
+
+    session = get_session()
+    url = f"{os.getenv('AOC_BASE_URL', DEFAULT_BASE_URL).rstrip('/')}/{year}/day/{day}/input"
+
+    for attempt in range(retries + 1):
+        _rate_limiter.wait()
+        try:
+            response = session.get(url, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == retries:
+                raise
+            retry_after = None
+        else:
+            if response.status_code == 200:
+                return response.text
+            if response.status_code not in RETRY_STATUS_CODES or attempt == retries:
+                raise Exception(f"Failed to fetch input: {response.status_code}")
+            retry_after = response.headers.get("Retry-After")
+
+        delay = float(retry_after) if retry_after and retry_after.isdigit() else backoff * 2 ** attempt
+        time.sleep(delay + random.uniform(0, backoff / 2))  # Jitter, so parallel retries don't line up
+
+
+def save_input(day, input_data):
+    """Write a day's input to its cache file atomically (a concurrent reader never sees a partial file)."""
+    input_file = get_input_path(day)
+    input_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = input_file.with_suffix(f".{os.getpid()}.{_thread.get_ident()}.tmp")
+    with open(tmp_file, "w") as f:
+        f.write(input_data)
+    os.replace(tmp_file, input_file)
+    return input_file
+
+
+def aoc_year():
+    """Event year from AOC_YEAR (defaults to the current year)."""
+    load_env()
+    if os.getenv("AOC_YEAR"):
+        return os.getenv("AOC_YEAR")
+    from datetime import datetime
+    return str(datetime.now().year)
+
+
+def account_id():
+    """Short, non-reversible id of the AOC account whose session token is configured ("anonymous" without one)."""
+    import hashlib
+
+    load_env()
+    token = os.getenv("AOC_SESSION")
+    return hashlib.sha256(token.encode()).hexdigest()[:16] if token else "anonymous"
+
+
+_store_lock = _thread.allocate_lock()
+
+
+def _zstandard():
+    # The optional zstandard module, or None if it isn't installed
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def _blob_path(digest):
+    # Prefer an existing blob in either format, else the best format available
+    for suffix in (".zst", ".gz"):
+        blob = INPUT_STORE_DIR / "objects" / digest[:2] / f"{digest}{suffix}"
+        if blob.is_file():
+            return blob
+    return INPUT_STORE_DIR / "objects" / digest[:2] / f"{digest}{'.zst' if _zstandard() else '.gz'}"
+
+
+@contextmanager
+def _locked_store_index():
+    # Held while the index is read, modified and replaced, by threads (lock) and processes (flock) alike,
+    # so parallel workers fetching different days don't drop each other's entries
+    with _store_lock:
+        if fcntl is None:
+            yield
+            return
+        INPUT_STORE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(INPUT_STORE_LOCK, "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _read_store_index():
+    import json
+
+    if not INPUT_STORE_INDEX.is_file():
+        return {}
+    with open(INPUT_STORE_INDEX) as f:
+        return json.load(f)
+
+
+def store_input(year, day, input_data, account=None):
+    """
+    Add an input to the content-addressed store and record it in the index under (year, day, account).
+
+    Identical inputs (e.g. the same day fetched twice, or shared by several accounts) share one blob.
+
+    Returns:
+        SHA-256 (hex) of the input
+    """
+    import gzip
+    import hashlib
+    import json
+
+    data = input_data.encode()
+    digest = hashlib.sha256(data).hexdigest()
+    blob = _blob_path(digest)
+
+    if not blob.is_file():
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        compressed = _zstandard().ZstdCompressor(level=19).compress(data) if blob.suffix == ".zst" else gzip.compress(data, 9)
+        tmp_file = blob.with_suffix(f".{os.getpid()}.{_thread.get_ident()}.tmp")
+        tmp_file.write_bytes(compressed)
+        os.replace(tmp_file, blob)
+
+    with _locked_store_index():
+        index = _read_store_index()
+        index[f"{year}/{day}/{account or account_id()}"] = {"sha256": digest, "size": len(data)}
+        tmp_file = INPUT_STORE_INDEX.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(index, indent=1, sort_keys=True))
+        os.replace(tmp_file, INPUT_STORE_INDEX)
+
+    return digest
+
+
+def lookup_input(year, day, account=None):
+    """SHA-256 of the stored input for (year, day, account), or None if it isn't in the store."""
+    entry = _read_store_index().get(f"{year}/{day}/{account or account_id()}")
+    return entry["sha256"] if entry else None
+
+
+def open_stored_input(digest):
+    """Open a stored input as a text stream that decompresses as it is read."""
+    import gzip
+    import io
+
+    blob = _blob_path(digest)
+    if not blob.is_file():
+        raise FileNotFoundError(f"Input {digest} is not in the store")
+    if blob.suffix == ".gz":
+        return gzip.open(blob, "rt")
+    zstandard = _zstandard()
+    if zstandard is None:
+        raise ImportError(f"{blob} is zstd-compressed; install zstandard to read it")
+    return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(open(blob, "rb"), closefd=True))
+
+
+def load_stored_input(digest):
+    """Read a stored input and verify it against its hash."""
+    import hashlib
+
+    with open_stored_input(digest) as f:
+        input_data = f.read()
+    if hashlib.sha256(input_data.encode()).hexdigest() != digest:
+        raise ValueError(f"Stored input {digest} is corrupted")
+    return input_data
+
+
+def store_cached_inputs(days):
+    """Add the cached DayXX/input.txt files of the given days to the store (for the current year and account)."""
+    return {day: store_input(aoc_year(), day, get_input_path(day).read_text())
+            for day in days if get_input_path(day).is_file()}
+
+
+def prefetch_inputs(days, max_workers=4, force_fetch=False):
+    """
+    Fetch the inputs of all given days that aren't cached yet, in parallel over one pooled session.
+
+    Requests are still spaced by the rate limiter (AOC_RATE_LIMIT), so max_workers mostly hides latency.
+
+    Returns:
+        Dict of day -> "cached", "restored" (from the input store), "fetched" or the exception that made fetching it fail
+    """
+    year = aoc_year()
+    results = {day: "cached" for day in days if not force_fetch and get_input_path(day).is_file()}
+    missing = [day for day in days if day not in results]
+
+    if missing and os.getenv("AOC_INPUT_DIR"):
+        # Never fetch real inputs into an overridden input directory
+        return {**results, **{day: FileNotFoundError(f"Not fetching Day {day} into AOC_INPUT_DIR") for day in missing}}
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    def fetch_and_save(day):
+        digest = None if force_fetch else lookup_input(year, day)
+        if digest:
+            save_input(day, load_stored_input(digest))
+            return "restored"
+        input_data = fetch_input(year, day)
+        store_input(year, day, input_data)
+        save_input(day, input_data)
+        return "fetched"
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {day: pool.submit(fetch_and_save, day) for day in missing}
+        for day, future in futures.items():
+            try:
+                results[day] = future.result()
+            except Exception as error:
+                results[day] = error
+
+    return dict(sorted(results.items()))
+
+
+def get_input_path(day):
+    """
+    Path of the cached input file for a day.
+
+    Normally DayXX/input.txt next to this module; if the AOC_INPUT_DIR environment variable is set,
+    DayXX/input.txt under that directory instead (e.g. synthetic inputs for benchmarking).
+    """
+    input_root = os.getenv("AOC_INPUT_DIR")
+    base_dir = Path(input_root) if input_root else Path(__file__).parent
+    return base_dir / f"Day{day:02d}" / "input.txt"
 
 
 def get_input(day, force_fetch=False, save_to_file=True):
@@ -43,27 +353,472 @@ def get_input(day, force_fetch=False, save_to_file=True):
     Returns:
         List of strings (lines from input)
     """
-    # Determine the directory for this day's solution
-    day_dir = Path(__file__).parent / f"Day{day:02d}"
-    input_file = day_dir / "input.txt"
+    # Determine the input file for this day's solution
+    input_file = get_input_path(day)
     
     # Check if we can use cached file
     if not force_fetch and input_file.is_file():
         with open(input_file, "r") as f:
             return f.read()
+
+    # Never fetch real inputs into an overridden input directory
+    if os.getenv("AOC_INPUT_DIR"):
+        raise FileNotFoundError(f"No input for Day {day} in AOC_INPUT_DIR: {input_file} does not exist")
     
+    year = aoc_year()  # Default to current year if not set
+
+    # Restore from the input store if this account's input for the day was fetched before
+    digest = None if force_fetch else lookup_input(year, day)
+    if digest:
+        input_data = load_stored_input(digest)
+        if save_to_file:
+            save_input(day, input_data)
+        return input_data
+
     # Fetch from web
     print(f"Fetching input for Day {day}...")
-    year = os.getenv("AOC_YEAR", str(datetime.now().year))  # Default to current year if not set
     input_data = fetch_input(year, day)
+    store_input(year, day, input_data)
     
     # Optionally save to file
     if save_to_file:
-        day_dir.mkdir(exist_ok=True)
-        with open(input_file, "w") as f:
-            f.write(input_data)
+        save_input(day, input_data)
         print(f"Input saved to {input_file}")
     
     # Return the retrieved input
     return input_data
-    
\ No newline at end of file
+
+
+def get_input_buffer(day):
+    """
+    Memory-map a day's input file read-only (fetching and caching it first if needed).
+
+    Returns:
+        mmap (or b"" for an empty file) supporting bytes-style slicing and find() without reading the whole file
+    """
+    import mmap
+
+    input_file = get_input_path(day)
+    if not input_file.is_file():
+        get_input(day)
+
+    with open(input_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""  # Empty files can't be mapped
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def build_line_index(buffer):
+    """
+    Offsets of the start of every line in buffer, plus one sentinel, as an array('Q').
+
+    Line i spans buffer[offsets[i]:offsets[i + 1] - 1]; like str.splitlines(), a final newline doesn't add an empty line.
+    """
+    offsets = array("Q", [0])
+    find = buffer.find
+    pos = find(b"\n")
+    while pos != -1:
+        offsets.append(pos + 1)
+        pos = find(b"\n", pos + 1)
+
+    if offsets[-1] == len(buffer):
+        offsets.pop()  # Trailing newline (or empty buffer)
+    offsets.append(len(buffer) + (0 if buffer[-1:] == b"\n" else 1))
+    return offsets
+
+
+def get_line_index(day, buffer=None):
+    """
+    Line index of a day's input (see build_line_index), cached under LINE_INDEX_DIR.
+
+    The cached index is reused while the input file's size and mtime are unchanged.
+    """
+    import zlib  # Already loaded at interpreter startup, unlike hashlib
+
+    input_file = get_input_path(day)
+    buffer = get_input_buffer(day) if buffer is None else buffer
+    stat = input_file.stat()
+    path_id = zlib.crc32(str(input_file.resolve()).encode())
+    cache_file = LINE_INDEX_DIR / f"{input_file.parent.name}-{path_id:08x}.idx"
+
+    # Layout: input size, input mtime_ns, then the offsets
+    if cache_file.is_file():
+        cached = array("Q", cache_file.read_bytes())
+        if cached[:2] == array("Q", [stat.st_size, stat.st_mtime_ns]):
+            return cached[2:]
+
+    offsets = build_line_index(buffer)
+    LINE_INDEX_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    tmp_file.write_bytes((array("Q", [stat.st_size, stat.st_mtime_ns]) + offsets).tobytes())
+    os.replace(tmp_file, cache_file)
+    return offsets
+
+
+class LineView:
+    """
+    Read-only sequence of the lines of a buffer, converted one at a time on access.
+
+    Nothing is copied up front: iterating yields one str (or whatever `convert` returns) per line,
+    slicing returns another view of the same buffer, and raw() gives a zero-copy memoryview.
+    """
+
+    def __init__(self, buffer, offsets, start=0, stop=None, convert=None):
+        self.buffer = buffer
+        self.offsets = offsets
+        self.start = start
+        self.stop = len(offsets) - 1 if stop is None else stop
+        self.convert = convert or bytes.decode
+        self.crlf = buffer.find(b"\r\n") != -1  # Only then do lines need their '\r' stripped
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def _bounds(self, idx):
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("line index out of range")
+        line_start, line_end = self.offsets[self.start + idx], self.offsets[self.start + idx + 1] - 1
+        if self.crlf and line_end > line_start and self.buffer[line_end - 1] == 13:  # Drop the '\r' of '\r\n'
+            line_end -= 1
+        return line_start, line_end
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(len(self))
+            if step != 1:
+                raise ValueError("LineView slices don't support a step")
+            return LineView(self.buffer, self.offsets, self.start + start, self.start + max(start, stop), self.convert)
+        line_start, line_end = self._bounds(idx)
+        return self.convert(self.buffer[line_start:line_end])
+
+    def __iter__(self):
+        if self.crlf:
+            for idx in range(len(self)):
+                yield self[idx]
+            return
+        # Fast path without per-line bounds checks
+        buffer, offsets, convert = self.buffer, self.offsets, self.convert
+        for idx in range(self.start, self.stop):
+            yield convert(buffer[offsets[idx]:offsets[idx + 1] - 1])
+
+    def raw(self, idx):
+        """Line idx as a memoryview into the buffer (no copy)."""
+        line_start, line_end = self._bounds(idx)
+        return memoryview(self.buffer)[line_start:line_end]
+
+    def map(self, convert):
+        """The same lines, converted with convert(bytes) instead (e.g. int)."""
+        return LineView(self.buffer, self.offsets, self.start, self.stop, convert)
+
+    def sections(self):
+        """Split at empty lines, like input.split("\n\n")."""
+        sections, section_start = [], 0
+        for idx in range(len(self)):
+            line_start, line_end = self._bounds(idx)
+            if line_start == line_end:
+                sections.append(self[section_start:idx])
+                section_start = idx + 1
+        sections.append(self[section_start:])
+        return sections
+
+
+def get_input_lines(day):
+    """Lines of a day's input as a LineView over the memory-mapped file (see get_input_buffer)."""
+    buffer = get_input_buffer(day)
+    return LineView(buffer, get_line_index(day, buffer))
+
+
+def iter_input(day, chunk_size=None, buffer_size=1 << 16):
+    """
+    Lazily read a day's input file (fetching and caching it first if needed) with buffered reads.
+
+    Args:
+        day: Day of the puzzle
+        chunk_size: If set, yield lists of up to chunk_size lines instead of single lines
+        buffer_size: Read buffer size in bytes
+
+    Yields:
+        Lines without their line ending (like str.splitlines()), or lists of them
+    """
+    input_file = get_input_path(day)
+    if not input_file.is_file():
+        get_input(day)
+
+    with open(input_file, "r", buffering=buffer_size, newline=None) as f:
+        if chunk_size is None:
+            for line in f:
+                yield line.rstrip("\n")
+            return
+
+        chunk = []
+        for line in f:
+            chunk.append(line.rstrip("\n"))
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+class StreamedInput:
+    """Re-iterable lines of a day's input: every pass streams them from disk again, so memory use stays flat."""
+
+    def __init__(self, day, buffer_size=1 << 16):
+        self.day = day
+        self.buffer_size = buffer_size
+
+    def __iter__(self):
+        return iter_input(self.day, buffer_size=self.buffer_size)
+
+
+def streaming_enabled():
+    """Whether solutions that support it should stream their input (AOC_STREAM_INPUT=1, set by run_all.py --stream)."""
+    return os.getenv("AOC_STREAM_INPUT") == "1"
+
+
+class InputShard:
+    """
+    A line-aligned byte range [start, end) of an input file.
+
+    Only the path and offsets are kept, so shards pickle cheaply and a worker process reads its own range from disk.
+    """
+
+    def __init__(self, path, start, end):
+        self.path = str(path)
+        self.start = start
+        self.end = end
+
+    def __iter__(self):
+        """Lines of the range without their line ending, read with buffered I/O."""
+        with open(self.path, "rb") as f:
+            f.seek(self.start)
+            remaining = self.end - self.start
+            for line in f:
+                if remaining <= 0:
+                    break
+                remaining -= len(line)
+                yield line.decode().rstrip("\r\n")
+
+    def read(self):
+        """The range as a string."""
+        with open(self.path, "rb") as f:
+            f.seek(self.start)
+            return f.read(self.end - self.start).decode()
+
+    def __repr__(self):
+        return f"InputShard({self.path!r}, {self.start}, {self.end})"
+
+
+def shard_input(day, n, skip_lines=0):
+    """
+    Split a day's input file (fetching and caching it first if needed) into up to n line-aligned shards.
+
+    Boundaries are found by seeking to evenly spaced offsets and reading on to the next line ending,
+    so the file is never read as a whole.
+
+    Args:
+        day: Day of the puzzle
+        n: Number of shards; fewer are returned if the input has fewer lines
+        skip_lines: Lines at the start left out of every shard (e.g. a header section parsed separately)
+
+    Returns:
+        List of InputShard covering the input (after skip_lines) in order
+    """
+    input_file = get_input_path(day)
+    if not input_file.is_file():
+        get_input(day)
+
+    size = input_file.stat().st_size
+    with open(input_file, "rb") as f:
+        for _ in range(skip_lines):
+            f.readline()
+        boundaries = [f.tell()]
+        for i in range(1, n):
+            offset = boundaries[0] + (size - boundaries[0]) * i // n
+            if offset > boundaries[-1]:
+                f.seek(offset - 1)
+                f.readline()  # Move to the end of the line holding the byte before the offset
+                boundaries.append(f.tell())
+        boundaries.append(size)
+
+    return [InputShard(input_file, start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def _as_bytes(text):
+    return text.encode() if isinstance(text, str) else text
+
+
+def parse_ints(text, negative=False, as_numpy=False):
+    """
+    Parse all integers in a text, in order, in a single pass over its bytes.
+
+    Args:
+        text: Input text (str or bytes)
+        negative: Read a '-' right before a number (but not after a digit, as in "3-5") as its sign
+        as_numpy: Return a NumPy int64 array instead (requires numpy)
+
+    Returns:
+        array('q') of the integers
+    """
+    data = _as_bytes(text)
+    if negative:
+        import re
+        values = array("q", map(int, re.findall(_SIGNED_INT, data)))
+    else:
+        values = array("q", map(int, data.translate(_NON_DIGITS_TO_SPACE).split()))
+    if as_numpy:
+        import numpy
+        return numpy.frombuffer(values, dtype=numpy.int64)
+    return values
+
+
+def parse_grid(text, as_numpy=False):
+    """
+    Parse a rectangular character grid into a 2D array of its bytes.
+
+    Args:
+        text: Input text (str or bytes), one row per line
+        as_numpy: Return a (rows, columns) NumPy uint8 array instead (requires numpy)
+
+    Returns:
+        memoryview of shape (rows, columns) and format 'B': grid[row, col] is the byte value of a cell
+    """
+    data = _as_bytes(text).replace(b"\r\n", b"\n").rstrip(b"\n")
+    width = data.find(b"\n") if b"\n" in data else len(data)
+    height = (len(data) + 1) // (width + 1)
+    if not width or len(data) != height * (width + 1) - 1 or data[width::width + 1] != b"\n" * (height - 1):
+        raise ValueError("parse_grid needs a non-empty grid with rows of equal width")
+
+    cells = data.replace(b"\n", b"")
+    if as_numpy:
+        import numpy
+        return numpy.frombuffer(cells, dtype=numpy.uint8).reshape(height, width)
+    return memoryview(cells).cast("B", (height, width))
+
+
+def parse_csv_points(text, negative=False, as_numpy=False):
+    """
+    Parse lines of comma-separated integers ("x,y" or "x,y,z") into a 2D integer array.
+
+    Raises ValueError if the input is empty or a line doesn't hold as many integers as the first.
+
+    Args:
+        text: Input text (str or bytes), one point per line
+        negative: Allow negative coordinates (see parse_ints)
+        as_numpy: Return an (N, k) NumPy int64 array instead (requires numpy)
+
+    Returns:
+        memoryview of shape (N, k) and format 'q': points[i, j] is coordinate j of point i
+    """
+    data = _as_bytes(text).strip()
+    if not data:  # A memoryview can't have a zero-sized dimension
+        raise ValueError("parse_csv_points needs at least one point")
+    first_line_end = data.find(b"\n")
+    k = data[:first_line_end if first_line_end != -1 else len(data)].count(b",") + 1
+    n = data.count(b"\n") + 1
+    # Without the numbers, every line must be the same k - 1 commas
+    skeleton = data.translate(None, b"0123456789\r-" if negative else b"0123456789\r")
+    line = b"," * (k - 1)
+    values = parse_ints(data, negative)
+    if len(values) != n * k or skeleton != (line + b"\n") * (n - 1) + line:
+        raise ValueError(f"parse_csv_points needs {k} integers on every line")
+
+    if as_numpy:
+        import numpy
+        return numpy.frombuffer(values, dtype=numpy.int64).reshape(n, k)
+    return memoryview(values).cast("B").cast("q", (n, k))
+
+
+def parse_ranges(text, as_numpy=False):
+    """
+    Parse "a-b" ranges (separated by newlines, commas or spaces) into their bounds.
+
+    Args:
+        text: Input text (str or bytes)
+        as_numpy: Return NumPy int64 arrays instead (requires numpy)
+
+    Returns:
+        Tuple of (starts, ends) as array('q'), in input order
+    """
+    values = parse_ints(text)
+    if len(values) % 2:
+        raise ValueError("parse_ranges needs every range to have a start and an end")
+
+    starts, ends = values[0::2], values[1::2]
+    if as_numpy:
+        import numpy
+        return numpy.frombuffer(starts, dtype=numpy.int64), numpy.frombuffer(ends, dtype=numpy.int64)
+    return starts, ends
+
+
+def cached_parser(parser):
+    """
+    Decorator caching the result of a day's parse function on disk.
+
+    Entries are keyed on the SHA-256 of the parser's arguments (the raw input) and of the parser's own
+    compiled code, so editing either one invalidates them (helpers the parser calls are not part of the key).
+    Results are pickled to PARSE_CACHE_DIR; generator parsers are materialized into a list first.
+    Set AOC_PARSE_CACHE=0 to always parse.
+    """
+    # marshal (builtin) rather than inspect.getsource(), which would import inspect for every solution using this
+    code = marshal.dumps(parser.__code__)
+
+    def parse(*args, **kwargs):
+        result = parser(*args, **kwargs)
+        return list(result) if isinstance(result, types.GeneratorType) else result
+
+    @wraps(parser)
+    def wrapper(*args, **kwargs):
+        if os.getenv("AOC_PARSE_CACHE") == "0":
+            return parse(*args, **kwargs)
+
+        import hashlib
+        import pickle
+
+        source_hash = hashlib.sha256(code).hexdigest()
+        input_hash = hashlib.sha256(pickle.dumps((args, kwargs), protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
+        key = hashlib.sha256(f"{source_hash}:{input_hash}".encode()).hexdigest()
+        cache_file = PARSE_CACHE_DIR / f"{parser.__name__}-{key[:32]}.pickle"
+
+        if cache_file.is_file():
+            try:
+                with open(cache_file, "rb") as f:
+                    result = pickle.load(f)
+                os.utime(cache_file)  # Mark as recently used for eviction
+                return result
+            except (OSError, EOFError, pickle.UnpicklingError):
+                pass  # Unreadable entry, parse again and overwrite it
+
+        result = parse(*args, **kwargs)
+
+        # Write atomically so concurrent runs (e.g. run_all.py --jobs) never read a half-written entry
+        PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+        evict_parse_cache()
+        return result
+
+    return wrapper
+
+
+def evict_parse_cache(max_bytes=None):
+    """Delete the least recently used parsed-input cache entries until the cache fits in max_bytes."""
+    max_bytes = PARSE_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    entries = []
+    for entry in PARSE_CACHE_DIR.glob("*.pickle"):
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:  # Evicted by a concurrent run
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry))
+
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, entry in sorted(entries, key=lambda item: item[0]):
+        if total_size <= max_bytes:
+            break
+        entry.unlink(missing_ok=True)
+        total_size -= size
@@ -0,0 +1,459 @@
+import hashlib
+import json
+import math
+import os
+import platform
+import re
+import statistics
+import subprocess
+import time
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+import event_utils
+import timer_utils
+
+# Append-only store of per-part timings across runs (one JSON record per line)
+HISTORY_FILE = Path("AOC_2025_History.jsonl")
+
+# Two-sided 95% Student's t critical values by degrees of freedom (falls back to 1.96 for large samples)
+T_CRITICAL_95 = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306,
+                 9: 2.262, 10: 2.228, 15: 2.131, 20: 2.086, 30: 2.042, 60: 2.000, 120: 1.980}
+
+# Growth models fitted by fit_complexity(), as functions of the input size n
+COMPLEXITY_MODELS = {
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * math.log(n),
+    "O(n^2)": lambda n: n ** 2,
+    "O(n^3)": lambda n: n ** 3,
+}
+
+# Benchmark results collected since the last call to drain_results()
+_results = []
+
+
+def t_critical(df: int) -> float:
+    """Return the 95% t critical value for df degrees of freedom (conservative for missing entries)."""
+    eligible = [k for k in T_CRITICAL_95 if k <= df]
+    return T_CRITICAL_95[max(eligible)] if eligible and df <= 120 else 1.96
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing samples (in milliseconds) of repeated calls to one function."""
+    name: str
+    times_ms: list[float] = field(default_factory=list)
+
+    @property
+    def runs(self) -> int:
+        return len(self.times_ms)
+
+    @property
+    def min(self) -> float:
+        return min(self.times_ms)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.times_ms)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times_ms)
+
+    @property
+    def p95(self) -> float:
+        if self.runs < 2:
+            return self.times_ms[0]
+        return statistics.quantiles(self.times_ms, n=20, method="inclusive")[-1]
+
+    @property
+    def stddev(self) -> float:
+        return statistics.stdev(self.times_ms) if self.runs > 1 else 0.0
+
+    @property
+    def ci95(self) -> float:
+        """Half-width of the 95% confidence interval of the mean."""
+        if self.runs < 2:
+            return math.inf
+        return t_critical(self.runs - 1) * self.stddev / math.sqrt(self.runs)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "runs": self.runs,
+            "min_ms": self.min,
+            "median_ms": self.median,
+            "p95_ms": self.p95,
+            "mean_ms": self.mean,
+            "stddev_ms": self.stddev,
+            "ci95_ms": self.ci95,
+        }
+
+
+def benchmark(func: Callable, *args, name: str | None = None, warmup: int = 3, min_runs: int = 5,
+              max_runs: int = 1000, max_time: float = 5.0, rel_ci: float = 0.02, gc_mode: str | None = None,
+              **kwargs) -> BenchmarkResult:
+    """
+    Benchmark a function with warmup and an adaptive number of repeats.
+
+    Timing stops once the 95% confidence interval of the mean is within rel_ci of the mean,
+    or when max_runs or max_time (seconds) is reached. Functions decorated with @timer are
+    unwrapped, and anything they print or emit is discarded, so only the function itself is measured.
+    Every timed call runs with the cyclic GC in gc_mode (see timer_utils.enable_gc_control).
+    """
+    func = getattr(func, "__wrapped__", func)
+    result = BenchmarkResult(name or func.__name__)
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull), event_utils.muted():
+        for _ in range(warmup):
+            func(*args, **kwargs)
+
+        deadline = time.perf_counter() + max_time
+        while result.runs < max_runs:
+            with timer_utils.gc_control(gc_mode):
+                start_time = time.perf_counter()
+                func(*args, **kwargs)
+                end_time = time.perf_counter()
+            result.times_ms.append((end_time - start_time) * 1000)
+
+            if result.runs >= min_runs and (result.ci95 <= rel_ci * result.mean or end_time >= deadline):
+                break
+
+    return result
+
+
+def benchmark_parts(part_funcs: list[Callable], args: tuple, kwargs: dict | None = None, single_shot: bool = True,
+                    **options) -> list[BenchmarkResult]:
+    """
+    Benchmark each part of a solution with the same arguments and emit a "benchmark" event per part.
+
+    Unless single_shot is False (the caller already ran them), each part is first called once normally,
+    so its answer (and single-shot time) is still reported.
+    """
+    kwargs = kwargs or {}
+    results = []
+
+    for part_func in part_funcs:
+        if single_shot:
+            part_func(*args, **kwargs)
+        result = benchmark(part_func, *args, name=_part_name(part_func), **options, **kwargs)
+        event_utils.emit("benchmark", **result.to_dict())
+        results.append(result)
+
+    _results.extend(results)
+    return results
+
+
+def _part_name(part_func: Callable) -> str:
+    # Prefer the @timer label ("Part One"), falling back to the function name
+    return getattr(part_func, "label", None) or getattr(part_func, "__name__", "part").replace("_", " ")
+
+
+def drain_results() -> list[BenchmarkResult]:
+    """Return and clear all benchmark results collected so far in this process."""
+    results = _results.copy()
+    _results.clear()
+    return results
+
+
+def write_json(records: list[dict], path: str) -> None:
+    """Write benchmark records (result dicts plus any labels such as day/variant) to a JSON file."""
+    with open(path, "w") as f:
+        json.dump(records, f, indent=2)
+
+
+def run_metadata() -> dict:
+    """Describe the environment of the current run: git commit (with a +dirty marker) and Python version."""
+    commit = None
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True, check=True).stdout
+        if status.strip():
+            commit += "+dirty"
+    except (OSError, subprocess.CalledProcessError):
+        pass
+
+    return {"git_commit": commit, "python": platform.python_version()}
+
+
+def input_hash(day: int) -> str | None:
+    """SHA-256 (hex) of a day's cached input file, or None if it isn't cached yet."""
+    from aoc_utils import get_input_path
+    input_file = get_input_path(day)
+    if not input_file.is_file():
+        return None
+    return hashlib.sha256(input_file.read_bytes()).hexdigest()
+
+
+def append_history(records: list[dict], path: Path = HISTORY_FILE) -> None:
+    """
+    Append per-part timings of one run to the JSONL history store.
+
+    Each record needs day, variant, part and ms; run id, timestamp, git commit, Python version and
+    input hash are added here so every line is self-describing.
+    """
+    run_info = {"run_id": datetime.now().strftime("%Y%m%dT%H%M%S.%f"), "timestamp": datetime.now().isoformat(timespec="seconds"),
+                **run_metadata()}
+    input_hashes = {}
+
+    with open(path, "a") as f:
+        for record in records:
+            day = record["day"]
+            if day not in input_hashes:
+                input_hashes[day] = input_hash(day)
+            f.write(json.dumps({**run_info, "input_hash": input_hashes[day], **record}) + "\n")
+
+
+def load_history(path: Path = HISTORY_FILE) -> list[dict]:
+    """Read all records from the JSONL history store (oldest first)."""
+    if not path.is_file():
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def find_regressions(history: list[dict], threshold_pct: float = 10.0, baseline_runs: int = 5,
+                     min_delta_ms: float = 0.1) -> list[dict]:
+    """
+    Compare the latest run in the history against a rolling baseline.
+
+    The baseline of each (day, variant, part) is the median time over up to baseline_runs earlier runs
+    on the same input. A part is flagged when it is more than threshold_pct slower than its baseline
+    (and by at least min_delta_ms, so sub-millisecond noise doesn't trip the check). Parts stopped by
+    their budget (records with a "status" such as TIMEOUT) never count towards a baseline, and are
+    always flagged in the latest run, with or without a baseline.
+
+    Returns:
+        List of comparison dicts for every part of the latest run that has a baseline or was stopped by its
+        budget, with "regressed" set ("baseline_ms" and "change_pct" are None without a baseline)
+    """
+    if not history:
+        return []
+
+    latest_run = history[-1]["run_id"]
+    by_key = {}
+    for record in history:
+        key = (record["day"], record["variant"], record["part"], record.get("input_hash"))
+        by_key.setdefault(key, []).append(record)
+
+    comparisons = []
+    for (day, variant, part, _), records in sorted(by_key.items(), key=lambda item: item[0][:3]):
+        if records[-1]["run_id"] != latest_run:
+            continue
+        previous = [r["ms"] for r in records[:-1] if r["run_id"] != latest_run and "status" not in r][-baseline_runs:]
+        status = records[-1].get("status")
+        current = records[-1]["ms"]
+        if not previous:
+            if status is not None:
+                comparisons.append({"day": day, "variant": variant, "part": part, "baseline_ms": None,
+                                    "current_ms": current, "change_pct": None, "regressed": True, "status": status})
+            continue
+
+        baseline = statistics.median(previous)
+        change_pct = (current - baseline) / baseline * 100 if baseline else 0.0
+        comparisons.append({
+            "day": day, "variant": variant, "part": part,
+            "baseline_ms": baseline, "current_ms": current, "change_pct": change_pct,
+            "regressed": change_pct > threshold_pct and current - baseline >= min_delta_ms or status is not None,
+            "status": status,
+        })
+
+    return comparisons
+
+
+def print_regression_report(comparisons: list[dict], threshold_pct: float) -> None:
+    print(f"{'Day':>3}  {'Variant':<16} {'Part':<9} {'Baseline':>12} {'Latest':>12} {'Change':>8}")
+    for c in comparisons:
+        flag = "  REGRESSION" if c["regressed"] else ""
+        if c.get("status"):
+            flag += f" ({c['status']})"
+        baseline = f"{c['baseline_ms']:>10.3f}ms" if c["baseline_ms"] is not None else f"{'-':>12}"
+        change = f"{c['change_pct']:>+7.1f}%" if c["change_pct"] is not None else f"{'-':>8}"
+        print(f"{c['day']:>3}  {c['variant']:<16} {c['part']:<9} {baseline} {c['current_ms']:>10.3f}ms {change}{flag}")
+
+    regressions = sum(c["regressed"] for c in comparisons)
+    stopped = sum(c.get("status") is not None for c in comparisons)
+    print(f"\n{regressions} of {len(comparisons)} parts slower than their baseline by more than {threshold_pct}% "
+          f"or stopped by their budget ({stopped} stopped)")
+
+
+def print_comparison(day: int, results: dict) -> bool:
+    """
+    Print a speedup table of all variants of a day, relative to the first variant (solution.py).
+
+    Args:
+        results: {variant: {part: {"times": [ms, ...], "answers": [answer, ...]}}}
+
+    Returns:
+        True if every variant produced the same answer for every part on every run
+    """
+    variants = list(results)
+    parts = list(dict.fromkeys(part for variant in variants for part in results[variant]))
+    all_agree = True
+
+    print(f"\nDay {day}")
+    print(f"{'Part':<9} {'Variant':<16} {'Runs':>5} {'Median':>12} {'Min':>12} {'Speedup':>8}  Answer")
+
+    for part in parts:
+        answers = {answer for variant in variants for answer in results[variant].get(part, {}).get("answers", [])}
+        missing = [variant for variant in variants if part not in results[variant]]
+        agree = len(answers) == 1 and not missing
+        all_agree &= agree
+
+        baseline = None
+        for variant in variants:
+            if part not in results[variant]:
+                print(f"{part:<9} {variant:<16} {'-':>5} {'-':>12} {'-':>12} {'-':>8}  (part not run)")
+                continue
+            times = results[variant][part]["times"]
+            median = statistics.median(times)
+            baseline = baseline or median
+            speedup = baseline / median if median else math.inf
+            answer = ", ".join(sorted(set(results[variant][part]["answers"])))
+            flag = "" if agree else "  MISMATCH"
+            print(f"{part:<9} {variant:<16} {len(times):>5} {median:>10.3f}ms {min(times):>10.3f}ms {speedup:>7.2f}x  {answer}{flag}")
+
+    return all_agree
+
+
+def fit_complexity(sizes: list[float], times_ms: list[float]) -> dict:
+    """
+    Fit runtimes measured at several input sizes to growth models.
+
+    The empirical exponent k comes from a least-squares fit of log(t) = log(c) + k * log(n). Each of
+    COMPLEXITY_MODELS is also fitted with its own constant c, and the one with the smallest RMS error
+    in log space is reported as the best fit (this is what separates n log n from n^1.1).
+
+    Returns:
+        {"exponent": k, "model": best model name, "rms": {model name: RMS log error}}
+    """
+    log_ns = [math.log(n) for n in sizes]
+    log_ts = [math.log(max(t, 1e-6)) for t in times_ms]
+    exponent = statistics.linear_regression(log_ns, log_ts).slope
+
+    rms = {}
+    for model, f in COMPLEXITY_MODELS.items():
+        residuals = [log_t - math.log(f(n)) for n, log_t in zip(sizes, log_ts)]
+        log_c = statistics.fmean(residuals)
+        rms[model] = math.sqrt(statistics.fmean((r - log_c) ** 2 for r in residuals))
+
+    return {"exponent": exponent, "model": min(rms, key=rms.get), "rms": rms}
+
+
+def print_scaling_report(day: int, variant: str, results: dict) -> None:
+    """
+    Print raw timings per input size and the fitted complexity of every part of one variant.
+
+    Args:
+        results: {part: [(scale, input bytes, [ms, ...]), ...]} ordered by scale
+    """
+    print(f"\nDay {day} - {variant}")
+    print(f"{'Part':<9} {'Scale':>8} {'Input bytes':>12} {'Median':>12}")
+
+    for part, points in results.items():
+        for scale, size, times in points:
+            print(f"{part:<9} {scale:>8g} {size:>12} {statistics.median(times):>10.3f}ms")
+
+        medians = [statistics.median(times) for _, _, times in points]
+        if len(points) < 2:
+            print(f"{part}: need at least two input sizes to fit a complexity")
+            continue
+        fit = fit_complexity([size for _, size, _ in points], medians)
+        note = "  (under 1ms even at the largest size, so mostly noise)" if max(medians) < 1 else ""
+        print(f"{part}: empirical exponent n^{fit['exponent']:.2f}, best fit {fit['model']}{note}")
+
+
+def parser_cases() -> list[tuple[int, str, Callable, Callable]]:
+    """(day, what, current per-day parsing, aoc_utils parser) pairs compared by benchmark_parsers()."""
+    from aoc_utils import parse_csv_points, parse_grid, parse_ints, parse_ranges
+
+    def day05_toolkit(text: str) -> tuple:
+        fresh_ids_range, available_ids = text.split("\n\n")
+        return parse_ranges(fresh_ids_range), parse_ints(available_ids)
+
+    def day05_current(text: str) -> tuple:
+        fresh_ids_range, available_ids = text.split("\n\n")
+        return ([tuple(map(int, id_range.split("-"))) for id_range in fresh_ids_range.splitlines()],
+                list(map(int, available_ids.splitlines())))
+
+    return [
+        (2, "ID ranges", lambda text: [tuple(map(int, id_range.split("-"))) for id_range in text.split(",")], parse_ranges),
+        (4, "grid", lambda text: text.splitlines(), parse_grid),
+        (5, "ranges + IDs", day05_current, day05_toolkit),
+        (8, "3D points", lambda text: [tuple(map(int, line.split(","))) for line in text.splitlines()], parse_csv_points),
+        (9, "2D points", lambda text: [(int(loc.split(",")[0]), int(loc.split(",")[1])) for loc in text.splitlines()],
+         parse_csv_points),
+        (12, "regions", lambda text: [list(map(int, line.replace("x", " ").replace(":", "").split()))
+                                      for line in text.split("\n\n")[-1].splitlines()],
+         lambda text: parse_ints(text.split("\n\n")[-1])),
+    ]
+
+
+def benchmark_parsers(scale: float = 100, seed: int = 0, **options) -> list[dict]:
+    """
+    Benchmark each day's current parsing against the aoc_utils parsers on the same synthetic input.
+
+    Returns:
+        List of dicts with day, case, input_bytes and both BenchmarkResults ("current", "toolkit")
+    """
+    from synthetic_inputs import generate_input
+
+    rows = []
+    for day, case, current, toolkit in parser_cases():
+        text = generate_input(day, scale, seed)
+        rows.append({
+            "day": day,
+            "case": case,
+            "input_bytes": len(text),
+            "current": benchmark(current, text, name=f"Day {day} {case} (current)", **options),
+            "toolkit": benchmark(toolkit, text, name=f"Day {day} {case} (aoc_utils)", **options),
+        })
+    return rows
+
+
+def print_parser_report(rows: list[dict]) -> None:
+    """Print the median time of the current parsing and the aoc_utils parser per case, with the speedup."""
+    print(f"{'Day':>3}  {'Case':<14} {'Input':>10} {'Current':>12} {'aoc_utils':>12} {'Speedup':>8}")
+    for row in rows:
+        current, toolkit = row["current"].median, row["toolkit"].median
+        print(f"{row['day']:>3}  {row['case']:<14} {row['input_bytes'] / 1024:>8.0f}KB {current:>10.3f}ms "
+              f"{toolkit:>10.3f}ms {current / toolkit:>7.2f}x")
+
+
+def parse_importtime(stderr: str) -> dict[str, float]:
+    """Cumulative time (ms) of every top-level import in the `python -X importtime` output of a process."""
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith("  ") or not cumulative.strip().isdigit():  # Nested import or header line
+            continue
+        imports[name.strip()] = imports.get(name.strip(), 0.0) + int(cumulative) / 1000
+    return imports
+
+
+def parse_part_times(stdout: str) -> float:
+    """Total time (ms) of the parts (and shared preparation) a solution reported ("Time taken to execute Part One: ...ms")."""
+    return sum(float(ms) for ms in re.findall(r"Time taken to execute (?:Part \w+|Prepare): ([\d.]+)ms", stdout))
+
+
+def print_startup_report(rows: list[dict]) -> None:
+    """
+    Print how the wall time of each solution process splits into imports, solving and everything else.
+
+    Args:
+        rows: dicts with day, variant, wall_ms, import_ms, solve_ms (medians) and imports ({module: ms})
+    """
+    print(f"{'Day':>3}  {'Variant':<16} {'Wall':>10} {'Other':>10} {'Imports':>10} {'Solve':>10}  Heaviest imports")
+    for row in rows:
+        other_ms = row["wall_ms"] - row["import_ms"] - row["solve_ms"]
+        heaviest = ", ".join(f"{module} {ms:.1f}ms" for module, ms in
+                             sorted(row["imports"].items(), key=lambda item: item[1], reverse=True)[:3])
+        flag = "  IMPORTS > SOLVE" if row["import_ms"] > row["solve_ms"] else ""
+        print(f"{row['day']:>3}  {row['variant']:<16} {row['wall_ms']:>8.1f}ms {other_ms:>8.1f}ms "
+              f"{row['import_ms']:>8.1f}ms {row['solve_ms']:>8.1f}ms  {heaviest}{flag}")
+    print("\nOther = interpreter startup, reading the input, printing and exit")
@@ -0,0 +1,235 @@
+"""
+Structured events of a run (answers, timings, progress, ...) buffered in a sink and rendered by pluggable writers.
+
+Parts and the timing machinery emit events instead of printing, so nothing is formatted or written inside
+a timed region: emit() only appends a dict to a buffer, and flush() hands the buffered events to the writers.
+    TextWriter        the familiar AOC_2025_Output.txt format
+    JsonlWriter       one JSON object per event, for tooling that wants answers and timings without parsing text
+    TerminalWriter    the text format on a terminal, with progress updating a single line
+    ConnectionWriter  every event over a multiprocessing connection, e.g. from a child process to the runner
+Without writers (e.g. a solution run as a script), every event is written to stdout as text right away.
+
+Every event is a dict with a "type" and the fields of that type:
+    day        day                          start of a day's solutions
+    variant    variant                      start of a solution file
+    import     variant, ms                  time taken to import a solution
+    cached     created                      a memoized result is replayed instead of running the solution
+    title      title                        title of a solution (e.g. "Day 1 - Secret Entrance")
+    result     part, answer, text           answer of a part, and the line reporting it
+    timing     name, ms, kind (+ resources, GC) time taken by a @timer function
+    benchmark  name, runs, min_ms, ...      summary of a benchmarked part (see BenchmarkResult.to_dict)
+    total      ms                           total time of both parts
+    progress   done, total, unit            progress within a long-running part
+    budget     status, part, ms, reason     a day stopped for exceeding its time or memory limit (or crashing)
+    text       text                         anything else
+plus the fields set with context() (e.g. "day" and "variant") when it was emitted.
+"""
+import sys
+from contextlib import contextmanager
+from typing import Any, IO, Iterator
+
+# Events buffered before they are flushed automatically (a flush happens at least after every solution)
+BUFFER_SIZE = 10_000
+
+_writers = []
+_buffer = []
+# Stack of (list, passthrough) collecting events instead of (or on their way to) the buffer (see capture());
+# a list of None drops them (see muted())
+_captures = []
+# Fields added to every event (see context())
+_context = {}
+
+
+def set_writers(writers: list) -> None:
+    """Send events to these writers from now on (after flushing pending events to the previous ones)."""
+    flush()
+    _writers[:] = writers
+
+
+def emit(event_type: str, /, **fields) -> None:
+    """Record an event of type `event_type`; cheap enough to call from inside timed code."""
+    event = {"type": event_type, **_context, **fields}
+    for events, passthrough in reversed(_captures):
+        if events is None:
+            return
+        events.append(event)
+        if not passthrough:
+            return
+    if not _writers:
+        TextWriter(sys.stdout).write(event)  # The stdout of the moment, so redirect_stdout still applies
+        return
+    _buffer.append(event)
+    if len(_buffer) >= BUFFER_SIZE:
+        flush()
+
+
+def result(part: str, answer: Any, text: str | None = None) -> None:
+    emit("result", part=part, answer=answer, text=text or f"{part}: {answer}")
+
+
+def progress(done: int, total: int, unit: str = "items") -> None:
+    emit("progress", done=done, total=total, unit=unit)
+
+
+def replay(events: list[dict]) -> None:
+    """Emit previously captured events again (e.g. from a worker process or the result cache), keeping their fields."""
+    for event in events:
+        emit(event["type"], **{key: value for key, value in event.items() if key != "type"})
+
+
+def answers(events: list[dict]) -> dict[str, Any]:
+    """The answer of every part among some events, e.g. those captured while a solution ran."""
+    return {event["part"]: event["answer"] for event in events if event["type"] == "result"}
+
+
+def flush() -> None:
+    """Hand all buffered events to the writers."""
+    events = _buffer.copy()
+    _buffer.clear()
+    for writer in _writers:
+        for event in events:
+            writer.write(event)
+        writer.flush()
+
+
+@contextmanager
+def capture(passthrough: bool = False) -> Iterator[list[dict]]:
+    """Collect the events emitted inside the block in the yielded list instead of writing them (or as well, with passthrough)."""
+    events = []
+    _captures.append((events, passthrough))
+    try:
+        yield events
+    finally:
+        _captures.pop()
+
+
+@contextmanager
+def muted() -> Iterator[None]:
+    """Drop the events emitted inside the block (e.g. while a part is benchmarked thousands of times)."""
+    _captures.append((None, False))
+    try:
+        yield
+    finally:
+        _captures.pop()
+
+
+@contextmanager
+def context(**fields) -> Iterator[None]:
+    """Add these fields (e.g. day=1, variant="solution.py") to every event emitted inside the block."""
+    previous = _context.copy()
+    _context.update(fields)
+    try:
+        yield
+    finally:
+        _context.clear()
+        _context.update(previous)
+
+
+def format_bytes(size: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if abs(size) < 1024:
+            return f"{size:.1f}{unit}" if unit != "B" else f"{size}B"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+
+def format_text(event: dict) -> str:
+    """An event as the text run_all.py has always written to AOC_2025_Output.txt."""
+    kind = event["type"]
+    if kind == "day":
+        return f"\n{'=' * 60}\nDay {event['day']}\n{'=' * 60}\n"
+    if kind == "variant":
+        return f"\n{event['variant']}:\n"
+    if kind == "import":
+        return f"Time taken to import {event['variant']}: {event['ms']:.3f}ms\n\n"
+    if kind == "cached":
+        return f"Cached result from {event['created']} (pass --force to recompute)\n\n"
+    if kind == "title":
+        return f"{'-' * 50}\n*** {event['title']} ***\n{'-' * 50} \n\n"
+    if kind == "result":
+        return f"{event['text']}\n"
+    if kind == "timing":
+        lines = [f"Time taken to execute {event['name']}: {event['ms']:.3f}ms"]
+        if "cpu_ms" in event:
+            lines.append(f"Resources used by {event['name']}: CPU {event['cpu_ms']:.3f}ms, peak RSS "
+                         f"+{format_bytes(event['rss_growth_bytes'])}, traced peak {format_bytes(event['traced_peak_bytes'])}")
+            for site in event.get("top_allocations", []):
+                lines.append(f"  {format_bytes(site['size_bytes']):>10}  {site['file']}:{site['line']} ({site['blocks']} blocks)")
+        if "gc_pause_ms" in event:
+            mode = f" (GC mode {event['gc_mode']})" if event.get("gc_mode") else ""
+            lines.append(f"GC during {event['name']}{mode}: {sum(event['gc_collections'])} collections "
+                         f"(gen 0/1/2: {'/'.join(map(str, event['gc_collections']))}), {event['gc_collected']} objects collected, "
+                         f"{event['gc_pause_ms']:.3f}ms paused")
+        return "\n".join(lines) + "\n\n"
+    if kind == "benchmark":
+        rel_ci = event["ci95_ms"] / event["mean_ms"] * 100 if event["mean_ms"] else 0.0
+        return (f"Benchmark {event['name']}: {event['runs']} runs, min {event['min_ms']:.3f}ms, median {event['median_ms']:.3f}ms, "
+                f"p95 {event['p95_ms']:.3f}ms, stddev {event['stddev_ms']:.3f}ms (95% CI ±{rel_ci:.1f}%)\n\n")
+    if kind == "total":
+        return f"{'=' * 50}\nTotal execution time: {event['ms']:.3f}ms\n{'=' * 50}\n"
+    if kind == "progress":
+        return f"  Processed {event['done']}/{event['total']} {event['unit']}...\n"
+    if kind == "budget":
+        where = f" in {event['variant']} {event['part']}" if event.get("part") else ""
+        return f"\n{event['status']}{where} after {event['ms'] / 1000:.3f}s ({event['reason']}), skipping the rest of Day {event['day']}\n"
+    return f"{event.get('text', '')}\n"
+
+
+class TextWriter:
+    """Writes events as plain text (see format_text)."""
+
+    def __init__(self, stream: IO[str]):
+        self.stream = stream
+
+    def write(self, event: dict) -> None:
+        self.stream.write(format_text(event))
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+class JsonlWriter:
+    """Writes every event as one line of JSON; answers that aren't JSON types are written as strings."""
+
+    def __init__(self, stream: IO[str]):
+        import json  # Only needed with --events
+        self.stream = stream
+        self.dumps = json.dumps
+
+    def write(self, event: dict) -> None:
+        self.stream.write(self.dumps(event, default=str) + "\n")
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+class TerminalWriter(TextWriter):
+    """Text on a terminal, where consecutive progress events overwrite each other on one line."""
+
+    def __init__(self, stream: IO[str] | None = None):
+        super().__init__(stream or sys.stderr)
+        self.interactive = self.stream.isatty()
+        self.progress_shown = False
+
+    def write(self, event: dict) -> None:
+        if self.interactive and event["type"] == "progress":
+            self.stream.write("\r" + format_text(event).rstrip("\n"))
+            self.progress_shown = True
+            return
+        if self.progress_shown:
+            self.stream.write("\n")
+            self.progress_shown = False
+        super().write(event)
+
+
+class ConnectionWriter:
+    """Sends every event over a multiprocessing connection as it is written."""
+
+    def __init__(self, connection: Any):
+        self.connection = connection
+
+    def write(self, event: dict) -> None:
+        self.connection.send(event)
+
+    def flush(self) -> None:
+        pass
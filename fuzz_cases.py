@@ -0,0 +1,575 @@
+"""
+Random small puzzle cases for differential fuzzing (see fuzz_utils.py), with brute-force oracles.
+
+A case is a nested structure of tuples, lists and non-negative ints that render() turns into puzzle input.
+The shrinker only ever drops list elements or lowers ints, so the fixed-size parts of a case are tuples
+and every list element can go on its own. valid() tells whether a (shrunk) case is still a well-formed
+puzzle input; anything it accepts must be renderable.
+
+The oracles solve a rendered input the slow, obvious way (simulating every click, trying every subset,
+searching every packing, ...) and raise ValueError for inputs outside the puzzle's domain.
+"""
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import combinations, product
+from typing import Any, Callable
+
+
+@dataclass
+class FuzzSpec:
+    generate: Callable[[random.Random], Any]
+    render: Callable[[Any], str]
+    valid: Callable[[Any], bool] = lambda case: True
+    oracle: Callable[[str], dict[str, Any]] | None = None  # Input text -> {"Part One": answer, "Part Two": answer}
+
+
+# Day 1: a few rotations as (direction, distance)
+def gen_day01(rng: random.Random) -> list:
+    return [(rng.randint(0, 1), rng.randint(1, 300)) for _ in range(rng.randint(1, 8))]
+
+
+def render_day01(case: list) -> str:
+    return "\n".join(f"{'LR'[direction % 2]}{distance}" for direction, distance in case)
+
+
+def valid_day01(case: list) -> bool:
+    return bool(case) and all(distance >= 1 for _, distance in case)
+
+
+def oracle_day01(text: str) -> dict:
+    position, at_zero, passed_zero = 50, 0, 0
+    for line in text.split("\n"):
+        step = -1 if line[0] == "L" else 1
+        for _ in range(int(line[1:])):  # One click at a time
+            position = (position + step) % 100
+            passed_zero += position == 0
+        at_zero += position == 0
+    return {"Part One": at_zero, "Part Two": passed_zero}
+
+
+# Day 2: a few ID ranges as (start, length), short enough to check every ID
+def gen_day02(rng: random.Random) -> list:
+    ranges = []
+    for _ in range(rng.randint(1, 4)):
+        digits = rng.randint(1, 10)
+        ranges.append((rng.randint(10 ** (digits - 1), 10 ** digits - 1), rng.randint(0, 2000)))
+    return ranges
+
+
+def render_day02(case: list) -> str:
+    return ",".join(f"{start}-{start + length}" for start, length in case)
+
+
+def valid_day02(case: list) -> bool:
+    return bool(case) and all(start >= 1 for start, _ in case)
+
+
+def oracle_day02(text: str) -> dict:
+    twice, repeated = 0, 0
+    for id_range in text.split(","):
+        start, end = map(int, id_range.split("-"))
+        for number in range(start, end + 1):
+            digits = str(number)
+            half = len(digits) // 2
+            if len(digits) % 2 == 0 and digits[:half] * 2 == digits:
+                twice += number
+            if any(len(digits) % size == 0 and digits[:size] * (len(digits) // size) == digits for size in range(1, half + 1)):
+                repeated += number
+    return {"Part One": twice, "Part Two": repeated}
+
+
+# Day 3: a few banks of 12-16 battery digits
+def gen_day03(rng: random.Random) -> list:
+    return [[rng.randint(1, 9) for _ in range(rng.randint(12, 16))] for _ in range(rng.randint(1, 4))]
+
+
+def render_day03(case: list) -> str:
+    return "\n".join("".join(map(str, bank)) for bank in case)
+
+
+def valid_day03(case: list) -> bool:
+    return bool(case) and all(len(bank) >= 12 and all(1 <= digit <= 9 for digit in bank) for bank in case)
+
+
+def oracle_day03(text: str) -> dict:
+    banks = text.split("\n")
+    return {
+        "Part One": sum(max(int(first + second) for first, second in combinations(bank, 2)) for bank in banks),
+        "Part Two": sum(max(int("".join(digits)) for digits in combinations(bank, 12)) for bank in banks),
+    }
+
+
+# Day 4: a grid of 2x2 to 8x8 cells, 1 for a paper roll
+def gen_day04(rng: random.Random) -> list:
+    width = rng.randint(2, 8)
+    return [tuple(int(rng.random() < 0.65) for _ in range(width)) for _ in range(rng.randint(2, 8))]
+
+
+def render_day04(case: list) -> str:
+    return "\n".join("".join("@" if cell else "." for cell in row) for row in case)
+
+
+def valid_day04(case: list) -> bool:
+    return len(case) >= 2 and all(cell <= 1 for row in case for cell in row)
+
+
+def oracle_day04(text: str) -> dict:
+    rolls = {(r, c) for r, row in enumerate(text.split("\n")) for c, cell in enumerate(row) if cell == "@"}
+
+    def accessible(rolls: set) -> set:
+        return {(r, c) for r, c in rolls
+                if sum((r + dr, c + dc) in rolls for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc) < 4}
+
+    first = accessible(rolls)
+    removed = 0
+    while removable := accessible(rolls):
+        rolls -= removable
+        removed += len(removable)
+    return {"Part One": len(first), "Part Two": removed}
+
+
+# Day 5: fresh ID ranges as (start, length) and available IDs, all small enough to enumerate
+def gen_day05(rng: random.Random) -> tuple:
+    ranges = [(rng.randint(1, 60), rng.randint(0, 20)) for _ in range(rng.randint(1, 5))]
+    return ranges, [rng.randint(1, 90) for _ in range(rng.randint(1, 8))]
+
+
+def render_day05(case: tuple) -> str:
+    ranges, ids = case
+    return "\n".join(f"{start}-{start + length}" for start, length in ranges) + "\n\n" + "\n".join(map(str, ids))
+
+
+def valid_day05(case: tuple) -> bool:
+    ranges, ids = case
+    return bool(ranges) and bool(ids) and all(start >= 1 for start, _ in ranges) and all(ids)
+
+
+def oracle_day05(text: str) -> dict:
+    ranges, ids = text.split("\n\n")
+    fresh = set()
+    for line in ranges.split("\n"):
+        start, end = map(int, line.split("-"))
+        fresh.update(range(start, end + 1))
+    return {"Part One": sum(int(id) in fresh for id in ids.split("\n")), "Part Two": len(fresh)}
+
+
+# Day 6: a few problems as (operator, align left, longest first, operands); every problem has the same number of operands
+def gen_day06(rng: random.Random) -> list:
+    n_operands = rng.randint(2, 4)
+    return [(rng.randint(0, 1), rng.randint(0, 1), rng.randint(0, 1),
+             tuple(rng.randint(1, 10 ** rng.randint(1, 3) - 1) for _ in range(n_operands)))
+            for _ in range(rng.randint(1, 4))]
+
+
+def render_day06(case: list) -> str:
+    rows = [[] for _ in range(len(case[0][3]) + 1)]
+    for operator, align_left, longest_first, operands in case:
+        # Like the real worksheets, lengths grow or shrink monotonically down a problem, so no digit column has a gap
+        numbers = sorted(map(str, operands), key=len, reverse=bool(longest_first))
+        width = max(map(len, numbers))
+        for row, number in zip(rows, numbers):
+            row.append(number.ljust(width) if align_left else number.rjust(width))
+        rows[-1].append("+*"[operator % 2].ljust(width))
+    return "\n".join(" ".join(row) for row in rows)
+
+
+def valid_day06(case: list) -> bool:
+    return bool(case) and all(operands and all(operands) for *_, operands in case)
+
+
+def oracle_day06(text: str) -> dict:
+    lines = text.split("\n")
+    width = max(map(len, lines))
+    lines = [line.ljust(width) for line in lines]
+    blank = [all(line[col] == " " for line in lines) for col in range(width)] + [True]
+
+    def evaluate(numbers: list, operator: str) -> int:
+        result = 1 if operator == "*" else 0
+        for number in numbers:
+            result = result * number if operator == "*" else result + number
+        return result
+
+    by_rows, by_columns = 0, 0
+    start = 0
+    for col in range(width + 1):
+        if not blank[col]:
+            continue
+        if col > start:  # A problem spans the columns between two blank ones
+            operands = [line[start:col] for line in lines[:-1]]
+            operator = lines[-1][start:col].strip()
+            by_rows += evaluate([int(row) for row in operands if row.strip()], operator)
+            columns = ["".join(row[idx] for row in operands).strip() for idx in range(col - start)]
+            by_columns += evaluate([int(column) for column in columns if column], operator)
+        start = col + 1
+    return {"Part One": by_rows, "Part Two": by_columns}
+
+
+# Day 7: a manifold as (width, start column, rows of splitter columns); an empty row follows the start and every splitter row
+def gen_day07(rng: random.Random) -> tuple:
+    width = rng.randint(3, 12)
+    rows = [[col for col in range(1, width - 1) if rng.random() < 0.4] for _ in range(rng.randint(0, 6))]
+    return width, rng.randint(0, width - 1), rows
+
+
+def render_day07(case: tuple) -> str:
+    width, start, rows = case
+    lines = ["." * start + "S" + "." * (width - start - 1)]
+    for columns in rows:
+        row = ["."] * width
+        for col in sorted(set(columns)):
+            # Splitters are never on the edge or next to each other
+            if 1 <= col < width - 1 and row[col - 1] != "^":
+                row[col] = "^"
+        lines += ["." * width, "".join(row)]
+    return "\n".join(lines)
+
+
+def valid_day07(case: tuple) -> bool:
+    width, start, _ = case
+    return width >= 3 and start < width
+
+
+def oracle_day07(text: str) -> dict:
+    lines = text.split("\n")
+    timelines = {lines[0].index("S"): 1}
+    splits = 0
+    for row in lines[1:]:
+        next_timelines = {}
+        for col, count in timelines.items():
+            targets = [col - 1, col + 1] if row[col] == "^" else [col]
+            splits += row[col] == "^"
+            for target in targets:
+                if 0 <= target < len(row):
+                    next_timelines[target] = next_timelines.get(target, 0) + count
+        timelines = next_timelines
+    return {"Part One": splits, "Part Two": sum(timelines.values())}
+
+
+# Day 8: junction boxes in 3-5 far-apart clusters, so the 1000 closest pairs leave at least three circuits.
+# Tight clusters have many equally distant pairs, which is where float and integer distances could order differently.
+def gen_day08(rng: random.Random) -> list:
+    spread = rng.choice([4, 50, 3000])
+    points = []
+    for cluster in range(rng.randint(3, 5)):
+        for _ in range(rng.randint(24, 30)):
+            points.append(tuple(20_000 * cluster * (axis == cluster % 3) + rng.randint(0, spread) for axis in range(3)))
+    rng.shuffle(points)
+    return points
+
+
+def render_day08(case: list) -> str:
+    return "\n".join(f"{x},{y},{z}" for x, y, z in case)
+
+
+def valid_day08(case: list) -> bool:
+    return len(case) * (len(case) - 1) // 2 >= 1000  # Part One connects exactly 1000 pairs
+
+
+def oracle_day08(text: str) -> dict:
+    points = [tuple(map(int, line.split(","))) for line in text.split("\n")]
+    pairs = sorted((sum((a - b) ** 2 for a, b in zip(points[i], points[j])), i, j)
+                   for i, j in combinations(range(len(points)), 2))
+    circuit = list(range(len(points)))  # Circuit id of every box, relabelled on every merge
+
+    def connect(i: int, j: int) -> bool:
+        old, new = circuit[j], circuit[i]
+        if old == new:
+            return False
+        circuit[:] = [new if label == old else label for label in circuit]
+        return True
+
+    for _, i, j in pairs[:1000]:
+        connect(i, j)
+    sizes = sorted((circuit.count(label) for label in set(circuit)), reverse=True)
+    if len(sizes) < 3:
+        raise ValueError("fewer than three circuits after 1000 connections")
+    answers = {"Part One": sizes[0] * sizes[1] * sizes[2]}
+
+    for _, i, j in pairs[1000:]:
+        if connect(i, j) and len(set(circuit)) == 1:
+            answers["Part Two"] = points[i][0] * points[j][0]
+            break
+    return answers
+
+
+# Day 9: a rectilinear polygon of columns (width, height above the middle, depth below it), walked from vertex
+# `rotation`, clockwise or not. The top and bottom outlines never touch, so the polygon is always simple.
+# Coordinates are doubled: like in the real input, no two edges lie on neighbouring rows or columns, where
+# the tiles between them (none) and the area between them (a strip of width 1) would disagree.
+def gen_day09(rng: random.Random) -> tuple:
+    columns = [(rng.randint(0, 4), rng.randint(0, 4), rng.randint(0, 4)) for _ in range(rng.randint(1, 5))]
+    return rng.randint(0, 20), rng.randint(0, 1), columns
+
+
+def render_day09(case: tuple) -> str:
+    rotation, reverse, columns = case
+    middle = max(depth for _, _, depth in columns)
+    xs = [0]
+    for width, _, _ in columns:
+        xs.append(xs[-1] + width + 1)
+
+    vertices = []
+    for idx, (_, height, _) in enumerate(columns):
+        vertices += [(xs[idx], middle + 1 + height), (xs[idx + 1], middle + 1 + height)]
+    for idx in range(len(columns) - 1, -1, -1):
+        vertices += [(xs[idx + 1], middle - columns[idx][2]), (xs[idx], middle - columns[idx][2])]
+
+    # Drop repeated vertices and those in the middle of a straight edge (equal neighbouring columns)
+    changed = True
+    while changed:
+        changed = False
+        for idx in range(len(vertices)):
+            (px, py), (x, y), (nx, ny) = vertices[idx - 1], vertices[idx], vertices[(idx + 1) % len(vertices)]
+            if (px == x == nx) or (py == y == ny) or (px, py) == (x, y):
+                del vertices[idx]
+                changed = True
+                break
+
+    start = rotation % len(vertices)
+    vertices = vertices[start:] + vertices[:start]
+    if reverse % 2:
+        vertices.reverse()
+    return "\n".join(f"{2 * x},{2 * y}" for x, y in vertices)
+
+
+def valid_day09(case: tuple) -> bool:
+    return bool(case[2])
+
+
+def oracle_day09(text: str) -> dict:
+    red = [tuple(map(int, line.split(","))) for line in text.split("\n")]
+    edges = list(zip(red, red[1:] + red[:1]))
+
+    def allowed(x: int, y: int) -> bool:
+        crossings = 0
+        for (x1, y1), (x2, y2) in edges:
+            if min(x1, x2) <= x <= max(x1, x2) and min(y1, y2) <= y <= max(y1, y2):
+                return True  # On the boundary
+            if x1 == x2 and x1 > x and min(y1, y2) <= y < max(y1, y2):
+                crossings += 1
+        return crossings % 2 == 1
+
+    tiles = {(x, y) for x in range(max(x for x, _ in red) + 1) for y in range(max(y for _, y in red) + 1) if allowed(x, y)}
+    largest, largest_inside = 0, 0
+    for (x1, y1), (x2, y2) in combinations(red, 2):
+        area = (abs(x1 - x2) + 1) * (abs(y1 - y2) + 1)
+        largest = max(largest, area)
+        if area > largest_inside and all((x, y) in tiles for x in range(min(x1, x2), max(x1, x2) + 1)
+                                         for y in range(min(y1, y2), max(y1, y2) + 1)):
+            largest_inside = area
+    return {"Part One": largest, "Part Two": largest_inside}
+
+
+# Day 10: a few machines, each a list of buttons as (lights, pressed for the diagram, presses for the joltages)
+def gen_day10(rng: random.Random) -> list:
+    machines = []
+    for _ in range(rng.randint(1, 3)):
+        n_lights = rng.randint(2, 4)
+        machines.append([(sorted(rng.sample(range(n_lights), rng.randint(1, n_lights))), rng.randint(0, 1), rng.randint(0, 3))
+                         for _ in range(rng.randint(2, 4))])
+    return machines
+
+
+def render_day10(case: list) -> str:
+    lines = []
+    for buttons in case:
+        n_lights = 1 + max(light for lights, _, _ in buttons for light in lights)
+        diagram, joltages = [0] * n_lights, [0] * n_lights
+        for lights, toggled, presses in buttons:
+            for light in set(lights):
+                diagram[light] ^= toggled % 2
+                joltages[light] += presses
+        wiring = " ".join("(" + ",".join(map(str, sorted(set(lights)))) + ")" for lights, _, _ in buttons)
+        lines.append(f"[{''.join('#' if light else '.' for light in diagram)}] {wiring} {{{','.join(map(str, joltages))}}}")
+    return "\n".join(lines)
+
+
+def valid_day10(case: list) -> bool:
+    return bool(case) and all(buttons and all(lights for lights, _, _ in buttons) for buttons in case)
+
+
+def oracle_day10(text: str) -> dict:
+    fewest_toggles, fewest_presses = 0, 0
+    for line in text.split("\n"):
+        diagram, *wiring, joltages = line.split()
+        buttons = [tuple(map(int, button[1:-1].split(","))) for button in wiring]
+        target = [light == "#" for light in diagram[1:-1]]
+        joltages = tuple(map(int, joltages[1:-1].split(",")))
+
+        fewest_toggles += min(sum(pressed) for pressed in product((0, 1), repeat=len(buttons))
+                              if [sum(p for p, button in zip(pressed, buttons) if light in button) % 2 == 1
+                                  for light in range(len(target))] == target)
+
+        @lru_cache(maxsize=None)
+        def presses(idx: int, remaining: tuple) -> float:
+            if not any(remaining):
+                return 0
+            if idx == len(buttons):
+                return float("inf")
+            best = float("inf")
+            for count in range(min(remaining[light] for light in buttons[idx]) + 1):
+                rest = tuple(left - count * (light in buttons[idx]) for light, left in enumerate(remaining))
+                best = min(best, count + presses(idx + 1, rest))
+            return best
+
+        fewest_presses += presses(0, joltages)
+    return {"Part One": fewest_toggles, "Part Two": fewest_presses}
+
+
+# Day 11: a device DAG as (devices 0-7 that are svr, you, fft and dac; edges). Device 8 is 'out', edges always point
+# to the higher-numbered device, and devices without outputs feed straight into 'out'.
+DAY11_NAMES = ("aaa", "bbb", "ccc", "ddd", "eee", "fff", "ggg", "hhh")
+
+
+def gen_day11(rng: random.Random) -> tuple:
+    return tuple(rng.sample(range(8), 4)), [(rng.randint(0, 8), rng.randint(0, 8)) for _ in range(rng.randint(5, 20))]
+
+
+def render_day11(case: tuple) -> str:
+    special, edges = case
+    names = list(DAY11_NAMES) + ["out"]
+    for device, name in zip(special, ("svr", "you", "fft", "dac")):
+        names[device] = name
+    outputs = {device: [] for device in range(8)}
+    for a, b in edges:
+        if a != b and names[max(a, b)] not in outputs[min(a, b)]:
+            outputs[min(a, b)].append(names[max(a, b)])
+    return "\n".join(f"{names[device]}: {' '.join(outputs[device] or ['out'])}" for device in range(8))
+
+
+def valid_day11(case: tuple) -> bool:
+    special, edges = case
+    return len(set(special)) == 4 and max(special) < 8 and all(max(edge) <= 8 for edge in edges)
+
+
+def oracle_day11(text: str) -> dict:
+    outputs = {line.split(":")[0]: line.split(":")[1].split() for line in text.split("\n")}
+
+    def paths(device: str, seen: frozenset) -> list:
+        if device == "out":
+            return [seen]
+        return [path for output in outputs[device] for path in paths(output, seen | {output})]
+
+    return {"Part One": len(paths("you", frozenset())),
+            "Part Two": sum({"dac", "fft"} <= path for path in paths("svr", frozenset()))}
+
+
+# Day 12: six 3x3 shapes, each missing two cells, and a few small regions as (width, height, quantities)
+def gen_day12(rng: random.Random) -> tuple:
+    shapes = []
+    while len(shapes) < 6:
+        shape = tuple(rng.sample(range(9), 2))
+        if valid_shape(shape):
+            shapes.append(shape)
+    regions = []
+    for _ in range(rng.randint(1, 3)):
+        width, height = rng.randint(3, 6), rng.randint(3, 6)
+        quantities = [0] * 6
+        for _ in range(rng.randint(0, width * height // 7)):
+            quantities[rng.randrange(6)] += 1
+        regions.append((width, height, tuple(quantities)))
+    return tuple(shapes), regions
+
+
+def valid_shape(missing: tuple) -> bool:
+    """Whether a 3x3 shape without the two `missing` cells is in one piece."""
+    cells = {cell for cell in range(9) if cell not in missing}
+    if len(cells) != 7:
+        return False
+    reached, pending = set(), [min(cells)]
+    while pending:
+        cell = pending.pop()
+        if cell in cells and cell not in reached:
+            reached.add(cell)
+            pending += [cell - 3, cell + 3] + ([cell - 1] if cell % 3 else []) + ([cell + 1] if cell % 3 < 2 else [])
+    return reached == cells
+
+
+def render_day12(case: tuple) -> str:
+    shapes, regions = case
+    sections = [f"{idx}:\n" + "\n".join("".join("." if r * 3 + c in missing else "#" for c in range(3)) for r in range(3))
+                for idx, missing in enumerate(shapes)]
+    return "\n\n".join(sections) + "\n\n" + "\n".join(f"{width}x{height}: {' '.join(map(str, quantities))}"
+                                                       for width, height, quantities in regions)
+
+
+def valid_day12(case: tuple) -> bool:
+    shapes, regions = case
+    return all(max(missing) < 9 and valid_shape(missing) for missing in shapes) and bool(regions) \
+        and all(width and height for width, height, _ in regions)
+
+
+def oracle_day12(text: str) -> dict:
+    *shape_sections, region_section = text.split("\n\n")
+    orientations = []
+    for section in shape_sections:
+        cells = [(r, c) for r, line in enumerate(section.split("\n")[1:]) for c, ch in enumerate(line) if ch == "#"]
+        variants = set()
+        for _ in range(4):
+            cells = [(c, -r) for r, c in cells]  # Rotate
+            for variant in (cells, [(r, -c) for r, c in cells]):  # ... and mirror
+                # Anchor on the first cell in reading order, which is the one that covers the first free cell
+                top, left = min(variant)
+                variants.add(tuple(sorted((r - top, c - left) for r, c in variant)))
+        orientations.append(variants)
+
+    def fits(width: int, height: int, quantities: list) -> bool:
+        free = [[True] * width for _ in range(height)]
+        slack = width * height - sum(q * len(next(iter(o))) for q, o in zip(quantities, orientations))
+
+        def search(pos: int, spare: int) -> bool:
+            if not any(quantities):
+                return True
+            while pos < width * height and not free[pos // width][pos % width]:
+                pos += 1
+            if pos == width * height:
+                return False
+            row, col = divmod(pos, width)
+            # The first free cell is either covered by a piece anchored on it, or stays empty
+            for shape, variants in enumerate(orientations):
+                if not quantities[shape]:
+                    continue
+                for variant in variants:
+                    cells = [(row + r, col + c) for r, c in variant]
+                    if all(0 <= r < height and 0 <= c < width and free[r][c] for r, c in cells):
+                        for r, c in cells:
+                            free[r][c] = False
+                        quantities[shape] -= 1
+                        found = search(pos + 1, spare)
+                        quantities[shape] += 1
+                        for r, c in cells:
+                            free[r][c] = True
+                        if found:
+                            return True
+            if spare > 0:
+                free[row][col] = False
+                found = search(pos + 1, spare - 1)
+                free[row][col] = True
+                return found
+            return False
+
+        return slack >= 0 and search(0, slack)
+
+    count = 0
+    for line in region_section.split("\n"):
+        size, quantities = line.split(": ")
+        width, height = map(int, size.split("x"))
+        count += fits(width, height, list(map(int, quantities.split())))
+    return {"Part One": count}
+
+
+SPECS = {
+    1: FuzzSpec(gen_day01, render_day01, valid_day01, oracle_day01),
+    2: FuzzSpec(gen_day02, render_day02, valid_day02, oracle_day02),
+    3: FuzzSpec(gen_day03, render_day03, valid_day03, oracle_day03),
+    4: FuzzSpec(gen_day04, render_day04, valid_day04, oracle_day04),
+    5: FuzzSpec(gen_day05, render_day05, valid_day05, oracle_day05),
+    6: FuzzSpec(gen_day06, render_day06, valid_day06, oracle_day06),
+    7: FuzzSpec(gen_day07, render_day07, valid_day07, oracle_day07),
+    8: FuzzSpec(gen_day08, render_day08, valid_day08, oracle_day08),
+    9: FuzzSpec(gen_day09, render_day09, valid_day09, oracle_day09),
+    10: FuzzSpec(gen_day10, render_day10, valid_day10, oracle_day10),
+    11: FuzzSpec(gen_day11, render_day11, valid_day11, oracle_day11),
+    12: FuzzSpec(gen_day12, render_day12, valid_day12, oracle_day12),
+}
@@ -0,0 +1,225 @@
+"""
+Differential fuzzing of the solution variants.
+
+Every variant of a day (and the day's brute-force oracle from fuzz_cases.py) is run on random small inputs.
+Any input where they disagree on a part is shrunk to a minimal counterexample that still shows the same
+disagreement, then saved to FUZZ_DIR.
+"""
+import os
+import random
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import event_utils
+import fuzz_cases
+import registry
+
+FUZZ_DIR = Path(__file__).parent / ".aoc_cache" / "fuzz"
+ORACLE = "oracle"
+
+
+@dataclass(frozen=True)
+class Failure:
+    """A part that raised instead of answering; failures compare equal if they raised the same exception type."""
+    error: str
+    message: str = field(compare=False)
+
+    def __str__(self) -> str:
+        return f"{self.error}: {self.message}" if self.message else self.error
+
+
+@dataclass
+class Counterexample:
+    day: int
+    part: str
+    text: str  # Minimal input that still shows the disagreement
+    answers: dict[str, Any]  # Variant (or ORACLE) -> answer or Failure
+    case_id: str  # Seed and case number of the random input it was shrunk from
+    original_size: int  # Bytes of that input
+    path: Path | None = None
+
+
+def run_part(solution: registry.Solution, part: str, text: str) -> Any:
+    """Answer of one part for an input, parsed afresh so parts that consume or modify their input can't interfere."""
+    try:
+        with event_utils.muted():  # Some parts report progress
+            return solution.parts()[part](*solution.parse(text))
+    except Exception as exc:
+        return Failure(type(exc).__name__, str(exc))
+
+
+def outcomes(text: str, solutions: list[registry.Solution], oracle: Callable | None) -> dict[str, dict[str, Any]] | None:
+    """Answers per part and per variant (plus the oracle), or None if the oracle rejects the input."""
+    results = {}
+    if oracle is not None:
+        try:
+            for part, answer in oracle(text).items():
+                results.setdefault(part, {})[ORACLE] = answer
+        except Exception:
+            return None
+    for solution in solutions:
+        for part in solution.parts():
+            results.setdefault(part, {})[solution.variant] = run_part(solution, part, text)
+    return results
+
+
+def disagreements(results: dict[str, dict[str, Any]]) -> list[str]:
+    """Parts on which the variants (and oracle) don't all give the same answer."""
+    parts = []
+    for part, answers in results.items():
+        values = list(answers.values())
+        if any(value != values[0] for value in values[1:]):
+            parts.append(part)
+    return parts
+
+
+def walk(case: Any, path: tuple = ()) -> Iterator[tuple[tuple, Any]]:
+    """Every (path, value) in a nested case, containers before their elements."""
+    yield path, case
+    if isinstance(case, (list, tuple)):
+        for idx, item in enumerate(case):
+            yield from walk(item, path + (idx,))
+
+
+def replace(case: Any, path: tuple, value: Any) -> Any:
+    """Copy of a nested case with the value at path replaced."""
+    if not path:
+        return value
+    items = list(case)
+    items[path[0]] = replace(items[path[0]], path[1:], value)
+    return type(case)(items)
+
+
+def shrink_candidates(case: Any) -> Iterator[Any]:
+    """
+    Smaller variants of a case, roughly most promising first.
+
+    Lists first lose runs of elements (halves, then quarters, ... then single elements), then ints are
+    lowered towards 0 (to 0, to half and by one).
+    """
+    nodes = list(walk(case))
+    for path, value in nodes:
+        if isinstance(value, list):
+            size = len(value) // 2
+            while size >= 1:
+                for start in range(0, len(value) - size + 1, size):
+                    yield replace(case, path, value[:start] + value[start + size:])
+                size //= 2
+    for path, value in nodes:
+        if isinstance(value, int) and value > 0:
+            for smaller in dict.fromkeys((0, value // 2, value - 1)):
+                yield replace(case, path, smaller)
+
+
+def shrink(case: Any, still_fails: Callable[[Any], bool], max_checks: int = 2000) -> Any:
+    """Greedily replace a failing case by its first smaller variant that still fails, until none does (or max_checks)."""
+    checks = 0
+    improved = True
+    while improved and checks < max_checks:
+        improved = False
+        for candidate in shrink_candidates(case):
+            checks += 1
+            if still_fails(candidate):
+                case, improved = candidate, True
+                break
+            if checks >= max_checks:
+                break
+    return case
+
+
+@contextmanager
+def parse_cache_disabled() -> Iterator[None]:
+    """Turn off the parsed-input cache (AOC_PARSE_CACHE=0) for the duration, then restore the previous setting."""
+    previous = os.environ.get("AOC_PARSE_CACHE")
+    os.environ["AOC_PARSE_CACHE"] = "0"
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop("AOC_PARSE_CACHE", None)
+        else:
+            os.environ["AOC_PARSE_CACHE"] = previous
+
+
+def fuzz_day(day: int, cases: int = 200, seed: int = 0, max_checks: int = 2000) -> tuple[int, list[Counterexample]]:
+    """
+    Run every variant of a day (and its oracle) on `cases` random inputs.
+
+    Returns the number of well-formed inputs checked and a shrunk counterexample for every part on which
+    they disagreed (the first one found per part). Counterexamples are also saved to FUZZ_DIR.
+    """
+    spec = fuzz_cases.SPECS[day]
+    solutions = registry.discover([day])
+    if len(solutions) + (spec.oracle is not None) < 2:
+        return 0, []
+
+    def check(case: Any) -> dict | None:
+        return outcomes(spec.render(case), solutions, spec.oracle) if spec.valid(case) else None
+
+    checked = 0
+    found = {}
+    with parse_cache_disabled():  # Thousands of throwaway inputs shouldn't end up in the parsed-input cache
+        for idx in range(cases):
+            case = spec.generate(random.Random(f"{day}-{seed}-{idx}"))
+            results = check(case)
+            if results is None:
+                continue
+            checked += 1
+
+            for part in disagreements(results):
+                if part in found:
+                    continue
+
+                def still_fails(candidate: Any, part: str = part) -> bool:
+                    candidate_results = check(candidate)
+                    return candidate_results is not None and part in disagreements(candidate_results)
+
+                smallest = shrink(case, still_fails, max_checks)
+                text = spec.render(smallest)
+                found[part] = Counterexample(day, part, text, outcomes(text, solutions, spec.oracle)[part],
+                                             f"seed {seed}, case {idx}", len(spec.render(case)))
+
+    for stale in FUZZ_DIR.glob(f"Day{day:02d}_*.txt"):  # Counterexamples of earlier runs that no longer apply
+        stale.unlink()
+    for counterexample in found.values():
+        FUZZ_DIR.mkdir(parents=True, exist_ok=True)
+        counterexample.path = FUZZ_DIR / f"Day{day:02d}_{counterexample.part.replace(' ', '_')}.txt"
+        counterexample.path.write_text(counterexample.text)
+
+    return checked, list(found.values())
+
+
+def print_fuzz_report(day: int, checked: int, counterexamples: list[Counterexample]) -> None:
+    """Print the outcome of fuzzing a day, with every counterexample and the answers it gets."""
+    sources = [solution.variant for solution in registry.discover([day])]
+    if fuzz_cases.SPECS[day].oracle is not None:
+        sources.append(ORACLE)
+    if len(sources) < 2:
+        print(f"Day {day}: only {sources[0]}, nothing to compare against")
+        return
+
+    verdict = "no disagreements" if not counterexamples else f"{len(counterexamples)} part(s) disagree"
+    print(f"Day {day}: {checked} inputs, {' vs '.join(sources)}: {verdict}")
+    for counterexample in counterexamples:
+        print(f"\n  {counterexample.part}, shrunk from {counterexample.original_size} to {len(counterexample.text)} bytes "
+              f"({counterexample.case_id}):")
+        for line in counterexample.text.split("\n"):
+            print(f"    | {line}")
+        for source, answer in counterexample.answers.items():
+            print(f"    {source:<16} {answer}")
+        print(f"  Saved to {counterexample.path}")
+    print()
+
+
+def fuzz_days(days: list[int], cases: int = 200, seed: int = 0) -> bool:
+    """Fuzz the variants of every given day and print the reports; True if no part disagreed anywhere."""
+    clean = True
+    for day in days:
+        if day not in fuzz_cases.SPECS or not registry.solution_files(day):
+            continue
+        checked, counterexamples = fuzz_day(day, cases, seed)
+        print_fuzz_report(day, checked, counterexamples)
+        clean = clean and not counterexamples
+    return clean
@@ -0,0 +1,80 @@
+import pstats
+from pathlib import Path
+
+# Frames of the run_all/timer machinery; hidden from reports and flamegraphs so the solution's own functions stand out
+HIDDEN_FILES = ("timer_utils.py", "event_utils.py", "run_all.py", "registry.py", "contextlib.py", "cProfile.py")
+HIDDEN_FUNCTIONS = ("<built-in method builtins.exec>", "<built-in method time.perf_counter>", "<method 'enable' of '_lsprof.Profiler' objects>",
+                    "<method 'disable' of '_lsprof.Profiler' objects>")
+
+
+def is_hidden(func: tuple) -> bool:
+    """Whether a pstats function key (filename, lineno, name) belongs to the profiling/timing machinery."""
+    filename, _, name = func
+    return Path(filename).name in HIDDEN_FILES or name in HIDDEN_FUNCTIONS
+
+
+def function_label(func: tuple) -> str:
+    """Readable label for a pstats function key, e.g. "Day12/solution_ai.py:197(backtrack)"."""
+    filename, lineno, name = func
+    if filename == "~":  # Built-ins
+        return name
+    path = Path(filename)
+    return f"{path.parent.name}/{path.name}:{lineno}({name})"
+
+
+def print_profile_report(stats: pstats.Stats, top: int = 20) -> None:
+    """Print the top functions by own (self) time, with their call counts and cumulative time."""
+    rows = [(func, primitive_calls, total_calls, own_time, cumulative_time)
+            for func, (primitive_calls, total_calls, own_time, cumulative_time, _) in stats.stats.items()
+            if not is_hidden(func)]
+    rows.sort(key=lambda row: row[3], reverse=True)
+
+    print(f"{'Calls':>12} {'Own':>12} {'Cumulative':>12}  Function")
+    for func, primitive_calls, total_calls, own_time, cumulative_time in rows[:top]:
+        calls = f"{total_calls}/{primitive_calls}" if total_calls != primitive_calls else str(total_calls)
+        print(f"{calls:>12} {own_time * 1000:>10.3f}ms {cumulative_time * 1000:>10.3f}ms  {function_label(func)}")
+
+
+def collapsed_stacks(stats: pstats.Stats) -> dict[str, float]:
+    """
+    Reconstruct collapsed stacks ("a;b;c" -> self time in seconds) from a profile's call graph.
+
+    cProfile only records caller -> callee edges, so each callee's time is split over stacks in proportion
+    to the time spent under each caller (the usual approximation used by pstats-based flamegraphs).
+    Recursive calls are folded into the first occurrence of a function on the stack, and hidden frames
+    are skipped, so their callees attach to the nearest visible caller.
+    """
+    callees = {}
+    for func, (*_, callers) in stats.stats.items():
+        for caller, (_, _, _, cumulative_time) in callers.items():
+            callees.setdefault(caller, []).append((func, cumulative_time))
+
+    roots = [func for func, (*_, callers) in stats.stats.items() if not callers]
+    stacks = {}
+
+    def walk(func: tuple, stack: tuple, on_stack: set, time_under: float) -> None:
+        _, _, own_time, cumulative_time, _ = stats.stats[func]
+        share = time_under / cumulative_time if cumulative_time else 0.0
+        if not is_hidden(func):
+            stack = stack + (function_label(func),)
+            if own_time:
+                key = ";".join(stack)
+                stacks[key] = stacks.get(key, 0.0) + own_time * share
+        for callee, edge_time in callees.get(func, []):
+            # Prune branches under a microsecond; they'd be invisible anyway and keep large call graphs tractable
+            if callee not in on_stack and edge_time * share >= 1e-6:
+                walk(callee, stack, on_stack | {callee}, edge_time * share)
+
+    for root in roots:
+        walk(root, (), {root}, stats.stats[root][3])
+
+    return stacks
+
+
+def write_collapsed(stats: pstats.Stats, path: Path) -> None:
+    """Write collapsed stacks in the format read by flamegraph.pl, inferno, speedscope, ... (microsecond weights)."""
+    with open(path, "w") as f:
+        for stack, seconds in sorted(collapsed_stacks(stats).items()):
+            weight = round(seconds * 1_000_000)
+            if weight:
+                f.write(f"{stack} {weight}\n")
@@ -0,0 +1,112 @@
+"""
+Registry of the solution modules (DayXX/solution*.py), imported with importlib instead of run as scripts.
+
+Every solution module exposes
+    parse(input_data)   -> what both parts work on (a tuple is passed as their positional arguments)
+    part_one(*parsed)   -> the answer of Part One
+    part_two(*parsed)   -> the answer of Part Two
+and optionally load_input(day), returning what parse() gets for the day's own input (by default the
+input text from get_input(), but e.g. memory-mapped lines or a StreamedInput). For reporting, a module
+may also define TITLE ("Day 1 - Secret Entrance") and ANSWER_LABELS, the text before each part's answer.
+
+Importing a solution doesn't run its `if __name__ == "__main__"` block, so the files still work as scripts.
+"""
+import importlib.util
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+from aoc_utils import get_input
+
+ROOT = Path(__file__).parent
+
+# Functions every solution module must define
+REQUIRED_FUNCTIONS = ("parse", "part_one", "part_two")
+
+
+@dataclass
+class Solution:
+    """An imported solution variant of a day."""
+    day: int
+    path: Path
+    module: ModuleType
+    import_ms: float = 0.0  # Time taken to import the module (0 if it was already imported)
+
+    @property
+    def variant(self) -> str:
+        return self.path.name
+
+    def load_input(self) -> Any:
+        """What parse() gets for the day's own input."""
+        return getattr(self.module, "load_input", get_input)(self.day)
+
+    def parse(self, input_data: Any) -> tuple:
+        """Parse an input into the positional arguments of the parts."""
+        parsed = self.module.parse(input_data)
+        return parsed if isinstance(parsed, tuple) else (parsed,)
+
+    @property
+    def title(self) -> str | None:
+        return getattr(self.module, "TITLE", None)
+
+    def answer_text(self, part: str, answer: Any) -> str:
+        """
+        The line reporting a part's answer, worded by the module's ANSWER_LABELS (or "Part One: <answer>").
+
+        A part without an answer (returning None, like Day 12 Part Two) is reported by its label alone,
+        which then says why, or as "<part>: no answer".
+        """
+        label = getattr(self.module, "ANSWER_LABELS", {}).get(part)
+        if answer is None:
+            return label or f"{part}: no answer"
+        return f"{label or part + ':'} {answer}"
+
+    def parts(self) -> dict[str, Callable]:
+        return {"Part One": self.module.part_one, "Part Two": self.module.part_two}
+
+    def solve(self, input_data: Any = None) -> dict[str, Any]:
+        """Answers of both parts (for the day's own input if input_data is None), without timing or printing."""
+        args = self.parse(self.load_input() if input_data is None else input_data)
+        return {label: part(*args) for label, part in self.parts().items()}
+
+
+def solution_files(day: int) -> list[Path]:
+    """Every solution*.py variant of a day, with the original solution.py first."""
+    return sorted((ROOT / f"Day{day:02d}").glob("solution*.py"), key=lambda path: (path.name != "solution.py", path.name))
+
+
+def load_solution(path: Path) -> Solution:
+    """
+    Import a solution file as module "DayXX.<name>" (once per process; later calls reuse the module).
+
+    The regular source loader is used, so compiled bytecode is cached in __pycache__ like for any import.
+    """
+    path = Path(path).resolve()
+    name = f"{path.parent.name}.{path.stem}"
+    day = int(path.parent.name.removeprefix("Day"))
+    if name in sys.modules:
+        return Solution(day, path, sys.modules[name])
+
+    start_time = time.perf_counter()
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    import_ms = (time.perf_counter() - start_time) * 1000
+
+    missing = [func for func in REQUIRED_FUNCTIONS if not callable(getattr(module, func, None))]
+    if missing:
+        raise AttributeError(f"{path} does not define {', '.join(missing)}")
+    return Solution(day, path, module, import_ms)
+
+
+def discover(days: list[int]) -> list[Solution]:
+    """Import every solution variant of the given days."""
+    return [load_solution(path) for day in days for path in solution_files(day)]
@@ -1,43 +1,729 @@
+import argparse
+import ast
+import cProfile
+import hashlib
+import json
+import multiprocessing
+import os
+import pstats
+import statistics
+import subprocess
+import sys
+import time
 from pathlib import Path
-from timer_utils import timer
-from contextlib import redirect_stdout
-
-@timer(name="All Solutions")
-def run_day(day_num: int) -> None:
-    """Run both solution files for a given day."""
-    day_path = Path(f"Day{day_num:02d}")
-    if not day_path.exists():
+import aoc_utils
+import bench_utils
+import event_utils
+import fuzz_utils
+import profile_utils
+import registry
+import synthetic_inputs
+import timer_utils
+from timer_utils import timer, span
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Callable
+
+try:
+    import resource  # Unix only; --memory-limit is not available elsewhere
+except ImportError:
+    resource = None
+
+OUTPUT_FILE = "AOC_2025_Output.txt"
+
+# Answers and output of solutions, replayed while neither the solution (nor a repo module it imports) nor its input changes
+RESULT_CACHE_DIR = Path(".aoc_cache") / "results"
+# Least recently replayed results are evicted beyond this size (override with AOC_RESULT_CACHE_MAX_MB)
+RESULT_CACHE_MAX_BYTES = int(os.getenv("AOC_RESULT_CACHE_MAX_MB", "64")) * 1024 * 1024
+# Modules that run a solution and build its records, so a change to them invalidates every cached result
+RUNNER_FILES = (Path(__file__), Path(registry.__file__))
+
+# Where --profile writes its .pstats and collapsed-stack files
+PROFILE_DIR = Path(".aoc_cache") / "profiles"
+
+# Per-part timings and benchmark results (as dicts labelled with day and solution file) gathered during this run
+timing_records = []
+benchmark_records = []
+# Trace spans received from worker processes (spans of this process are kept by timer_utils)
+trace_spans = []
+
+# Steps of a solution in the order run_solution times them (to tell where a day stopped by its budget was)
+SOLUTION_STEPS = ("Parse", "Part One", "Part Two")
+
+# Exit status of a day's child process that ran out of memory under --memory-limit
+OOM_EXIT_CODE = 3
+
+
+def timed_part(solution: registry.Solution, label: str, part: Callable) -> Callable:
+    """Wrap a registered part for time_both_parts: timed under its label, emitting its answer as a "result" event."""
+    @timer(name=label)
+    def run_part(*args) -> None:
+        answer = part(*args)
+        event_utils.result(label, answer, solution.answer_text(label, answer))
+    return run_part
+
+
+def run_solution(solution: registry.Solution) -> None:
+    """Load and parse a solution's input (parsing timed as "Parse"), then time both parts on it."""
+    with span(solution.variant, kind="variant"), event_utils.context(day=solution.day, variant=solution.variant):
+        if solution.title:
+            event_utils.emit("title", title=solution.title)
+        parts = [timed_part(solution, label, part) for label, part in solution.parts().items()]
+        timer_utils.time_both_parts(*parts, solution.load_input(),
+                                    prepare=timer(name="Parse", kind="prepare")(solution.parse))
+
+
+def import_and_run(file_path: Path) -> None:
+    """Import a solution file through the registry (reporting the import time when it isn't imported yet) and run it."""
+    solution = registry.load_solution(file_path)
+    if solution.import_ms:
+        event_utils.emit("import", variant=solution.variant, ms=solution.import_ms)
+    run_solution(solution)
+
+
+def collect_records(day_num: int, solution_file: str, events: list[dict]) -> dict:
+    """
+    Label the timings and benchmark results produced by the solution that just ran with its day and file.
+
+    Timings of parts that reported an answer among the solution's events also get that answer.
+    """
+    answers = event_utils.answers(events)
+    return {
+        "timings": [{"day": day_num, "variant": solution_file, "part": t["name"],
+                     **{key: value for key, value in t.items() if key != "name"},
+                     **({"answer": answers[t["name"]]} if t["name"] in answers else {})}
+                    for t in timer_utils.drain_timings()],
+        "benchmarks": [{"day": day_num, "variant": solution_file, **result.to_dict()}
+                       for result in bench_utils.drain_results()],
+    }
+
+
+def local_imports(file_path: Path) -> list[Path]:
+    """Repo modules (next to the file or at the repo root) imported anywhere in a Python file."""
+    names = set()
+    for node in ast.walk(ast.parse(file_path.read_bytes())):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module.split(".")[0])
+
+    search_dirs = (file_path.parent, Path(__file__).parent)
+    modules = []
+    for name in sorted(names):
+        module = next((path for directory in search_dirs if (path := directory / f"{name}.py").is_file()), None)
+        if module is not None:
+            modules.append(module)
+    return modules
+
+
+def source_hash(file_path: Path) -> str:
+    """
+    SHA-256 (hex) over a solution file, every repo module it imports (directly or through other repo modules),
+    and the runner modules (RUNNER_FILES) that produce its records.
+    """
+    seen = {path.resolve() for path in RUNNER_FILES}
+    pending = [file_path.resolve()]
+    while pending:
+        path = pending.pop()
+        if path not in seen:
+            seen.add(path)
+            pending.extend(module.resolve() for module in local_imports(path))
+
+    digest = hashlib.sha256()
+    for path in sorted(seen):
+        digest.update(path.name.encode() + b"\0" + path.read_bytes() + b"\0")
+    return digest.hexdigest()
+
+
+def result_cache_file(day_num: int, file_path: Path) -> Path | None:
+    """Cache file for a solution's result on its current input and source, or None if the input isn't cached yet."""
+    input_digest = bench_utils.input_hash(day_num)
+    if input_digest is None:
+        return None
+    key = hashlib.sha256(f"{day_num}:{file_path.name}:{input_digest}:{source_hash(file_path)}".encode()).hexdigest()
+    return RESULT_CACHE_DIR / f"Day{day_num:02d}_{file_path.stem}-{key[:32]}.json"
+
+
+def run_and_collect(day_num: int, file_path: Path, memoize: bool = False, force: bool = False) -> dict:
+    """
+    Run a solution file and return its records (see collect_records).
+
+    With memoize, a solution whose input, source and imported repo modules are unchanged since it last ran
+    is not run again: its stored events (answers and the timings measured back then) are replayed and no
+    records are returned, so replays never enter the history. With force, it is always run and the stored
+    result refreshed.
+    """
+    cache_file = result_cache_file(day_num, file_path) if memoize else None
+    if cache_file is not None and cache_file.is_file() and not force:
+        cached = json.loads(cache_file.read_text())
+        os.utime(cache_file)  # Mark as recently used for eviction
+        event_utils.emit("cached", created=cached["created"])
+        event_utils.replay(cached["events"])
+        return {"timings": [], "benchmarks": []}
+
+    with event_utils.capture(passthrough=True) as events:
+        import_and_run(file_path)
+    records = collect_records(day_num, file_path.name, events)
+    if not memoize:
+        return records
+
+    # Solutions fetch missing inputs when they load them, so look the key up again
+    cache_file = cache_file or result_cache_file(day_num, file_path)
+    if cache_file is not None:
+        RESULT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "day": day_num,
+            "variant": file_path.name,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "parts": [{"part": t["part"], "answer": t.get("answer"), "ms": t["ms"]} for t in records["timings"]],
+            "events": events,
+        }
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(entry))
+        os.replace(tmp_file, cache_file)
+        evict_result_cache()
+
+    return records
+
+
+def evict_result_cache(max_bytes: int | None = None) -> None:
+    """Delete the least recently used stored results until RESULT_CACHE_DIR fits in max_bytes."""
+    max_bytes = RESULT_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    entries = []
+    for entry in RESULT_CACHE_DIR.glob("*.json"):
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:  # Evicted by a concurrent run
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry))
+
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, entry in sorted(entries, key=lambda item: item[0]):
+        if total_size <= max_bytes:
+            break
+        entry.unlink(missing_ok=True)
+        total_size -= size
+
+
+def store_records(records: dict) -> None:
+    timing_records.extend(records["timings"])
+    benchmark_records.extend(records["benchmarks"])
+
+
+def history_records() -> list[dict]:
+    """Per-part times of this run for the history store (benchmark medians where available, else single-shot times)."""
+    medians = {(b["day"], b["variant"], b["name"]): b for b in benchmark_records}
+    records = []
+    for t in timing_records:
+        bench = medians.get((t["day"], t["variant"], t["part"]))
+        records.append({**t, "ms": bench["median_ms"], "runs": bench["runs"]} if bench else {**t, "runs": 1})
+    return records
+
+
+@timer(name="All Solutions", kind=None)
+def run_day(day_num: int, memoize: bool = False, force: bool = False) -> None:
+    """Run all solution files for a given day (see run_and_collect for memoize/force)."""
+    solution_files = registry.solution_files(day_num)
+    if not solution_files:
+        return
+
+    event_utils.emit("day", day=day_num)
+
+    with span(f"Day {day_num}", kind="day"):
+        for file_path in solution_files:
+            with event_utils.context(day=day_num, variant=file_path.name):
+                event_utils.emit("variant", variant=file_path.name)
+                store_records(run_and_collect(day_num, file_path, memoize, force))
+            event_utils.flush()
+
+
+def records_from_events(events: list[dict]) -> dict:
+    """
+    The records (see collect_records) of the solutions a child process ran, rebuilt from the events it sent.
+
+    Solutions whose result was replayed from the cache have no records, as in run_and_collect.
+    """
+    cached = {(event["day"], event["variant"]) for event in events if event["type"] == "cached"}
+    events = [event for event in events if (event.get("day"), event.get("variant")) not in cached]
+    answers = {(event["day"], event["variant"], event["part"]): event["answer"] for event in events if event["type"] == "result"}
+    timings = []
+    for event in events:
+        if event["type"] != "timing" or not event["kind"]:
+            continue
+        key = (event["day"], event["variant"], event["name"])
+        timings.append({"day": event["day"], "variant": event["variant"], "part": event["name"],
+                        **{field: value for field, value in event.items()
+                           if field not in ("type", "day", "variant", "name", "kind", "top_allocations")},
+                        **({"answer": answers[key]} if key in answers else {})})
+    return {
+        "timings": timings,
+        "benchmarks": [{field: value for field, value in event.items() if field != "type"}
+                       for event in events if event["type"] == "benchmark"],
+    }
+
+
+def budgeted_day(day_num: int, connection, memory_limit: int | None, memoize: bool, force: bool, worker_modes: tuple) -> None:
+    """
+    Run a day (in the child process of run_day_in_child) with its address space limited to memory_limit MB,
+    sending every event to the runner as soon as it is emitted. Exits with OOM_EXIT_CODE if it runs out of memory.
+    """
+    init_worker(*worker_modes)
+    if memory_limit is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit * 1024 * 1024,) * 2)
+    event_utils.BUFFER_SIZE = 1  # Whatever the day gets done is with the runner by the time it might be killed
+    event_utils.set_writers([event_utils.ConnectionWriter(connection)])
+    try:
+        run_day(day_num, memoize, force)
+    except MemoryError:
+        sys.exit(OOM_EXIT_CODE)
+
+
+def run_day_in_child(day_num: int, time_limit: float | None, memory_limit: int | None, memoize: bool = False,
+                     force: bool = False, worker_modes: tuple = (None, False, None)) -> None:
+    """
+    Run a day (see run_day) in a child process, killed after time_limit seconds and limited to memory_limit MB
+    of address space (either may be None).
+
+    Events arrive as they are emitted, so if the day times out, runs out of memory or crashes, the answers and
+    timings of everything it finished are still written and recorded. A "budget" event tells where and why it
+    stopped, and the step it stopped in is recorded with a "status" (TIMEOUT, OOM or CRASHED) and the time spent
+    in it so far. The run then goes on with the next day.
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=budgeted_day, args=(day_num, sender, memory_limit, memoize, force, worker_modes))
+    start_time = last_event_time = time.perf_counter()
+    deadline = start_time + time_limit if time_limit is not None else None
+    event_utils.flush()  # A forked child must not inherit (and write out again) buffered events or file buffers
+    process.start()
+    sender.close()  # Only the child holds the sending end now, so recv() fails once it is gone
+
+    events = []
+    timed_out = False
+    try:
+        while True:
+            if not receiver.poll(None if deadline is None else max(deadline - time.perf_counter(), 0)):
+                timed_out = True
+                break
+            try:
+                event = receiver.recv()
+            except EOFError:
+                break
+            last_event_time = time.perf_counter()
+            events.append(event)
+            event_utils.replay([event])
+    finally:
+        stop_time = time.perf_counter()
+        process.kill()
+        process.join()
+        receiver.close()
+
+    store_records(records_from_events(events))
+    if timed_out:
+        status, reason = "TIMEOUT", f"time limit {time_limit:g}s"
+    elif process.exitcode == OOM_EXIT_CODE:
+        status, reason = "OOM", f"memory limit {memory_limit}MB"
+    elif process.exitcode != 0:
+        status, reason = "CRASHED", f"exit code {process.exitcode}"
+    else:
         return
-    
-    print(f"\n{'='*60}")
-    print(f"Day {day_num}")
-    print('='*60)
-    
-    for solution_file in ["solution.py", "solution_ai.py"]:
-        file_path = day_path / solution_file
-        if not file_path.exists():
+
+    variants = [event["variant"] for event in events if event["type"] == "variant"]
+    variant = variants[-1] if variants else None
+    done = {event["name"] for event in events if event["type"] == "timing" and event.get("variant") == variant}
+    part = next((step for step in SOLUTION_STEPS if step not in done), None) if variant else None
+    if part is not None:
+        timing_records.append({"day": day_num, "variant": variant, "part": part, "status": status,
+                               "ms": (stop_time - last_event_time) * 1000})
+    event_utils.emit("budget", day=day_num, variant=variant, part=part, status=status, reason=reason,
+                     ms=(stop_time - start_time) * 1000)
+    event_utils.flush()
+
+
+def capture_solution(day_num: int, solution_file: str, memoize: bool = False, force: bool = False) -> dict:
+    """
+    Run a single solution file (in a worker process).
+
+    Returns:
+        Dict with its events ("events"), its part timings ("timings"), benchmark results ("benchmarks")
+        and trace spans ("spans")
+    """
+    file_path = registry.ROOT / f"Day{day_num:02d}" / solution_file
+
+    with event_utils.capture() as events, span(f"Day {day_num}", kind="day"), \
+            event_utils.context(day=day_num, variant=solution_file):
+        event_utils.emit("variant", variant=solution_file)
+        records = timer(name=solution_file, kind=None)(run_and_collect)(day_num, file_path, memoize, force)
+
+    return {
+        "events": events,
+        **records,
+        "spans": timer_utils.drain_spans(),
+    }
+
+
+def init_worker(benchmark_options: dict | None, tracing: bool, top_allocations: int | None = None, gc_stats: bool = False,
+                gc_mode: str | None = None) -> None:
+    """Carry the parent's benchmark/tracing/resource/GC modes over to worker processes (needed where workers are spawned, not forked)."""
+    if benchmark_options is not None:
+        timer_utils.enable_benchmark(**benchmark_options)
+    timer_utils.enable_tracing(tracing)
+    if top_allocations is not None:
+        timer_utils.enable_resource_accounting(top_n=top_allocations)
+    timer_utils.enable_gc_stats(gc_stats)
+    timer_utils.enable_gc_control(gc_mode)
+
+
+@timer(name="Solutions from all days", kind=None)
+def run_all_days(no_of_days: int, memoize: bool = False, force: bool = False, time_limit: float | None = None,
+                 memory_limit: int | None = None, worker_modes: tuple = (None, False, None)) -> None:
+    """Execute solutions for all days up to no_of_days (each in a child process under its budget if a limit is given)."""
+    with span("run", kind="run"):
+        for day in range(1, no_of_days + 1):
+            if time_limit is None and memory_limit is None:
+                run_day(day, memoize, force)
+            elif registry.solution_files(day):
+                run_day_in_child(day, time_limit, memory_limit, memoize, force, worker_modes)
+
+
+@timer(name="Solutions from all days", kind=None)
+def run_all_days_parallel(no_of_days: int, jobs: int, worker_modes: tuple = (None, False, None), memoize: bool = False,
+                          force: bool = False) -> None:
+    """Execute solutions for all days up to no_of_days, one (day, solution) per worker process (see init_worker for worker_modes)."""
+    tasks = [(day, file_path.name)
+             for day in range(1, no_of_days + 1)
+             for file_path in registry.solution_files(day)]
+
+    # Worker spans have no parent in this process; each worker shows up as its own track in the trace
+    with span("run", kind="run"), \
+            ProcessPoolExecutor(max_workers=jobs, initializer=init_worker, initargs=worker_modes) as pool:
+        futures = [(day, pool.submit(capture_solution, day, solution_file, memoize, force))
+                   for day, solution_file in tasks]
+
+        # Results are written in submission order, so the output stays in day order
+        # no matter which worker finishes first
+        current_day = None
+        for day, future in futures:
+            if day != current_day:
+                event_utils.emit("day", day=day)
+                current_day = day
+            result = future.result()
+            event_utils.replay(result["events"])
+            event_utils.flush()
+            store_records(result)
+            trace_spans.extend(result["spans"])
+
+
+def compare_variants(days: list[int], runs: int) -> bool:
+    """
+    Run every solution variant of each day `runs` times on the same input, check they agree, and print speedups.
+
+    Returns:
+        True if all variants produced identical answers for every part
+    """
+    all_agree = True
+
+    for day in days:
+        variants = registry.discover([day])
+        if not variants:
             continue
-        
-        print(f"\n{solution_file}:")
-        
-        # Execute the solution file in its own namespace
-        with open(file_path, 'r') as f:
-            code = compile(f.read(), file_path, 'exec')
-        exec(code, {'__name__': '__main__', '__file__': str(file_path)})
 
-        # # Alternatively, using exec directly (less safer and lower performance/security):
-        # exec(open(file_path).read(), {'__name__': '__main__', '__file__': str(file_path)})        
+        results = {}
+        for solution in variants:
+            parts = results.setdefault(solution.variant, {})
+            for _ in range(runs):
+                with event_utils.capture() as events:
+                    run_solution(solution)
+                answers = event_utils.answers(events)
+                for timing in timer_utils.drain_timings():
+                    part = parts.setdefault(timing["name"], {"times": [], "answers": []})
+                    part["times"].append(timing["ms"])
+                    part["answers"].append(str(answers.get(timing["name"], "")))
+
+        all_agree &= bench_utils.print_comparison(day, results)
+
+    return all_agree
+
+
+def scaling_curve(days: list[int], scales: list[float], seed: int, runs: int) -> None:
+    """
+    Time every variant of each day on synthetic inputs of increasing size and print the fitted complexity per part.
+
+    Input size n is the size of the generated input in bytes; each (variant, size) is run `runs` times.
+    """
+    for day in days:
+        variants = registry.discover([day])
+        if day not in synthetic_inputs.GENERATORS or not variants:
+            continue
+
+        results = {solution.variant: {} for solution in variants}
+        for scale in sorted(scales):
+            input_dir = synthetic_inputs.write_synthetic_inputs([day], scale, seed)
+            input_size = (input_dir / f"Day{day:02d}" / "input.txt").stat().st_size
+            os.environ["AOC_INPUT_DIR"] = str(input_dir.resolve())
+
+            for solution in variants:
+                with event_utils.muted():
+                    for _ in range(runs):
+                        run_solution(solution)
+
+                times = {}
+                for timing in timer_utils.drain_timings():
+                    times.setdefault(timing["name"], []).append(timing["ms"])
+                for part, part_times in times.items():
+                    results[solution.variant].setdefault(part, []).append((scale, input_size, part_times))
+
+        for variant, variant_results in results.items():
+            bench_utils.print_scaling_report(day, variant, variant_results)
+
+    os.environ.pop("AOC_INPUT_DIR", None)
+
+
+def startup_benchmark(days: list[int], runs: int) -> None:
+    """
+    Run every solution `runs` times as a fresh `python -X importtime` process and split its wall time
+    into imports (beyond those of a bare interpreter), solving (its parts) and everything else.
+    """
+    baseline = subprocess.run([sys.executable, "-X", "importtime", "-c", "pass"], capture_output=True, text=True)
+    interpreter_imports = set(bench_utils.parse_importtime(baseline.stderr))
+
+    rows = []
+    for day in days:
+        for file_path in registry.solution_files(day):
+            samples = []
+            for _ in range(runs):
+                start_time = time.perf_counter()
+                process = subprocess.run([sys.executable, "-X", "importtime", str(file_path)],
+                                         capture_output=True, text=True, check=True)
+                wall_ms = (time.perf_counter() - start_time) * 1000
+                imports = {module: ms for module, ms in bench_utils.parse_importtime(process.stderr).items()
+                           if module not in interpreter_imports}
+                samples.append((wall_ms, imports, bench_utils.parse_part_times(process.stdout)))
 
-@timer(name="Solutions from all days")
-def run_all_days(no_of_days: int) -> None:
-    """Execute solutions for all days up to no_of_days."""
-    for day in range(1, no_of_days + 1):
-        run_day(day)
+            rows.append({
+                "day": day,
+                "variant": file_path.name,
+                "wall_ms": statistics.median(wall for wall, _, _ in samples),
+                "import_ms": statistics.median(sum(imports.values()) for _, imports, _ in samples),
+                "solve_ms": statistics.median(solve for _, _, solve in samples),
+                "imports": {module: statistics.median(imports.get(module, 0.0) for _, imports, _ in samples)
+                            for module in samples[-1][1]},
+            })
+
+    bench_utils.print_startup_report(rows)
+
+
+def parse_profile_target(value: str) -> tuple[int, str | None]:
+    """Parse DAY[:PART] for --profile, e.g. "12" (both parts) or "10:2" / "10:Part Two" (just that part)."""
+    day, _, part = value.partition(":")
+    part_labels = {"1": "Part One", "2": "Part Two"}
+    return int(day), part_labels.get(part, part) or None
+
+
+def profile_day(day_num: int, part: str | None, top: int = 20) -> None:
+    """
+    Profile the parts (or only one part) of every variant of a day, save .pstats and collapsed stacks and print the hot spots.
+
+    Only the @timer parts are profiled, so imports and input loading at module level don't drown out the solving.
+    """
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+
+    for solution in registry.discover([day_num]):
+        file_path = solution.path
+        profiler = cProfile.Profile()
+        timer_utils.enable_profiling(profiler, part)
+        with event_utils.capture() as events:  # Answers are written after profiling, not from inside the profiled parts
+            run_solution(solution)
+        timer_utils.enable_profiling(None)
+        event_utils.replay(events)
+
+        stats = pstats.Stats(profiler)
+        if not stats.stats:
+            print(f"\n{file_path.name}: nothing profiled (no part labelled {part!r})")
+            continue
+
+        name = f"Day{day_num:02d}_{file_path.stem}" + (f"_{part.replace(' ', '_')}" if part else "")
+        stats.dump_stats(PROFILE_DIR / f"{name}.pstats")
+        profile_utils.write_collapsed(stats, PROFILE_DIR / f"{name}.collapsed")
+
+        print(f"\n{'='*60}\nProfile of Day {day_num} {file_path.name}{f' ({part})' if part else ''}\n{'='*60}")
+        profile_utils.print_profile_report(stats, top)
+        print(f"\nSaved {PROFILE_DIR / name}.pstats and .collapsed (render with flamegraph.pl, inferno or speedscope)")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run all Advent of Code 2025 solutions.")
+    parser.add_argument("--days", type=int, default=12, help="Number of days to run (default: 12)")
+    parser.add_argument("--day", type=int, action="append",
+                        help="Only this day (repeatable); used by --compare, --scaling and --scale")
+    parser.add_argument("--compare", action="store_true",
+                        help="Run every solution*.py variant --runs times, print a speedup table and exit non-zero "
+                             "if the variants disagree on any answer")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per variant in --compare/--scaling/--startup mode (default: 5)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Number of worker processes; each (day, solution file) runs in its own worker (default: 1, serial)")
+    parser.add_argument("--time-limit", type=float, metavar="SECONDS",
+                        help="Run each day in a child process and kill it after SECONDS of wall-clock time, recording it "
+                             "as TIMEOUT with the timings it finished, then go on with the next day")
+    parser.add_argument("--memory-limit", type=int, metavar="MB",
+                        help="Run each day in a child process with its address space limited to MB, recording it as OOM "
+                             "with the timings it finished if it runs out of memory, then go on with the next day")
+    parser.add_argument("--force", action="store_true",
+                        help=f"Recompute every solution instead of replaying results cached in {RESULT_CACHE_DIR} "
+                             "for unchanged solutions and inputs")
+    parser.add_argument("--events", metavar="PATH",
+                        help=f"Also write every event of the run (answers, timings, progress, ...) to PATH as JSON lines, "
+                             f"next to the text in {OUTPUT_FILE}")
+    parser.add_argument("--terminal", action="store_true",
+                        help=f"Also show the output on the terminal (on stderr) as each solution finishes, not only in {OUTPUT_FILE}")
+    parser.add_argument("--prefetch", action="store_true",
+                        help="Fetch all missing inputs in parallel before running anything")
+    parser.add_argument("--stream", action="store_true",
+                        help="Let solutions that support it (both Day 1 and Day 3 variants, Day 7 solution_ai.py) "
+                             "stream their input from disk instead of loading it")
+    parser.add_argument("--no-parse-cache", action="store_true",
+                        help="Always re-parse inputs instead of reusing parsed inputs cached by @cached_parser")
+    parser.add_argument("--bench", action="store_true",
+                        help="Benchmark each part with warmup and adaptive repeats instead of timing it once")
+    parser.add_argument("--bench-warmup", type=int, default=3, help="Warmup calls per part in --bench mode (default: 3)")
+    parser.add_argument("--bench-rel-ci", type=float, default=0.02,
+                        help="Stop repeating once the 95%% CI is within this fraction of the mean (default: 0.02)")
+    parser.add_argument("--bench-max-time", type=float, default=5.0,
+                        help="Maximum seconds spent repeating each part in --bench mode (default: 5)")
+    parser.add_argument("--bench-json", metavar="PATH", help="Also write the --bench results to PATH as JSON")
+    parser.add_argument("--scale", type=float,
+                        help="Run on synthetic inputs of this size relative to the real ones (e.g. 10, 100, 1000)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for --scale/--scaling synthetic inputs and --fuzz (default: 0)")
+    parser.add_argument("--scaling", action="store_true",
+                        help="Time each part on synthetic inputs of every size in --scales and fit its complexity")
+    parser.add_argument("--scales", type=lambda value: [float(scale) for scale in value.split(",")],
+                        default=[0.125, 0.25, 0.5, 1],
+                        help="Comma-separated input sizes for --scaling, relative to the real ones (default: 0.125,0.25,0.5,1)")
+    parser.add_argument("--no-history", action="store_true",
+                        help=f"Don't append this run's per-part timings to {bench_utils.HISTORY_FILE}")
+    parser.add_argument("--check-regressions", action="store_true",
+                        help="Don't run anything; compare the latest run in the history against its rolling baseline "
+                             "and exit non-zero if any part regressed")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Percentage slowdown that counts as a regression (default: 10)")
+    parser.add_argument("--baseline-runs", type=int, default=5,
+                        help="Number of earlier runs forming the rolling baseline (default: 5)")
+    parser.add_argument("--resources", action="store_true",
+                        help="Also report CPU time, peak RSS growth, tracemalloc peak and top allocation sites per part "
+                             "(slows allocation-heavy parts down)")
+    parser.add_argument("--top-allocs", type=int, default=5,
+                        help="Allocation sites listed per part with --resources (default: 5)")
+    parser.add_argument("--gc", action="store_true",
+                        help="Also report the cyclic garbage collections per generation and the GC pause time of each part")
+    parser.add_argument("--gc-mode", choices=timer_utils.GC_MODES,
+                        help="Run each part with the cyclic GC disabled, or with everything allocated before it frozen "
+                             "(implies --gc); compare against a normal run to see how much of its time is GC")
+    parser.add_argument("--parse-bench", action="store_true",
+                        help="Benchmark each day's parsing against the aoc_utils parsers on synthetic inputs "
+                             "(of size --scale, default 100)")
+    parser.add_argument("--fuzz", metavar="CASES", type=int,
+                        help="Run every variant (and a brute-force oracle) on CASES random small inputs per day, shrink any "
+                             f"disagreement to a minimal input saved in {fuzz_utils.FUZZ_DIR} and exit non-zero if there was one")
+    parser.add_argument("--startup", action="store_true",
+                        help="Run each solution --runs times in a fresh interpreter and report import time vs solve time")
+    parser.add_argument("--profile", metavar="DAY[:PART]", type=parse_profile_target,
+                        help="Profile the parts of every variant of DAY (only PART, e.g. 1, 2 or 'Part Two', if given) with cProfile "
+                             f"and write .pstats and collapsed stacks to {PROFILE_DIR}")
+    parser.add_argument("--profile-top", type=int, default=20,
+                        help="Functions listed per --profile report (default: 20)")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="Record run/day/variant/part/phase spans and write them to PATH as Chrome trace JSON")
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    no_of_days = 12  # Adjust this as needed
-    
-    with open('AOC_2025_Output.txt', 'w') as f:
-        with redirect_stdout(f):
-            run_all_days(no_of_days)
\ No newline at end of file
+    args = parse_args()
+
+    if args.check_regressions:
+        comparisons = bench_utils.find_regressions(bench_utils.load_history(), args.threshold, args.baseline_runs)
+        bench_utils.print_regression_report(comparisons, args.threshold)
+        sys.exit(1 if any(c["regressed"] for c in comparisons) else 0)
+
+    days = args.day or list(range(1, args.days + 1))
+    budgeted = args.time_limit is not None or args.memory_limit is not None
+
+    if budgeted and args.jobs > 1:
+        sys.exit("--time-limit/--memory-limit run the days one at a time; drop --jobs")
+    if args.memory_limit is not None and resource is None:
+        sys.exit("--memory-limit needs the resource module (Unix only)")
+
+    if args.no_parse_cache:
+        os.environ["AOC_PARSE_CACHE"] = "0"  # Inherited by worker processes
+    if args.stream:
+        os.environ["AOC_STREAM_INPUT"] = "1"
+
+    if args.prefetch:
+        for day, status in aoc_utils.prefetch_inputs([day for day in days if Path(f"Day{day:02d}").is_dir()]).items():
+            print(f"Day {day}: {status}")
+
+    if args.fuzz:  # Generates its inputs in memory as well
+        sys.exit(0 if fuzz_utils.fuzz_days(days, args.fuzz, args.seed) else 1)
+
+    if args.parse_bench:  # Generates its inputs in memory; no need to write them
+        bench_utils.print_parser_report(bench_utils.benchmark_parsers(args.scale or 100, args.seed, max_time=2.0))
+        sys.exit(0)
+
+    if args.scale is not None:
+        # Solutions (and worker processes) pick the synthetic inputs up through get_input()
+        input_dir = synthetic_inputs.write_synthetic_inputs(days, args.scale, args.seed)
+        os.environ["AOC_INPUT_DIR"] = str(input_dir.resolve())
+
+    if args.scaling:
+        scaling_curve(days, args.scales, args.seed, args.runs)
+        sys.exit(0)
+
+    if args.startup:
+        startup_benchmark(days, args.runs)
+        sys.exit(0)
+
+    if args.profile:
+        profile_day(*args.profile, args.profile_top)
+        sys.exit(0)
+
+    if args.compare:
+        sys.exit(0 if compare_variants(days, args.runs) else 1)
+    no_of_days = args.days  # Adjust this as needed (or pass --days)
+
+    benchmark_options = None
+    if args.bench or args.bench_json:
+        benchmark_options = {"warmup": args.bench_warmup, "rel_ci": args.bench_rel_ci, "max_time": args.bench_max_time}
+        timer_utils.enable_benchmark(**benchmark_options)
+    timer_utils.enable_tracing(bool(args.trace))
+    top_allocations = args.top_allocs if args.resources else None
+    if top_allocations is not None:
+        timer_utils.enable_resource_accounting(top_n=top_allocations)
+    gc_stats = args.gc or args.gc_mode is not None
+    timer_utils.enable_gc_stats(gc_stats)
+    timer_utils.enable_gc_control(args.gc_mode)
+    worker_modes = (benchmark_options, bool(args.trace), top_allocations, gc_stats, args.gc_mode)
+    # Benchmarks, resource and GC accounting and traces are about measuring, and --stream/--no-parse-cache change
+    # how the solutions load their input, so all of them always run the solutions
+    memoize = (benchmark_options is None and top_allocations is None and not gc_stats and not args.trace
+               and not args.stream and not args.no_parse_cache)
+
+    with open(OUTPUT_FILE, 'w') as f, open(args.events, 'w') if args.events else nullcontext() as events_file:
+        writers = [event_utils.TextWriter(f)]
+        if events_file is not None:
+            writers.append(event_utils.JsonlWriter(events_file))
+        if args.terminal:
+            writers.append(event_utils.TerminalWriter())
+        event_utils.set_writers(writers)
+        try:
+            if args.jobs > 1:
+                run_all_days_parallel(no_of_days, args.jobs, worker_modes, memoize, args.force)
+            else:
+                run_all_days(no_of_days, memoize, args.force, args.time_limit, args.memory_limit, worker_modes)
+        finally:
+            event_utils.set_writers([])  # Flushes what is still buffered
+
+    if not args.no_history:
+        bench_utils.append_history(history_records())
+    if args.bench_json:
+        bench_utils.write_json(benchmark_records, args.bench_json)
+    if args.trace:
+        timer_utils.export_chrome_trace(args.trace, timer_utils.drain_spans() + trace_spans)
@@ -0,0 +1,291 @@
+"""
+Synthetic, format-valid puzzle inputs for every day, at configurable scale and seed.
+
+Scale 1 roughly matches the size of the real puzzle inputs; scale 10/100/1000 multiplies the
+quantity that drives each day's runtime (number of lines, points, regions, grid area, ...).
+"""
+import argparse
+import hashlib
+import math
+import os
+import random
+import string
+import sys
+from pathlib import Path
+
+SYNTHETIC_DIR = Path(".aoc_cache") / "synthetic"
+
+
+# Day 1: ~4500 dial rotations like "L68" / "R48"
+def gen_day01(rng: random.Random, scale: float) -> str:
+    n = max(1, round(4500 * scale))
+    return "\n".join(f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(n))
+
+
+# Day 2: ~35 comma-separated ID ranges like "998-1012" with up to 10-digit bounds
+def gen_day02(rng: random.Random, scale: float) -> str:
+    n = max(1, round(35 * scale))
+    ranges = []
+    for _ in range(n):
+        digits = rng.randint(1, 10)
+        start = rng.randint(10 ** (digits - 1), 10 ** digits - 1)
+        end = start + rng.randint(0, min(10 ** digits, 500_000))
+        ranges.append(f"{start}-{end}")
+    return ",".join(ranges)
+
+
+# Day 3: ~200 banks of 100 battery digits (1-9)
+def gen_day03(rng: random.Random, scale: float) -> str:
+    n = max(1, round(200 * scale))
+    return "\n".join("".join(rng.choices("123456789", k=100)) for _ in range(n))
+
+
+# Day 4: ~137x137 grid of paper rolls ('@') and empty floor ('.')
+def gen_day04(rng: random.Random, scale: float) -> str:
+    side = max(3, round(137 * math.sqrt(scale)))
+    return "\n".join("".join("@" if rng.random() < 0.65 else "." for _ in range(side)) for _ in range(side))
+
+
+# Day 5: ~180 fresh ID ranges, a blank line, then ~1000 available IDs
+def gen_day05(rng: random.Random, scale: float) -> str:
+    n_ranges = max(1, round(180 * scale))
+    n_ids = max(1, round(1000 * scale))
+    limit = 10 ** 15
+    ranges = []
+    for _ in range(n_ranges):
+        start = rng.randint(1, limit)
+        ranges.append(f"{start}-{start + rng.randint(0, limit // 500)}")
+    ids = [str(rng.randint(1, limit)) for _ in range(n_ids)]
+    return "\n".join(ranges) + "\n\n" + "\n".join(ids)
+
+
+# Day 6: worksheet of ~1000 problems, 4 rows of aligned operands plus an operator row
+def gen_day06(rng: random.Random, scale: float) -> str:
+    n_problems = max(1, round(1000 * scale))
+    n_operands = 4
+    rows = [[] for _ in range(n_operands + 1)]
+
+    for _ in range(n_problems):
+        numbers = [str(rng.randint(1, 10 ** rng.randint(1, 4) - 1)) for _ in range(n_operands)]
+        # Lengths grow or shrink monotonically down a problem, so no digit column has a gap (as in the real input)
+        numbers.sort(key=len, reverse=rng.random() < 0.5)
+        width = max(len(number) for number in numbers)
+        align_left = rng.random() < 0.5  # All numbers of a problem share one alignment
+        for row, number in zip(rows, numbers):
+            row.append(number.ljust(width) if align_left else number.rjust(width))
+        rows[-1].append(rng.choice("+*").ljust(width))
+
+    return "\n".join(" ".join(row) for row in rows)
+
+
+# Day 7: ~142x141 tachyon manifold; splitters ('^') on every other row, fanning out below 'S'
+def gen_day07(rng: random.Random, scale: float) -> str:
+    height = max(2, round(142 * math.sqrt(scale)))
+    width = max(3, round(141 * math.sqrt(scale)))
+    start = width // 2
+    lines = ["." * start + "S" + "." * (width - start - 1)]
+
+    for row_idx in range(1, height):
+        row = ["."] * width
+        level = row_idx // 2
+        if row_idx % 2 == 0:
+            # Splitters sit two columns apart, never adjacent and never on the grid edge
+            for col in range(start - level + 1, start + level, 2):
+                if 1 <= col < width - 1 and rng.random() < 0.8:
+                    row[col] = "^"
+        lines.append("".join(row))
+
+    return "\n".join(lines)
+
+
+# Day 8: ~1000 junction boxes as "X,Y,Z" points, in tight clusters of ~40 far apart from each other
+def gen_day08(rng: random.Random, scale: float) -> str:
+    # Part One connects the 1000 closest pairs and multiplies the three largest circuits. Those pairs all
+    # stay inside clusters, so there are always at least three circuits, even for small scales.
+    n = max(120, round(1000 * scale))
+    n_clusters = max(3, n // 40)
+    side = math.ceil(n_clusters ** (1 / 3))
+    cells = rng.sample([(x, y, z) for x in range(side) for y in range(side) for z in range(side)], n_clusters)
+
+    points = []
+    for idx in range(n):
+        cx, cy, cz = cells[idx % n_clusters]
+        points.append(tuple(10_000 * c + rng.randint(0, 3_000) for c in (cx, cy, cz)))
+    rng.shuffle(points)
+    return "\n".join(f"{x},{y},{z}" for x, y, z in points)
+
+
+# Day 9: rectilinear polygon of ~500 red tiles; every edge has its own row/column
+def gen_day09(rng: random.Random, scale: float) -> str:
+    m = max(2, round(124 * scale))  # Steps per chain; the polygon has 4 * m vertices
+    span = 100_000 * max(1, math.ceil(scale))
+
+    # A "top" and a "bottom" staircase share only their two end columns, so the polygon is simple
+    xs = sorted(rng.sample(range(span), 2 * m))
+    interior = xs[1:-1]
+    rng.shuffle(interior)
+    top_xs = [xs[0], *sorted(interior[:m - 1]), xs[-1]]
+    bottom_xs = [xs[0], *sorted(interior[m - 1:]), xs[-1]]
+    top_ys = rng.sample(range(span // 2 + 1, span), m)
+    bottom_ys = rng.sample(range(0, span // 2), m)
+
+    vertices = []
+    for i in range(m):
+        vertices += [(top_xs[i], top_ys[i]), (top_xs[i + 1], top_ys[i])]
+    for i in range(m - 1, -1, -1):
+        vertices += [(bottom_xs[i + 1], bottom_ys[i]), (bottom_xs[i], bottom_ys[i])]
+
+    return "\n".join(f"{x},{y}" for x, y in vertices)
+
+
+# Day 10: ~170 machines like "[.##.] (3) (1,3) (2) {3,5,4,7}" that are solvable for both parts
+def gen_day10(rng: random.Random, scale: float) -> str:
+    n = max(1, round(170 * scale))
+    machines = []
+
+    for _ in range(n):
+        n_lights = rng.randint(4, 10)
+        # At most two buttons more than lights keeps the Part Two search over free variables small
+        n_buttons = rng.randint(max(3, n_lights - 2), n_lights + 2)
+        buttons = [sorted(rng.sample(range(n_lights), rng.randint(1, n_lights - 1))) for _ in range(n_buttons)]
+
+        # Derive targets from random presses, so a solution always exists
+        lights = [0] * n_lights
+        for button in rng.sample(buttons, rng.randint(1, n_buttons)):
+            for light in button:
+                lights[light] ^= 1
+        joltages = [0] * n_lights
+        for button in buttons:
+            presses = rng.randint(0, 20)
+            for light in button:
+                joltages[light] += presses
+
+        diagram = "".join("#" if light else "." for light in lights)
+        wiring = " ".join("(" + ",".join(map(str, button)) + ")" for button in buttons)
+        machines.append(f"[{diagram}] {wiring} {{{','.join(map(str, joltages))}}}")
+
+    return "\n".join(machines)
+
+
+# Day 11: layered device DAG of ~600 devices from 'svr' to 'out', passing 'you', 'fft' and 'dac'
+def gen_day11(rng: random.Random, scale: float) -> str:
+    n_layers = 24  # Fixed depth keeps recursion shallow; larger scales widen the layers instead
+    width = max(2, round(600 * scale / n_layers))
+    reserved = {"svr", "you", "fft", "dac", "out"}
+    name_len = max(3, math.ceil(math.log(n_layers * width * 2, 26)))
+
+    names = set()
+    while len(names) < n_layers * width:
+        name = "".join(rng.choices(string.ascii_lowercase, k=name_len))
+        if name not in reserved:
+            names.add(name)
+    names = sorted(names)
+    rng.shuffle(names)
+    layers = [names[i * width:(i + 1) * width] for i in range(n_layers)]
+
+    layers[0][0] = "svr"
+    layers[n_layers // 3][0] = "fft"
+    layers[2 * n_layers // 3][0] = "dac"
+    layers[n_layers - 7][0] = "you"  # Near the end, so the number of 'you' -> 'out' paths stays modest
+
+    lines = []
+    for layer_idx, layer in enumerate(layers):
+        for device in layer:
+            if layer_idx == n_layers - 1:
+                outputs = ["out"]
+            else:
+                next_layer = layers[layer_idx + 1]
+                outputs = rng.sample(next_layer, min(len(next_layer), rng.randint(1, 3)))
+            lines.append(f"{device}: {' '.join(outputs)}")
+
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
+# Day 12: six 3x3 present shapes, then ~1000 regions like "41x38: 25 27 28 21 29 29"
+def gen_day12(rng: random.Random, scale: float) -> str:
+    n_regions = max(1, round(1000 * scale))
+    cells_per_shape = 7  # Every shape has the same number of cells, like the real input
+    sections = []
+
+    for idx in range(6):
+        cells = set(rng.sample(range(9), cells_per_shape))
+        cells |= {0}  # Keep the shape anchored in the top-left corner
+        while len(cells) > cells_per_shape:
+            cells.discard(max(cells - {0}))
+        grid = "\n".join("".join("#" if r * 3 + c in cells else "." for c in range(3)) for r in range(3))
+        sections.append(f"{idx}:\n{grid}")
+
+    regions = []
+    for _ in range(n_regions):
+        width, height = rng.randint(35, 50), rng.randint(35, 50)
+        # Roughly half the regions are comfortably packable, the rest have more cells than the region
+        fill = rng.uniform(0.45, 0.6) if rng.random() < 0.5 else rng.uniform(1.02, 1.2)
+        pieces = max(1, round(width * height * fill / cells_per_shape))
+        quantities = [0] * 6
+        for _ in range(pieces):
+            quantities[rng.randrange(6)] += 1
+        regions.append(f"{width}x{height}: {' '.join(map(str, quantities))}")
+
+    return "\n\n".join(sections) + "\n\n" + "\n".join(regions)
+
+
+GENERATORS = {
+    1: gen_day01, 2: gen_day02, 3: gen_day03, 4: gen_day04, 5: gen_day05, 6: gen_day06,
+    7: gen_day07, 8: gen_day08, 9: gen_day09, 10: gen_day10, 11: gen_day11, 12: gen_day12,
+}
+
+
+def generate_input(day: int, scale: float = 1, seed: int = 0) -> str:
+    """
+    Generate a synthetic input for a day; the same (day, scale, seed) always gives the same input.
+
+    Like the cached inputs the solutions are written against, there is no trailing newline
+    (Day 1 splits on '\\n' and Day 2 on ',').
+    """
+    rng = random.Random(f"{day}-{scale}-{seed}")
+    return GENERATORS[day](rng, scale)
+
+
+def generator_hash() -> str:
+    """SHA-256 (hex) of this module's source, so inputs written by an older version of a generator are regenerated."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def write_synthetic_inputs(days: list[int], scale: float = 1, seed: int = 0) -> Path:
+    """
+    Write synthetic inputs as <root>/DayXX/input.txt and return <root>.
+
+    Each input is stored with the generator_hash() it was generated with (in DayXX/generator.sha256) and only
+    reused while that still matches. Point AOC_INPUT_DIR at the returned directory to make get_input() read
+    them instead of the real inputs.
+    """
+    root = SYNTHETIC_DIR / f"x{scale:g}-seed{seed}"
+    digest = generator_hash()
+    for day in days:
+        input_file = root / f"Day{day:02d}" / "input.txt"
+        hash_file = input_file.with_name("generator.sha256")
+        if input_file.is_file() and hash_file.is_file() and hash_file.read_text() == digest:
+            continue
+        input_file.parent.mkdir(parents=True, exist_ok=True)
+        # The hash is written last, so an interrupted write is regenerated next time
+        for path, text in ((input_file, generate_input(day, scale, seed)), (hash_file, digest)):
+            tmp_file = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_text(text)
+            os.replace(tmp_file, path)
+    return root
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic Advent of Code 2025 input.")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("--scale", type=float, default=1, help="Size relative to a real input (default: 1)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", "-o", help="Write to this file instead of stdout")
+    args = parser.parse_args()
+
+    data = generate_input(args.day, args.scale, args.seed)
+    if args.output:
+        Path(args.output).write_text(data)
+    else:
+        sys.stdout.write(data)
@@ -1,33 +1,393 @@
+import gc
+import itertools
+import os
+import sys
 import time
+from contextlib import contextmanager, nullcontext
 from functools import wraps
 from typing import Callable, Any
 
-def timer(name: str | None = None) -> Callable:
-    """Decorator to time the execution of a function."""
+import event_utils
+
+try:
+    import resource  # Unix only; peak RSS is simply not reported elsewhere
+except ImportError:
+    resource = None
+
+# Every solution imports this module, so modules only needed by optional modes (json, threading, tracemalloc)
+# are imported where those modes are used, keeping them out of the startup of a plain run
+
+# inspect.CO_GENERATOR: tells generator functions apart for @traced without importing inspect
+_CO_GENERATOR = 0x20
+
+# Options passed to bench_utils.benchmark() when benchmark mode is enabled (None = normal single-shot timing)
+_benchmark_options = None
+
+# Single-shot timings ({"name": label, "ms": ...}) recorded by @timer since the last drain_timings()
+_timings = []
+
+# Span tracing state: finished spans, the stack of currently open spans, and a process-wide id counter
+_tracing = False
+_spans = []
+_span_stack = []
+_span_ids = itertools.count(1)
+
+# When set ({"top_n": N}), @timer also reports CPU time, peak RSS growth, tracemalloc peak and the top N allocation sites
+_resource_options = None
+
+# When set, @timer runs the part labelled _profile_part (every part if None) under this cProfile.Profile
+_profiler = None
+_profile_part = None
+
+# When set, @timer also reports the cyclic GC collections per generation and their total pause time in each part
+_gc_stats = False
+
+# How @timer parts run the cyclic GC: normally (None), disabled ("disable") or with older objects frozen ("freeze")
+GC_MODES = ("disable", "freeze")
+_gc_mode = None
+
+def enable_benchmark(**options) -> None:
+    """Make time_both_parts benchmark each part (see bench_utils.benchmark for options) instead of timing it once."""
+    global _benchmark_options
+    _benchmark_options = options
+
+def enable_tracing(enabled: bool = True) -> None:
+    """Start (or stop) recording spans for export with export_chrome_trace()."""
+    global _tracing
+    _tracing = enabled
+
+def enable_resource_accounting(enabled: bool = True, top_n: int = 5) -> None:
+    """
+    Make @timer report CPU time, peak RSS growth, tracemalloc peak and the top_n allocating lines of each part.
+
+    Off by default: tracemalloc slows allocation-heavy code down considerably, so wall times measured
+    with accounting enabled are not comparable to normal runs.
+    """
+    global _resource_options
+    _resource_options = {"top_n": top_n} if enabled else None
+
+def enable_profiling(profiler=None, part: str | None = None) -> None:
+    """Profile the @timer part labelled `part` (e.g. "Part One"; every part if None) with a cProfile.Profile; None disables."""
+    global _profiler, _profile_part
+    _profiler, _profile_part = profiler, part
+
+def enable_gc_stats(enabled: bool = True) -> None:
+    """Make @timer report how many cyclic garbage collections of each generation ran in each part, and how long they took."""
+    global _gc_stats
+    _gc_stats = enabled
+
+def enable_gc_control(mode: str | None = None) -> None:
+    """
+    Run every @timer part with the cyclic garbage collector disabled ("disable"), or with everything allocated
+    before the part frozen so that its collections only traverse the part's own objects ("freeze"); None restores
+    normal collection. Comparing against a normal run shows how much of a part's time goes to GC.
+    """
+    global _gc_mode
+    if mode is not None and mode not in GC_MODES:
+        raise ValueError(f"Unknown GC mode {mode!r} (expected one of {', '.join(GC_MODES)})")
+    _gc_mode = mode
+
+@contextmanager
+def gc_control(mode: str | None = None):
+    """Context manager running the enclosed block with the cyclic GC in the given mode (see enable_gc_control)."""
+    if mode == "disable":
+        was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            yield
+        finally:
+            if was_enabled:
+                gc.enable()
+    elif mode == "freeze":
+        gc.freeze()
+        try:
+            yield
+        finally:
+            gc.unfreeze()
+    else:
+        yield
+
+class GcStats:
+    """Context manager counting the cyclic garbage collections per generation in the enclosed block and their total pause time."""
+
+    def __init__(self):
+        self.collections = [0] * len(gc.get_count())
+        self.collected = 0
+        self.pause_ms = 0.0
+        self._collection_start = None
+
+    def __enter__(self):
+        gc.callbacks.append(self._callback)
+        return self
+
+    def __exit__(self, *exc_info):
+        gc.callbacks.remove(self._callback)
+        return False
+
+    def _callback(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._collection_start = time.perf_counter()
+        elif self._collection_start is not None:  # A collection already running when the block started isn't counted
+            self.pause_ms += (time.perf_counter() - self._collection_start) * 1000
+            self.collections[info["generation"]] += 1
+            self.collected += info["collected"]
+            self._collection_start = None
+
+    def to_dict(self) -> dict:
+        return {"gc_collections": self.collections, "gc_collected": self.collected, "gc_pause_ms": self.pause_ms}
+
+def _max_rss_bytes() -> int:
+    if resource is None:
+        return 0
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024  # Linux reports kilobytes
+
+class ResourceUsage:
+    """
+    Context manager measuring CPU time, peak RSS growth and peak traced memory of the enclosed block.
+
+    A background thread snapshots the traced allocations whenever they reach a new high, so the
+    reported allocation sites are those live at the peak (e.g. a pair list built and dropped within
+    a part), not just whatever survives until the end of the block.
+    """
+    SAMPLE_INTERVAL = 0.005  # Seconds between checks for a new tracemalloc peak
+
+    def __init__(self, top_n: int = 5):
+        import threading
+        self.top_n = top_n
+        self.cpu_ms = 0.0
+        self.rss_growth_bytes = 0
+        self.traced_peak_bytes = 0
+        self.top_allocations = []
+        self._peak_snapshot = None
+        self._peak_size = 0
+        self._stop = threading.Event()
+
+    def __enter__(self):
+        import threading
+        import tracemalloc
+        self._started_tracemalloc = not tracemalloc.is_tracing()
+        if self._started_tracemalloc:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._baseline_size = tracemalloc.get_traced_memory()[0]
+        self._baseline = tracemalloc.take_snapshot()
+        self._sampler = threading.Thread(target=self._sample, daemon=True)
+        self._sampler.start()
+        self._rss_start = _max_rss_bytes()
+        self._cpu_start = time.process_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        import threading
+        import tracemalloc
+        self.cpu_ms = (time.process_time() - self._cpu_start) * 1000
+        self.rss_growth_bytes = _max_rss_bytes() - self._rss_start
+        self._stop.set()
+        self._sampler.join()
+        current, peak = tracemalloc.get_traced_memory()
+        self.traced_peak_bytes = peak - self._baseline_size
+
+        # Whichever of the sampled peak and the final state held more memory shows the top allocation sites
+        snapshot = self._peak_snapshot if self._peak_size > current else tracemalloc.take_snapshot()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        # Leave out the bookkeeping of this class, its sampler thread and buffered events
+        ignored = [tracemalloc.Filter(False, pattern)
+                   for pattern in (tracemalloc.__file__, threading.__file__, "*/_weakrefset.py", __file__, event_utils.__file__)]
+        stats = snapshot.filter_traces(ignored).compare_to(self._baseline.filter_traces(ignored), "lineno")
+        self.top_allocations = [stat for stat in stats if stat.size_diff > 0][:self.top_n]
+        return False
+
+    def _sample(self) -> None:
+        import tracemalloc
+        while not self._stop.wait(self.SAMPLE_INTERVAL):
+            current = tracemalloc.get_traced_memory()[0]
+            if current > self._peak_size * 1.1:  # Re-snapshot only on a clearly higher peak; snapshots aren't free
+                self._peak_snapshot = tracemalloc.take_snapshot()
+                self._peak_size = current
+
+    def to_dict(self) -> dict:
+        return {"cpu_ms": self.cpu_ms, "rss_growth_bytes": self.rss_growth_bytes, "traced_peak_bytes": self.traced_peak_bytes}
+
+    def allocation_sites(self) -> list[dict]:
+        """The top allocating lines, for the timing event of the part."""
+        return [{"size_bytes": stat.size_diff, "file": stat.traceback[0].filename, "line": stat.traceback[0].lineno,
+                 "blocks": stat.count_diff} for stat in self.top_allocations]
+
+
+@contextmanager
+def span(name: str, kind: str = "phase", **attrs):
+    """
+    Context manager recording a named span nested under the currently open span (if any).
+
+    Kinds used in this repo: run -> day -> variant -> prepare/part -> phase. Does nothing unless tracing is enabled.
+    """
+    if not _tracing:
+        yield
+        return
+
+    import threading
+    span_id = f"{os.getpid()}-{next(_span_ids)}"
+    parent_id = _span_stack[-1] if _span_stack else None
+    _span_stack.append(span_id)
+    start_ns = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        end_ns = time.perf_counter_ns()
+        _span_stack.pop()
+        _spans.append({
+            "id": span_id,
+            "parent": parent_id,
+            "name": name,
+            "kind": kind,
+            "start_ns": start_ns,
+            "end_ns": end_ns,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "attrs": attrs,
+        })
+
+def traced(name: str | None = None, kind: str = "phase") -> Callable:
+    """
+    Decorator recording each call of a function as a span.
+
+    For generator functions, every resumption is recorded, so lazily parsed input is
+    attributed to the parsing phase rather than to whoever consumes it.
+    """
+    def decorator(func: Callable) -> Callable:
+        label = name or func.__name__
+
+        if getattr(func, "__code__", None) and func.__code__.co_flags & _CO_GENERATOR:
+            @wraps(func)
+            def gen_wrapper(*args, **kwargs):
+                if not _tracing:
+                    return (yield from func(*args, **kwargs))
+                generator = func(*args, **kwargs)
+                while True:
+                    with span(label, kind):
+                        try:
+                            item = next(generator)
+                        except StopIteration as stop:
+                            return stop.value
+                    yield item
+            return gen_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            if not _tracing:
+                return func(*args, **kwargs)
+            with span(label, kind):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def phase(name: str | None = None) -> Callable:
+    """Decorator marking a helper (parsing, preprocessing, ...) as a phase of the part that calls it."""
+    return traced(name, kind="phase")
+
+def drain_timings() -> list[dict]:
+    """Return and clear all timings recorded by @timer so far in this process."""
+    timings = _timings.copy()
+    _timings.clear()
+    return timings
+
+def drain_spans() -> list[dict]:
+    """Return and clear all spans recorded so far in this process."""
+    spans = _spans.copy()
+    _spans.clear()
+    return spans
+
+def export_chrome_trace(path: str, spans: list[dict]) -> None:
+    """Write spans as Chrome trace-event JSON (opens in Perfetto or chrome://tracing)."""
+    events = [{
+        "name": s["name"],
+        "cat": s["kind"],
+        "ph": "X",
+        "ts": s["start_ns"] / 1000,  # Trace timestamps are in microseconds
+        "dur": (s["end_ns"] - s["start_ns"]) / 1000,
+        "pid": s["pid"],
+        "tid": s["tid"],
+        "args": {"id": s["id"], "parent": s["parent"], **s["attrs"]},
+    } for s in spans]
+
+    import json
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+def timer(name: str | None = None, kind: str | None = "part") -> Callable:
+    """
+    Decorator to time the execution of a function, reported as a "timing" event.
+
+    Unless kind is None, the timing is also kept for drain_timings() and recorded as a span of that kind when tracing.
+    """
     def decorator(func: Callable) -> Callable:
         label = name or func.__name__
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            start_time = time.perf_counter()
-            result = func(*args, **kwargs)
-            end_time = time.perf_counter()
+            usage = ResourceUsage(**_resource_options) if _resource_options is not None and kind else None
+            gc_stats = GcStats() if _gc_stats and kind else None
+            profiler = _profiler if _profiler is not None and kind and _profile_part in (None, label) else None
+            with usage or nullcontext(), gc_control(_gc_mode if kind else None), gc_stats or nullcontext(), \
+                    profiler or nullcontext():
+                if _tracing and kind:
+                    with span(label, kind):
+                        start_time = time.perf_counter()
+                        result = func(*args, **kwargs)
+                        end_time = time.perf_counter()
+                else:
+                    start_time = time.perf_counter()
+                    result = func(*args, **kwargs)
+                    end_time = time.perf_counter()
             execution_time = (end_time - start_time) * 1000  # Convert to milliseconds
-            print(f"Time taken to execute {label}: {execution_time:.3f}ms\n")
+            measured = {}
+            if usage is not None:
+                measured.update(usage.to_dict())
+            if gc_stats is not None:
+                measured.update(gc_stats.to_dict())
+            if _gc_mode is not None and kind:
+                measured["gc_mode"] = _gc_mode
+            resources = {**measured, "top_allocations": usage.allocation_sites()} if usage is not None else measured
+            event_utils.emit("timing", name=label, ms=execution_time, kind=kind, **resources)
+            if kind:
+                _timings.append({"name": label, "ms": execution_time, **measured})
             return result
+        wrapper.label = label
         return wrapper
     return decorator
 
-def time_both_parts(part_one_func: Callable, part_two_func: Callable, *args, **kwargs) -> None:
-    """Time both parts of an AOC solution."""
+def time_both_parts(part_one_func: Callable, part_two_func: Callable, *args, prepare: Callable | None = None,
+                    **kwargs) -> None:
+    """
+    Time both parts of an AOC solution.
+
+    If prepare is given, it is called once with the arguments (timed as "Prepare") and its result is passed
+    to both parts instead: a tuple as their positional arguments, anything else as their only argument.
+    Parts must not modify what prepare returns, since the other part gets the same objects.
+    """
+    prepare_func = None
+    if prepare is not None:
+        prepare_func = prepare if hasattr(prepare, "label") else timer(name="Prepare", kind="prepare")(prepare)
+
+    if _benchmark_options is not None:
+        from bench_utils import benchmark_parts
+        if prepare_func is not None:
+            prepared = prepare_func(*args, **kwargs)
+            benchmark_parts([prepare_func], args, kwargs, single_shot=False, gc_mode=_gc_mode, **_benchmark_options)
+            args, kwargs = prepared if isinstance(prepared, tuple) else (prepared,), {}
+        benchmark_parts([part_one_func, part_two_func], args, kwargs, gc_mode=_gc_mode, **_benchmark_options)
+        return
+
     total_start = time.perf_counter()
-    
+
+    if prepare_func is not None:
+        prepared = prepare_func(*args, **kwargs)
+        args, kwargs = prepared if isinstance(prepared, tuple) else (prepared,), {}
     timer(part_one_func(*args, **kwargs))
     timer(part_two_func(*args, **kwargs))
-    
+
     total_end = time.perf_counter()
     total_time = (total_end - total_start) * 1000
-    
-    print("="*50)
-    print(f"Total execution time: {total_time:.3f}ms")
-    print("="*50)
-    
\ No newline at end of file
+
+    event_utils.emit("total", ms=total_time)